@@ -0,0 +1,195 @@
+"""
+===================================================================================
+Alert Engine (가격 알림)
+===================================================================================
+목적: "USD/KRW 1,400 이상", "BTC/USD 전일 대비 3% 이상 변동" 같은 알림 규칙을
+      시세가 들어올 때마다 검사해서 조건을 넘은 순간 알려줍니다.
+
+[규칙 색인]
+규칙이 수백 개여도 시세마다 전부 훑지 않도록, 티커별로 기준가를 정렬해 둡니다.
+    - 이전 가격 -> 새 가격 사이에 있는 기준가만 bisect로 잘라서 확인
+    - 상승 중에는 위로 넘는 규칙(above, move 상단)만,
+      하락 중에는 아래로 넘는 규칙(below, move 하단)만 발동
+    - move(%) 규칙은 전일 종가 기준으로 상단/하단 기준가 두 개로 바꿔서 넣고,
+      전일 종가가 바뀌면(다음 거래일) 그 티커의 색인만 다시 만듦
+
+규칙 형식 (widget_config.json의 "alerts" 목록):
+    {"ticker": "KRW=X", "label": "USD/KRW", "type": "above", "value": 1400}
+    {"ticker": "BTC-USD", "label": "BTC/USD", "type": "move", "value": 3, "cooldown": 1800}
+===================================================================================
+"""
+
+import time
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from quote_core import change_percent
+
+
+RULE_TYPES = ("above", "below", "move")
+DEFAULT_COOLDOWN = 600  # 같은 규칙을 다시 알리기까지 최소 간격 (초)
+
+# 발동한 알림 (rule: AlertRule, quote: 발동시킨 Quote, message: 표시할 문구)
+Alert = namedtuple("Alert", "rule quote message")
+
+
+class AlertRule:
+    """
+    알림 규칙 하나
+
+    Args:
+        ticker (str): 야후 티커 (예: "KRW=X")
+        rule_type (str): "above"(이상), "below"(이하), "move"(전일 대비 ±% 이상)
+        value (float): 기준 가격 또는 변동률(%)
+        label (str): 알림 문구에 쓸 이름 (기본값: 티커)
+        cooldown (float): 재알림 최소 간격 (초)
+    """
+
+    def __init__(self, ticker, rule_type, value, label=None, cooldown=DEFAULT_COOLDOWN):
+        if rule_type not in RULE_TYPES:
+            raise ValueError(f"unknown alert type: {rule_type}")
+        self.ticker = ticker
+        self.type = rule_type
+        self.value = float(value)
+        self.label = label or ticker
+        self.cooldown = cooldown
+        self.last_fired = None  # 마지막 발동 시각 (저장하지 않음)
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["ticker"], data["type"], data["value"],
+                   data.get("label"), data.get("cooldown", DEFAULT_COOLDOWN))
+
+    def to_dict(self):
+        return {"ticker": self.ticker, "label": self.label, "type": self.type,
+                "value": self.value, "cooldown": self.cooldown}
+
+    def thresholds(self, prev_close):
+        """
+        규칙을 (기준가, 방향) 목록으로 바꿉니다. 방향은 +1(위로 넘음) / -1(아래로 넘음)
+
+        move 규칙은 전일 종가가 없으면 기준가를 만들 수 없으므로 빈 목록입니다.
+        """
+        if self.type == "above":
+            return [(self.value, 1)]
+        if self.type == "below":
+            return [(self.value, -1)]
+        if not prev_close:
+            return []
+        ratio = self.value / 100
+        return [(prev_close * (1 + ratio), 1), (prev_close * (1 - ratio), -1)]
+
+    def message(self, quote):
+        if self.type == "above":
+            return f"{self.label} {self.value:,.2f} 이상 (현재 {quote.price:,.2f})"
+        if self.type == "below":
+            return f"{self.label} {self.value:,.2f} 이하 (현재 {quote.price:,.2f})"
+        return f"{self.label} 전일 대비 {change_percent(quote):+.2f}% (현재 {quote.price:,.2f})"
+
+    def __repr__(self):
+        return f"AlertRule({self.label} {self.type} {self.value})"
+
+
+class _TickerIndex:
+    """한 티커의 기준가 정렬 목록 (levels[i]의 규칙과 방향은 entries[i])"""
+
+    def __init__(self, rules, prev_close):
+        pairs = sorted(((level, direction, rule)
+                        for rule in rules
+                        for level, direction in rule.thresholds(prev_close)),
+                       key=lambda item: item[0])
+        self.prev_close = prev_close
+        self.levels = [level for level, _, _ in pairs]
+        self.entries = [(direction, rule) for _, direction, rule in pairs]
+
+    def crossed(self, old, new):
+        """old -> new 이동에서 넘은 규칙들 (넘은 순서대로)"""
+        if new > old:
+            # old < 기준가 <= new 이고 위로 넘는 규칙
+            lo, hi = bisect_right(self.levels, old), bisect_right(self.levels, new)
+            return [rule for direction, rule in self.entries[lo:hi] if direction > 0]
+        if new < old:
+            # new <= 기준가 < old 이고 아래로 넘는 규칙 (가까운 기준가부터)
+            lo, hi = bisect_left(self.levels, new), bisect_left(self.levels, old)
+            return [rule for direction, rule in reversed(self.entries[lo:hi]) if direction < 0]
+        return []
+
+
+class AlertEngine(QObject):
+    """
+    QuoteEngine.quote_updated에 연결해서 쓰는 알림 엔진
+
+    첫 시세는 기준점으로만 쓰고 알리지 않습니다 (시작하자마자 알림이 쏟아지지 않도록).
+    캐시에서 온 stale 시세도 기준점으로만 씁니다.
+
+    시그널 (Signals):
+        - alert_triggered: 규칙 발동 (Alert)
+    """
+
+    alert_triggered = pyqtSignal(object)
+
+    def __init__(self, rules=(), parent=None):
+        super().__init__(parent)
+        self._rules = {}        # 티커 -> [AlertRule]
+        self._index = {}        # 티커 -> _TickerIndex
+        self._last_price = {}   # 티커 -> 직전 가격
+        for rule in rules:
+            self.add_rule(rule)
+
+    @staticmethod
+    def parse_config(items):
+        """설정 파일의 "alerts" 목록 -> [AlertRule]. 잘못된 항목은 건너뜁니다."""
+        rules = []
+        for item in items or []:
+            try:
+                rules.append(AlertRule.from_dict(item))
+            except (KeyError, TypeError, ValueError) as e:
+                print(f"Alert Rule Skipped: {item} ({e})")
+        return rules
+
+    @classmethod
+    def from_config(cls, items, parent=None):
+        """설정 파일의 "alerts" 목록으로 엔진을 만듭니다."""
+        return cls(cls.parse_config(items), parent)
+
+    def to_config(self):
+        return [rule.to_dict() for rules in self._rules.values() for rule in rules]
+
+    def rules(self, ticker=None):
+        if ticker is not None:
+            return list(self._rules.get(ticker, ()))
+        return [rule for rules in self._rules.values() for rule in rules]
+
+    def add_rule(self, rule):
+        self._rules.setdefault(rule.ticker, []).append(rule)
+        self._index.pop(rule.ticker, None)  # 다음 시세 때 다시 만듦
+
+    def remove_rules(self, ticker):
+        self._rules.pop(ticker, None)
+        self._index.pop(ticker, None)
+
+    def set_rules(self, rules):
+        """규칙 전체를 바꿉니다 (설정 파일을 밖에서 고친 경우). 직전 가격은 유지합니다."""
+        self._rules.clear()
+        self._index.clear()
+        for rule in rules:
+            self.add_rule(rule)
+
+    def on_quote(self, quote):
+        old = self._last_price.get(quote.ticker)
+        self._last_price[quote.ticker] = quote.price
+        if old is None or quote.stale or quote.ticker not in self._rules:
+            return
+
+        index = self._index.get(quote.ticker)
+        if index is None or index.prev_close != quote.prev_close:
+            index = self._index[quote.ticker] = _TickerIndex(self._rules[quote.ticker], quote.prev_close)
+
+        now = time.time()
+        for rule in index.crossed(old, quote.price):
+            if rule.last_fired is not None and now - rule.last_fired < rule.cooldown:
+                continue
+            rule.last_fired = now
+            self.alert_triggered.emit(Alert(rule, quote, rule.message(quote)))
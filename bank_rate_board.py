@@ -1,37 +1,348 @@
+"""
+===================================================================================
+Bank Rate Board (은행 환율 고시판)
+===================================================================================
+목적: 100개가 넘는 통화의 원화 환율을 은행 고시판처럼 한 표에 보여 줍니다.
+
+구조 (Qt 모델/뷰):
+    공용 시세 공급원 --quote_updated--> RateTableModel --dataChanged(바뀐 행만)-->
+        RateFilterProxy (정렬/검색, 데이터 복사 없음) --> QTableView (보이는 행만 그림)
+
+    - 통화마다 라벨/아이콘 위젯을 만들지 않습니다. 표시할 글자/색/아이콘은
+      뷰가 그 행을 그릴 때 data()로 물어봅니다.
+    - 시세가 들어오면 값이 바뀐 행만 dataChanged를 보냅니다.
+    - 행 높이를 고정해 두어 뷰가 행마다 크기를 계산하지 않습니다.
+===================================================================================
+"""
+
 import sys
-import qtawesome as qta
-from PyQt5.QtWidgets import QApplication, QWidget, QLabel, QHBoxLayout
-from PyQt5.QtCore import QSize
+import time
+
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel, QSize
+from PyQt5.QtGui import QColor
+from PyQt5.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
+                             QTableView, QHeaderView, QAbstractItemView)
+
+from icon_cache import shared_icons
+from quote_core import change_percent
+from quote_hub import shared_quote_source
+
+
+# (통화 코드, 이름, 고시 단위) - 엔/루피아/동은 은행 관례대로 100단위로 표시
+CURRENCIES = (
+    ("USD", "미국 달러", 1), ("EUR", "유로", 1), ("JPY", "일본 엔", 100), ("CNY", "중국 위안", 1),
+    ("HKD", "홍콩 달러", 1), ("TWD", "대만 달러", 1), ("GBP", "영국 파운드", 1), ("CHF", "스위스 프랑", 1),
+    ("CAD", "캐나다 달러", 1), ("AUD", "호주 달러", 1), ("NZD", "뉴질랜드 달러", 1), ("SGD", "싱가포르 달러", 1),
+    ("THB", "태국 바트", 1), ("MYR", "말레이시아 링깃", 1), ("IDR", "인도네시아 루피아", 100),
+    ("PHP", "필리핀 페소", 1), ("VND", "베트남 동", 100), ("INR", "인도 루피", 1), ("PKR", "파키스탄 루피", 1),
+    ("BDT", "방글라데시 타카", 1), ("LKR", "스리랑카 루피", 1), ("NPR", "네팔 루피", 1), ("MNT", "몽골 투그릭", 1),
+    ("KZT", "카자흐스탄 텡게", 1), ("UZS", "우즈베키스탄 숨", 1), ("MMK", "미얀마 짯", 1), ("KHR", "캄보디아 리엘", 1),
+    ("LAK", "라오스 킵", 1), ("BND", "브루나이 달러", 1), ("MOP", "마카오 파타카", 1), ("MVR", "몰디브 루피야", 1),
+    ("AFN", "아프가니스탄 아프가니", 1), ("SEK", "스웨덴 크로나", 1), ("NOK", "노르웨이 크로네", 1),
+    ("DKK", "덴마크 크로네", 1), ("PLN", "폴란드 즐로티", 1), ("CZK", "체코 코루나", 1), ("HUF", "헝가리 포린트", 1),
+    ("RON", "루마니아 레우", 1), ("BGN", "불가리아 레프", 1), ("ISK", "아이슬란드 크로나", 1),
+    ("TRY", "튀르키예 리라", 1), ("RUB", "러시아 루블", 1), ("UAH", "우크라이나 흐리우냐", 1),
+    ("RSD", "세르비아 디나르", 1), ("GEL", "조지아 라리", 1), ("AMD", "아르메니아 드람", 1),
+    ("AZN", "아제르바이잔 마나트", 1), ("BYN", "벨라루스 루블", 1), ("MDL", "몰도바 레우", 1),
+    ("ALL", "알바니아 레크", 1), ("MKD", "북마케도니아 데나르", 1), ("BAM", "보스니아 마르카", 1),
+    ("SAR", "사우디 리얄", 1), ("AED", "아랍에미리트 디르함", 1), ("QAR", "카타르 리얄", 1),
+    ("KWD", "쿠웨이트 디나르", 1), ("BHD", "바레인 디나르", 1), ("OMR", "오만 리알", 1), ("JOD", "요르단 디나르", 1),
+    ("ILS", "이스라엘 셰켈", 1), ("EGP", "이집트 파운드", 1), ("IRR", "이란 리알", 1), ("IQD", "이라크 디나르", 1),
+    ("LBP", "레바논 파운드", 1), ("MAD", "모로코 디르함", 1), ("TND", "튀니지 디나르", 1), ("DZD", "알제리 디나르", 1),
+    ("LYD", "리비아 디나르", 1), ("ZAR", "남아공 랜드", 1), ("NGN", "나이지리아 나이라", 1), ("KES", "케냐 실링", 1),
+    ("GHS", "가나 세디", 1), ("ETB", "에티오피아 비르", 1), ("TZS", "탄자니아 실링", 1), ("UGX", "우간다 실링", 1),
+    ("XOF", "서아프리카 CFA 프랑", 1), ("XAF", "중앙아프리카 CFA 프랑", 1), ("MUR", "모리셔스 루피", 1),
+    ("BWP", "보츠와나 풀라", 1), ("ZMW", "잠비아 콰차", 1), ("MZN", "모잠비크 메티칼", 1), ("AOA", "앙골라 콴자", 1),
+    ("NAD", "나미비아 달러", 1), ("SCR", "세이셸 루피", 1), ("MXN", "멕시코 페소", 1), ("BRL", "브라질 헤알", 1),
+    ("ARS", "아르헨티나 페소", 1), ("CLP", "칠레 페소", 1), ("COP", "콜롬비아 페소", 1), ("PEN", "페루 솔", 1),
+    ("UYU", "우루과이 페소", 1), ("PYG", "파라과이 과라니", 1), ("BOB", "볼리비아 볼리비아노", 1),
+    ("VES", "베네수엘라 볼리바르", 1), ("CRC", "코스타리카 콜론", 1), ("GTQ", "과테말라 케찰", 1),
+    ("HNL", "온두라스 렘피라", 1), ("NIO", "니카라과 코르도바", 1), ("PAB", "파나마 발보아", 1),
+    ("DOP", "도미니카 페소", 1), ("JMD", "자메이카 달러", 1), ("TTD", "트리니다드토바고 달러", 1),
+    ("BSD", "바하마 달러", 1), ("BBD", "바베이도스 달러", 1), ("XCD", "동카리브 달러", 1), ("HTG", "아이티 구르드", 1),
+    ("FJD", "피지 달러", 1), ("PGK", "파푸아뉴기니 키나", 1), ("XPF", "CFP 프랑", 1), ("WST", "사모아 탈라", 1),
+    ("TOP", "통가 팡가", 1),
+)
+
+CASH_SPREAD = 0.0175   # 현찰 살 때/팔 때 환전 수수료율 (은행/통화마다 다름, 대략적인 값)
+
+SORT_ROLE = Qt.UserRole   # 정렬용 원본 값 (글자가 아닌 숫자로 정렬)
+ICON_HEIGHT = 16          # 통화 열 국기 높이 (논리 픽셀)
+
+UP_COLOR = QColor("#FF5555")
+DOWN_COLOR = QColor("#5555FF")
+STALE_COLOR = QColor("#888888")
+
+STYLE_SHEET = """
+BankRateBoard { background-color: #1E1E1E; }
+QLabel { color: #AAAAAA; }
+QLineEdit { background-color: #262626; color: white; border: 1px solid #3A3A3A; padding: 4px; }
+QTableView { background-color: #1E1E1E; alternate-background-color: #242424; color: white;
+             gridline-color: #2E2E2E; selection-background-color: #3A3A3A; border: none; }
+QHeaderView::section { background-color: #262626; color: #AAAAAA; border: none; padding: 4px; }
+"""
+
+
+def yahoo_ticker(code):
+    """원화 환율 티커 (USD만 야후 표기가 다름)"""
+    return "KRW=X" if code == "USD" else f"{code}KRW=X"
+
+
+# ==========================================
+# 1. 환율 표 모델 (Rate Table Model)
+#    - 통화 목록과 통화별 최신 시세만 가지고, 화면 표시는 data()에서 그때그때 만듭니다.
+#    - 값이 바뀐 행만 dataChanged를 보냅니다.
+# ==========================================
+class RateTableModel(QAbstractTableModel):
+    COL_CODE, COL_NAME, COL_RATE, COL_CHANGE, COL_PERCENT, COL_BUY, COL_SELL, COL_TIME = range(8)
+    HEADERS = ("통화", "이름", "매매기준율", "전일대비", "등락률", "현찰 살 때", "현찰 팔 때", "시각")
+    NUMERIC = (COL_RATE, COL_CHANGE, COL_PERCENT, COL_BUY, COL_SELL)
+    ARROWS = {1: "▲", -1: "▼", 0: ""}
+
+    def __init__(self, currencies=CURRENCIES, parent=None):
+        super().__init__(parent)
+        self.currencies = list(currencies)
+        self.tickers = [yahoo_ticker(code) for code, _, _ in self.currencies]
+        self.rows = {ticker: row for row, ticker in enumerate(self.tickers)}   # 티커 -> 행
+        self.quotes = [None] * len(self.currencies)                            # 행 -> Quote
+
+        # 국기는 공용 아이콘 캐시에서 (같은 국기 원본을 쓰는 통화들은 픽스맵 하나를 공유)
+        self.icons = shared_icons()
+        self.icons.ready.connect(self.on_icon_ready)
+        self.icons.preload((code for code, _, _ in self.currencies), ICON_HEIGHT)
+
+    # --- 시세 반영 ---
+    def on_quote(self, quote):
+        """
+        시세를 반영하고, 표시할 값이 바뀌었으면 그 행만 dataChanged를 보냅니다.
+        가격은 그대로이고 시각만 바뀌었으면 시각 칸만 알립니다 (조용한 통화도 시각은 계속 갱신).
+
+        Returns:
+            bool: 행이 바뀌었으면 True
+        """
+        row = self.rows.get(quote.ticker)
+        if row is None:
+            return False
+        old = self.quotes[row]
+        self.quotes[row] = quote
+        if old is not None and (old.price, old.change, old.stale) == (quote.price, quote.change, quote.stale):
+            if old.timestamp == quote.timestamp:
+                return False
+            time_cell = self.index(row, self.COL_TIME)
+            self.dataChanged.emit(time_cell, time_cell, [Qt.DisplayRole, SORT_ROLE])
+            return True
+        self.dataChanged.emit(self.index(row, self.COL_RATE), self.index(row, self.COL_TIME),
+                              [Qt.DisplayRole, Qt.ForegroundRole, Qt.ToolTipRole, SORT_ROLE])
+        return True
+
+    # --- QAbstractTableModel ---
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.currencies)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal:
+            if role == Qt.DisplayRole:
+                return self.HEADERS[section]
+            if role == Qt.TextAlignmentRole and section in self.NUMERIC:
+                return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+        code, name, unit = self.currencies[row]
+        quote = self.quotes[row]
+
+        if role == Qt.DisplayRole:
+            if column == self.COL_CODE:
+                return f"{code} {unit}" if unit != 1 else code
+            if column == self.COL_NAME:
+                return name
+            if quote is None:
+                return "-" if column != self.COL_TIME else ""
+            return self._display(column, quote, unit)
+
+        if role == SORT_ROLE:
+            if column == self.COL_CODE:
+                return code
+            if column == self.COL_NAME:
+                return name
+            if quote is None:
+                return float("-inf")   # 아직 시세가 없는 행은 맨 뒤(오름차순이면 맨 앞)
+            return self._value(column, quote, unit)
 
-class FlagApp(QWidget):
-    def __init__(self):
+        if role == Qt.TextAlignmentRole and column in self.NUMERIC:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+
+        if role == Qt.ForegroundRole and quote is not None:
+            if quote.stale:
+                return STALE_COLOR
+            if column in (self.COL_CHANGE, self.COL_PERCENT) and quote.change:
+                return UP_COLOR if quote.change > 0 else DOWN_COLOR
+
+        if role == Qt.DecorationRole and column == self.COL_CODE:
+            return self.icon(code)
+
+        if role == Qt.ToolTipRole and quote is not None and quote.stale:
+            return "마지막으로 받은 값 (새 시세를 기다리는 중)"
+        return None
+
+    def _value(self, column, quote, unit):
+        if column == self.COL_RATE:
+            return quote.price * unit
+        if column == self.COL_CHANGE:
+            return quote.change * unit
+        if column == self.COL_PERCENT:
+            return change_percent(quote)
+        if column == self.COL_BUY:
+            return quote.price * unit * (1 + CASH_SPREAD)
+        if column == self.COL_SELL:
+            return quote.price * unit * (1 - CASH_SPREAD)
+        return quote.timestamp
+
+    def _display(self, column, quote, unit):
+        value = self._value(column, quote, unit)
+        if column == self.COL_CHANGE:
+            direction = (value > 0) - (value < 0)
+            return f"{self.ARROWS[direction]} {abs(value):,.2f}"
+        if column == self.COL_PERCENT:
+            return f"{value:+.2f}%"
+        if column == self.COL_TIME:
+            return time.strftime("%H:%M:%S", time.localtime(value))
+        return f"{value:,.2f}"
+
+    def icon(self, code):
+        """국기 픽스맵 (아직 준비 중이면 None -> 준비되면 on_icon_ready가 다시 그리게 함)"""
+        return self.icons.flag(code, ICON_HEIGHT)
+
+    def on_icon_ready(self, source):
+        # 통화 열 전체를 한 번에 알림 (뷰는 보이는 행만 다시 그림)
+        if self.currencies:
+            self.dataChanged.emit(self.index(0, self.COL_CODE), self.index(len(self.currencies) - 1, self.COL_CODE),
+                                  [Qt.DecorationRole])
+
+
+# ==========================================
+# 2. 정렬 / 검색 프록시 (Rate Filter Proxy)
+#    - 원본 모델의 행을 복사하지 않고 순서와 보이는 행만 바꿉니다.
+#    - 검색어는 통화 코드와 이름에서만 찾습니다 (숫자 열은 보지 않음).
+# ==========================================
+class RateFilterProxy(QSortFilterProxyModel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.query = ""
+        self.setSortRole(SORT_ROLE)
+        self.setDynamicSortFilter(True)   # 정렬 중인 열의 값이 바뀌면 그 행만 자리를 옮김
+
+    def set_query(self, text):
+        self.query = text.strip().casefold()
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if not self.query:
+            return True
+        code, name, _ = self.sourceModel().currencies[source_row]
+        return self.query in code.casefold() or self.query in name.casefold()
+
+
+# ==========================================
+# 3. 고시판 창 (Bank Rate Board)
+#    - 검색창 + 표 하나. 보이는 동안만 통화 전체를 구독합니다.
+# ==========================================
+class BankRateBoard(QWidget):
+    ROW_HEIGHT = 26
+
+    def __init__(self, currencies=CURRENCIES):
         super().__init__()
+        self.model = RateTableModel(currencies, self)
+        self.proxy = RateFilterProxy(self)
+        self.proxy.setSourceModel(self.model)
+        self.subscribed = False
         self.initUI()
 
+        # 공용 시세 엔진 연결 (통화가 몇 개든 조회 루프는 하나)
+        self.engine = shared_quote_source()
+        self.engine.quote_updated.connect(self.model.on_quote)
+
     def initUI(self):
-        layout = QHBoxLayout()
+        self.setAttribute(Qt.WA_StyledBackground)
+        self.setStyleSheet(STYLE_SHEET)
+        self.setWindowTitle("환율 고시판")
+        self.resize(820, 640)
 
-        # 1. qtawesome으로 미국 국기 아이콘 가져오기
-        # 'fa5s'는 FontAwesome 5 Solid 스타일을 의미합니다.
-        icon = qta.icon('fa5s.flag-usa', color='#002868') # 미국 국기색 느낌의 남색
-        
-        icon_label = QLabel()
-        # 아이콘 크기를 설정 (30x30)
-        icon_label.setPixmap(icon.pixmap(QSize(30, 30)))
+        layout = QVBoxLayout()
+        layout.setContentsMargins(10, 10, 10, 10)
+        self.setLayout(layout)
 
-        # 2. 텍스트 레이블
-        text_label = QLabel("USA", self)
-        text_label.setStyleSheet("font-size: 20px; font-weight: bold;")
+        top = QHBoxLayout()
+        self.search = QLineEdit()
+        self.search.setPlaceholderText("통화 코드 또는 이름 검색 (예: EUR, 달러)")
+        self.search.setClearButtonEnabled(True)
+        self.search.textChanged.connect(self.on_search)
+        top.addWidget(self.search)
+        self.lbl_count = QLabel()
+        top.addWidget(self.lbl_count)
+        layout.addLayout(top)
 
-        # 레이아웃에 추가
-        layout.addWidget(icon_label)
-        layout.addWidget(text_label)
+        view = self.view = QTableView()
+        view.setModel(self.proxy)
+        view.setSortingEnabled(True)
+        view.sortByColumn(RateTableModel.COL_CODE, Qt.AscendingOrder)
+        view.setAlternatingRowColors(True)
+        view.setSelectionBehavior(QAbstractItemView.SelectRows)
+        view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        view.setWordWrap(False)
+        view.setIconSize(QSize(ICON_HEIGHT * 2, ICON_HEIGHT))   # 국기는 가로로 긴 그림
+        view.setShowGrid(False)
+
+        # 고정 행 높이 / 고정 열 너비: 크기를 정하려고 행을 훑지 않음 (ResizeToContents 금지)
+        rows = view.verticalHeader()
+        rows.setSectionResizeMode(QHeaderView.Fixed)
+        rows.setDefaultSectionSize(self.ROW_HEIGHT)
+        rows.hide()
+        columns = view.horizontalHeader()
+        columns.setSectionResizeMode(QHeaderView.Interactive)
+        columns.setStretchLastSection(True)
+        for column, width in enumerate((80, 150, 100, 90, 70, 100, 100, 70)):
+            view.setColumnWidth(column, width)
+        layout.addWidget(view)
+
+        self.update_count()
+
+    def on_search(self, text):
+        self.proxy.set_query(text)
+        self.update_count()
+
+    def update_count(self):
+        self.lbl_count.setText(f"{self.proxy.rowCount()} / {self.model.rowCount()}개 통화")
+
+    # 보이는 동안만 구독 (닫았다가 다시 열 수 있음)
+    def showEvent(self, event):
+        if not self.subscribed:
+            self.subscribed = True
+            for ticker in self.model.tickers:
+                self.engine.subscribe(ticker)
+        super().showEvent(event)
+
+    def closeEvent(self, event):
+        # 구독만 해제 (엔진은 다른 위젯과 공유하므로 멈추지 않음)
+        if self.subscribed:
+            self.subscribed = False
+            for ticker in self.model.tickers:
+                self.engine.unsubscribe(ticker)
+        event.accept()
 
-        self.setLayout(layout)
-        self.setWindowTitle('Icon Test')
-        self.show()
 
 if __name__ == '__main__':
     app = QApplication(sys.argv)
-    ex = FlagApp()
-    sys.exit(app.exec_())
\ No newline at end of file
+    board = BankRateBoard()
+    board.show()
+    exit_code = app.exec_()
+
+    shared_quote_source().stop()
+    shared_quote_source().wait(1.0)
+    sys.exit(exit_code)
@@ -0,0 +1,90 @@
+"""
+===================================================================================
+차트 페인트 비용 벤치마크 (오프스크린)
+===================================================================================
+Sparkline을 Qt offscreen 플랫폼에서 띄우고 프레임당 paintEvent 비용을 측정합니다.
+    1) 캐시 그대로 다시 그리기   (창 이동/가려짐 등: 새 데이터 없음)
+    2) 새 봉 1개 추가 후 그리기   (꼬리 부분만 덧그리기)
+    3) 매 프레임 전체 다시 그리기 (캐시를 쓰지 않는 단순 QPainter 방식)
+
+사용법:
+    python benchmarks/bench_chart_paint.py --frames 500 --bars 1000
+===================================================================================
+"""
+
+import argparse
+import math
+import os
+import sys
+import time
+from array import array
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtGui import QPixmap
+
+from sparkline import Sparkline
+
+
+def make_series(count, base=1380.0):
+    return array('d', (base + math.sin(i / 30) * 3 + i * 0.001 for i in range(count)))
+
+
+def time_frames(widget, target, frames, before_paint=None):
+    """
+    frames번 paintEvent를 실행하고 프레임당 평균 시간(ms)을 돌려줍니다.
+
+    offscreen 플랫폼에서는 창이 실제로 노출되지 않아 repaint()가 생략될 수 있으므로
+    미리 만들어 둔 QPixmap에 render()로 그립니다 (매번 paintEvent가 호출됨).
+    """
+    start = time.perf_counter()
+    for i in range(frames):
+        if before_paint:
+            before_paint(i)
+        widget.render(target)
+    return (time.perf_counter() - start) * 1000 / frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sparkline 프레임당 페인트 비용 측정")
+    parser.add_argument("--frames", type=int, default=500)
+    parser.add_argument("--bars", type=int, default=1000, help="시작 시 봉 개수")
+    parser.add_argument("--width", type=int, default=450)
+    parser.add_argument("--height", type=int, default=40)
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    widget = Sparkline()
+    widget.resize(args.width, args.height)
+    widget.show()
+
+    series = make_series(args.bars + args.frames)
+    baseline = series[0]
+    target = QPixmap(widget.size())
+    widget.set_series(series[:args.bars], baseline)
+    widget.render(target)
+
+    # 1) 새 데이터 없이 다시 그리기
+    cached = time_frames(widget, target, args.frames)
+
+    # 2) 매 프레임 새 봉 1개 추가
+    def append_bar(i):
+        widget.set_series(series[:args.bars + i + 1], baseline)
+    renders_before = widget.full_renders
+    appended = time_frames(widget, target, args.frames, append_bar)
+    full_during_append = widget.full_renders - renders_before
+
+    # 3) 매 프레임 캐시를 버리고 전체 다시 그리기
+    naive = time_frames(widget, target, args.frames, lambda i: widget.invalidate())
+
+    print(f"{args.frames} frames, {args.bars} bars, {args.width}x{args.height}")
+    print(f"cached repaint       {cached:8.3f} ms/frame")
+    print(f"append 1 bar         {appended:8.3f} ms/frame  (full redraws: {full_during_append})")
+    print(f"full redraw (naive)  {naive:8.3f} ms/frame")
+    app.quit()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+"""
+===================================================================================
+spark 응답 해석 벤치마크 (전체 JSON 해석 vs 가벼운 해석)
+===================================================================================
+같은 응답 본문을
+    1) json.loads + parse_spark + parse_spark_series  (response.json() 방식)
+    2) decode_spark (처음 받는 티커: meta + 시각/종가 배열만)
+    3) decode_spark (이미 가진 티커: meta + 새 봉만)
+으로 해석하며 1회당 시간과 최대 메모리 할당량을 비교합니다.
+
+기본 입력은 tests/fixtures/spark_v8.json입니다 (v8 응답 본문, tests/fixtures/README.md 참고).
+다른 응답 파일은 --file로 지정합니다 (여러 개 가능).
+티커 수에 따라 어떻게 늘어나는지 볼 때만 --scale로 만든 응답을 씁니다 (스텁 서버의 v8 형식).
+
+사용법:
+    python benchmarks/bench_decode.py --repeat 200
+    python benchmarks/bench_decode.py --file recorded_spark.json
+    python benchmarks/bench_decode.py --scale 4 --scale 20
+===================================================================================
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from quote_decode import decode_spark, parse_spark, parse_spark_series
+from yahoo_stub import StubMarket
+
+
+FIXTURE = os.path.join(ROOT, "tests", "fixtures", "spark_v8.json")
+
+
+def sample_payload(symbol_count, bars=1440):
+    """v8 spark 응답과 같은 형식(공백 없는 JSON)의 본문을 만듭니다 (--scale 용)."""
+    market = StubMarket(bars=bars, seed=1)
+    symbols = ["KRW=X", "JPYKRW=X", "BTC-USD", "ETH-USD"] + [f"SYM{i:03d}=X" for i in range(symbol_count)]
+    return json.dumps(market.spark_v8(symbols[:symbol_count]), separators=(',', ':'))
+
+
+def full_parse(text):
+    data = json.loads(text)
+    return parse_spark(data), parse_spark_series(data)
+
+
+def measure(func, repeat):
+    """1회당 평균 시간(ms)과 최대 추가 메모리(KB)"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    elapsed = (time.perf_counter() - start) * 1000 / repeat
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1024
+
+
+def bench(name, text, repeat):
+    _, series = full_parse(text)
+    # 이미 마지막 두 봉 전까지 받아 둔 상태를 가정 (평소 폴링 주기)
+    last = {ticker: timestamps[-2] for ticker, (timestamps, _) in series.items()}
+
+    print(f"\n{name}: {len(text) / 1024:.0f} KB, {len(series)} symbols")
+    for label, func in (
+        ("json.loads (full)", lambda: full_parse(text)),
+        ("decode_spark first", lambda: decode_spark(text)),
+        ("decode_spark steady", lambda: decode_spark(text, last)),
+    ):
+        elapsed, peak = measure(func, repeat)
+        print(f"  {label:<20} {elapsed:8.3f} ms/decode   peak {peak:9.1f} KB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="spark 응답 해석 시간/할당량 비교")
+    parser.add_argument("--file", action="append", help="spark 응답 파일 (JSON, 기본값: tests/fixtures/spark_v8.json)")
+    parser.add_argument("--scale", type=int, action="append", metavar="SYMBOLS",
+                        help="응답 파일 대신 티커 SYMBOLS개 x 1440봉 응답을 만들어 씀")
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args()
+
+    if args.scale:
+        for count in args.scale:
+            bench(f"generated {count} symbols x 1440 bars", sample_payload(count), args.repeat)
+        return
+    for path in args.file or [FIXTURE]:
+        with open(path, encoding="utf-8") as f:
+            bench(os.path.relpath(path, ROOT), f.read(), args.repeat)
+
+
+if __name__ == '__main__':
+    main()
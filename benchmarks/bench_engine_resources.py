@@ -0,0 +1,109 @@
+"""
+===================================================================================
+시세 엔진 자원 사용량 벤치마크 (티커 1 / 10 / 100개)
+===================================================================================
+로컬 스텁 서버를 상대로 QuoteEngine을 일정 시간 돌리고
+CPU 시간, 메모리(RSS), 스레드 수, 받은 시세 수를 보고합니다.
+티커 수마다 별도 프로세스에서 측정하므로 서로 영향을 주지 않습니다.
+
+사용법:
+    python benchmarks/bench_engine_resources.py --duration 10 --interval 1
+===================================================================================
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+SYMBOL_COUNTS = (1, 10, 100)
+
+
+def current_rss_mb():
+    """현재 RSS (MB). /proc가 없으면 최대 RSS로 대신합니다."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_child(symbol_count, duration, interval):
+    """티커 symbol_count개로 엔진을 돌리고 측정 결과를 JSON 한 줄로 출력합니다."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt5.QtCore import QCoreApplication, QTimer
+    from market_hours import PollScheduler
+    from quote_cache import QuoteCache
+    from quote_engine import QuoteEngine
+    from yahoo_stub import start_stub_server
+
+    app = QCoreApplication(sys.argv)
+    server = start_stub_server()
+
+    cache = QuoteCache(os.path.join(tempfile.mkdtemp(), "quote_cache.json"))
+    engine = QuoteEngine(base_url=server.base_url, cache=cache)
+    engine.scheduler = PollScheduler(fixed_interval=interval)
+
+    received = [0]
+    engine.quote_updated.connect(lambda quote: received.__setitem__(0, received[0] + 1))
+
+    rss_before = current_rss_mb()
+    cpu_before = time.process_time()
+
+    for i in range(symbol_count):
+        engine.subscribe(f"SYM{i:03d}=X")
+
+    QTimer.singleShot(int(duration * 1000), app.quit)
+    app.exec_()
+
+    # 스텁 서버 스레드는 같은 프로세스에서 돌므로 CPU 시간에 함께 포함됩니다
+    result = {
+        "symbols": symbol_count,
+        "cpu_s": round(time.process_time() - cpu_before, 3),
+        "rss_mb": round(current_rss_mb(), 1),
+        "rss_growth_mb": round(current_rss_mb() - rss_before, 1),
+        "threads": threading.active_count(),
+        "quotes": received[0],
+        "requests": server.request_count,
+    }
+    engine.stop()
+    server.shutdown()
+    print(json.dumps(result))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="시세 엔진 CPU/메모리 측정")
+    parser.add_argument("--duration", type=float, default=10, help="측정 시간 (초)")
+    parser.add_argument("--interval", type=float, default=1, help="엔진 조회 주기 (초)")
+    parser.add_argument("--child", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child is not None:
+        run_child(args.child, args.duration, args.interval)
+        return
+
+    print(f"{'symbols':>7} {'cpu_s':>7} {'rss_mb':>7} {'+rss_mb':>8} {'threads':>7} {'quotes':>7} {'requests':>8}")
+    for count in SYMBOL_COUNTS:
+        output = subprocess.run(
+            [sys.executable, __file__, "--child", str(count),
+             "--duration", str(args.duration), "--interval", str(args.interval)],
+            check=True, capture_output=True, text=True,
+        ).stdout
+        r = json.loads(output.strip().splitlines()[-1])
+        print(f"{r['symbols']:>7} {r['cpu_s']:>7} {r['rss_mb']:>7} {r['rss_growth_mb']:>8} "
+              f"{r['threads']:>7} {r['quotes']:>7} {r['requests']:>8}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""
+===================================================================================
+시세 조회 지연 시간 벤치마크 (세션 재사용 전/후 비교)
+===================================================================================
+로컬 HTTPS 스텁 서버를 띄우고 같은 배치 요청을
+    1) 요청마다 새 aiohttp 세션  (재사용 없음: 매 요청마다 TCP + TLS 연결)
+    2) 공용 세션                 (quote_core.make_async_session: 엔진이 쓰는 keep-alive 풀)
+으로 보내 지연 시간을 비교합니다.
+
+사용법:
+    python benchmarks/bench_fetch_latency.py --requests 200
+===================================================================================
+"""
+
+import argparse
+import asyncio
+import os
+import ssl
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from quote_core import make_async_session
+from quote_providers import HEADERS, SPARK_PATH
+from yahoo_stub import make_self_signed_cert, start_stub_server
+
+
+SYMBOLS = ["KRW=X", "JPYKRW=X", "BTC-USD", "ETH-USD"]
+
+
+async def measure(get, url, params, count):
+    """get(url, params)를 count번 기다리고 요청별 소요 시간(ms)을 돌려줍니다."""
+    samples = []
+    for _ in range(count):
+        start = time.perf_counter()
+        await get(url, params)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def report(name, samples):
+    samples = sorted(samples)
+    p95 = samples[int(len(samples) * 0.95) - 1]
+    print(f"{name:<16} mean {statistics.mean(samples):7.2f} ms   "
+          f"p50 {statistics.median(samples):7.2f} ms   p95 {p95:7.2f} ms")
+
+
+async def run(server, certfile, count):
+    import aiohttp
+
+    url = server.base_url + SPARK_PATH
+    params = {"symbols": ",".join(SYMBOLS), "range": "1d", "interval": "1m"}
+    context = ssl.create_default_context(cafile=certfile)
+
+    async def fresh_get(url, params):
+        async with aiohttp.ClientSession(headers=HEADERS) as session:
+            async with session.get(url, params=params, ssl=context) as response:
+                return await response.read()  # 본문까지 모두 받은 시점까지 측정
+
+    async with make_async_session() as session:
+        async def pooled_get(url, params):
+            async with session.get(url, params=params, ssl=context) as response:
+                return await response.read()
+
+        print(f"{count} requests x {len(SYMBOLS)} symbols against {server.base_url}")
+        report("new session", await measure(fresh_get, url, params, count))
+        report("shared session", await measure(pooled_get, url, params, count))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="세션 재사용 전/후 조회 지연 비교")
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        certfile, keyfile = make_self_signed_cert(tmp)
+        server = start_stub_server(certfile=certfile, keyfile=keyfile)
+        try:
+            asyncio.run(run(server, certfile, args.requests))
+        finally:
+            server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""
+===================================================================================
+헤지 요청 벤치마크 (단일 제공자 vs HedgedFetcher)
+===================================================================================
+대부분은 빠르고 가끔(--slow-rate) 아주 느린(--slow) 응답을 주는 가짜 제공자 두 개로
+    1) 주 제공자 하나만 사용
+    2) HedgedFetcher (주 제공자가 p95를 넘기면 다음 제공자에도 요청)
+를 같은 횟수만큼 조회하고 지연 백분위수와 추가로 나간 요청 비율을 비교합니다.
+
+사용법:
+    python benchmarks/bench_hedging.py --requests 1000 --slow-rate 0.02 --slow 2.0
+===================================================================================
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from quote_providers import FakeQuoteProvider, HedgedFetcher
+
+PRICES = {"KRW=X": 1380.0, "JPYKRW=X": 9.2, "BTC-USD": 67000.0, "ETH-USD": 3500.0}
+
+
+def make_latency(rnd, fast, slow, slow_rate):
+    # 정상 응답은 fast 근처, slow_rate 확률로 slow초 걸리는 꼬리 지연
+    return lambda: slow if rnd.random() < slow_rate else rnd.uniform(fast * 0.8, fast * 1.2)
+
+
+async def run(providers, count):
+    fetcher = HedgedFetcher(providers)
+    symbols = list(PRICES)
+    latencies = []
+    for _ in range(count):
+        started = time.perf_counter()
+        await fetcher.fetch(None, symbols)
+        latencies.append(time.perf_counter() - started)
+    latencies.sort()
+    return latencies, sum(p.calls for p in providers)
+
+
+def report(label, latencies, calls, count):
+    def pct(p):
+        return latencies[min(int(len(latencies) * p / 100), len(latencies) - 1)] * 1000
+    print(f"  {label:<10} p50 {pct(50):7.1f} ms   p95 {pct(95):7.1f} ms   p99 {pct(99):7.1f} ms   "
+          f"max {latencies[-1] * 1000:7.1f} ms   requests {calls} (+{(calls - count) / count:.1%})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="헤지 요청 꼬리 지연 비교")
+    parser.add_argument("--requests", type=int, default=1000, help="조회 횟수")
+    parser.add_argument("--fast", type=float, default=0.05, help="정상 응답 시간 (초)")
+    parser.add_argument("--slow", type=float, default=2.0, help="느린 응답 시간 (초)")
+    parser.add_argument("--slow-rate", type=float, default=0.02, help="느린 응답 비율")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{args.requests} fetches, {args.fast * 1000:.0f} ms normal, "
+          f"{args.slow_rate:.0%} at {args.slow * 1000:.0f} ms")
+
+    for label, provider_count in (("single", 1), ("hedged", 2)):
+        rnd = random.Random(args.seed)
+        providers = [FakeQuoteProvider(f"fake{i}", PRICES,
+                                       latency=make_latency(rnd, args.fast, args.slow, args.slow_rate))
+                     for i in range(provider_count)]
+        latencies, calls = asyncio.run(run(providers, args.requests))
+        report(label, latencies, calls, args.requests)
+
+
+if __name__ == "__main__":
+    main()
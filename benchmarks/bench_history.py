@@ -0,0 +1,87 @@
+"""
+===================================================================================
+시세 기록 저장소 벤치마크 (quote_history)
+===================================================================================
+임시 DB에 티커 여러 개의 1분 간격 가격을 며칠치 기록한 뒤
+    - 기록 속도 (점/초)와 DB 크기
+    - 1일 / 1주 / 1달 차트 조회 시간, 고른 단위(테이블), 돌려받은 점 수
+를 보고합니다.
+
+사용법:
+    python benchmarks/bench_history.py --tickers 10 --days 30
+===================================================================================
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import quote_history
+from quote_history import QuoteHistory
+
+RANGES = (("1 day", 86400), ("1 week", 7 * 86400), ("1 month", 30 * 86400))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="시세 기록 저장소 기록/조회 속도")
+    parser.add_argument("--tickers", type=int, default=10)
+    parser.add_argument("--days", type=int, default=30, help="기록할 기간 (일)")
+    parser.add_argument("--max-points", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=20, help="조회 반복 횟수")
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix="quote-history-")
+    path = os.path.join(directory, "quote_history.db")
+    # 벤치마크 데이터는 과거 시각이므로 보존 기간 삭제를 끔
+    history = QuoteHistory(path, retention={table: None for table, _ in quote_history.LEVELS})
+
+    end = int(time.time()) // 60 * 60
+    start = end - args.days * 86400
+    timestamps = list(range(start, end, 60))
+    rnd = random.Random(1)
+
+    started = time.perf_counter()
+    for i in range(args.tickers):
+        price, prices = 1000.0 + i, []
+        for _ in timestamps:
+            price *= 1 + rnd.gauss(0, 0.0005)
+            prices.append(price)
+        # 엔진처럼 한 번에 조금씩 (하루치씩) 넣음
+        for day in range(0, len(timestamps), 1440):
+            history.add(f"SYM{i:03d}=X", timestamps[day:day + 1440], prices[day:day + 1440])
+    queued = time.perf_counter() - started
+    history.close()
+    elapsed = time.perf_counter() - started
+
+    points = history.written
+    size = sum(os.path.getsize(os.path.join(directory, f)) for f in os.listdir(directory))
+    print(f"ingest: {points:,} points in {elapsed:.2f} s ({points / elapsed:,.0f} points/s), "
+          f"add() total {queued * 1000:.1f} ms, db {size / 1024 / 1024:.1f} MB")
+
+    db = quote_history.connect(path)
+    for table, _ in quote_history.LEVELS:
+        print(f"  {table:<8} {db.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]:>10,} rows")
+
+    for label, span in RANGES:
+        if span > args.days * 86400:
+            continue
+        durations = []
+        for _ in range(args.repeat):
+            t0 = time.perf_counter()
+            ts, closes = history.query("SYM000=X", end - span, end, max_points=args.max_points)
+            durations.append(time.perf_counter() - t0)
+        durations.sort()
+        step = (ts[1] - ts[0]) if len(ts) > 1 else 0
+        print(f"  {label:<8} {len(ts):>4} points (step {step:>6} s)   median {durations[len(durations) // 2] * 1000:6.2f} ms")
+
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
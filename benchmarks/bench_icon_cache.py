@@ -0,0 +1,104 @@
+"""
+===================================================================================
+국기 / 아이콘 캐시 벤치마크 (icon_cache)
+===================================================================================
+위젯을 만들거나 행을 추가할 때 GUI 스레드가 국기에 쓰는 시간을 비교합니다.
+    - old file:  매번 QPixmap(usa.png) 디코드 + scaledToHeight (예전 임원용 모니터)
+    - old font:  통화마다 qtawesome 아이콘을 만들고 픽스맵으로 그림 (예전 환율 고시판)
+    - cold:      캐시 비어 있음, 디스크 캐시 없음 (디코드/축소는 작업 스레드)
+    - disk:      새 프로세스처럼 빈 메모리 캐시 + icon_cache/ 폴더의 줄인 PNG
+    - warm:      이미 준비된 픽스맵 조회 (통화 전환 / 행 추가)
+
+GUI 스레드 시간(gui_ms)은 flag() 호출과 준비 알림 처리에 쓴 시간만 셉니다.
+ready_ms는 첫 요청부터 모든 아이콘이 준비될 때까지 걸린 시간입니다.
+
+사용법:
+    python benchmarks/bench_icon_cache.py --repeat 100
+===================================================================================
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def run(repeat):
+    from PyQt5.QtCore import Qt, QSize
+    from PyQt5.QtGui import QPixmap, QPixmapCache
+    from PyQt5.QtWidgets import QApplication
+    import qtawesome as qta
+    import icon_cache
+    from bank_rate_board import CURRENCIES
+
+    app = QApplication(sys.argv)
+    codes = [code for code, _, _ in CURRENCIES]
+
+    print(f"{len(codes)} currencies, flag height 30 (monitor) / 16 (board), {repeat} repeats")
+    print(f"{'case':<10} {'gui_ms':>9} {'ready_ms':>9} {'decodes':>8} {'disk':>5}")
+
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        QPixmap(icon_cache.resource_path("usa.png")).scaledToHeight(30, Qt.SmoothTransformation)
+    print(f"{'old file':<10} {(time.perf_counter() - t0) / repeat * 1000:>9.3f} {'':>9} {1:>8} {'':>5}")
+
+    t0 = time.perf_counter()
+    for code in codes:
+        name = 'fa5s.flag-usa' if code == "USD" else 'fa5s.flag'
+        qta.icon(name, color='#777777').pixmap(QSize(16, 16))
+    print(f"{'old font':<10} {(time.perf_counter() - t0) * 1000:>9.3f} {'':>9} {'':>8} {'':>5}")
+
+    def measure(label, cache, rounds=1):
+        gui = 0.0
+        start = time.perf_counter()
+        waiting = set()
+        for _ in range(rounds):
+            t0 = time.perf_counter()
+            waiting = {code for code in ["USD"] + codes
+                       if cache.flag(code, 30 if code == "USD" else 16, 1.0) is None}
+            gui += time.perf_counter() - t0
+        while waiting:
+            t0 = time.perf_counter()
+            app.processEvents()
+            waiting = {code for code in waiting
+                       if cache.flag(code, 30 if code == "USD" else 16, 1.0) is None}
+            gui += time.perf_counter() - t0
+            time.sleep(0.0005)
+        ready = time.perf_counter() - start
+        print(f"{label:<10} {gui / rounds * 1000:>9.3f} {ready / rounds * 1000:>9.2f} {cache.decodes:>8} {cache.disk_hits:>5}")
+
+    directory = os.path.abspath(icon_cache.ICON_CACHE_DIR)
+    QPixmapCache.clear()
+    cold = icon_cache.IconCache(directory)
+    measure("cold", cold)
+    cold.shutdown()   # 디스크 저장이 끝난 뒤 다음 단계
+    QPixmapCache.clear()
+    cache = icon_cache.IconCache(directory)
+    measure("disk", cache)
+    measure("warm", cache, rounds=repeat)
+    app.quit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="국기 / 아이콘 캐시 비용")
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args()
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    workdir = tempfile.mkdtemp(prefix="bench-icons-")
+    shutil.copy(os.path.join(ROOT, "usa.png"), workdir)
+    os.chdir(workdir)   # resource_path / 디스크 캐시가 임시 폴더를 가리키도록
+    try:
+        run(args.repeat)
+    finally:
+        os.chdir(ROOT)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
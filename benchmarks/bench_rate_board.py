@@ -0,0 +1,117 @@
+"""
+===================================================================================
+환율 고시판 벤치마크 (bank_rate_board 모델/뷰)
+===================================================================================
+고시판(통화 100개 이상)에 합성 시세를 여러 번 흘려보내고
+    - 시세 하나를 모델에 반영하는 시간 (on_quote)
+    - 한 번 갱신할 때 나가는 dataChanged 수
+    - 한 번 갱신 후 다시 그릴 때 뷰가 data()로 물어본 행 수 (보이는 행만 그리는지)
+    - 다시 그리기 시간
+을 보고합니다. 정렬(매매기준율 내림차순)과 검색어를 켠 상태도 함께 잽니다.
+
+사용법:
+    python benchmarks/bench_rate_board.py --rounds 200
+===================================================================================
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def run(rounds):
+    from PyQt5.QtCore import Qt
+    from PyQt5.QtWidgets import QApplication
+    import bank_rate_board
+    from quote_decode import Quote
+
+    app = QApplication(sys.argv)
+
+    # 뷰가 data()로 물어본 행을 세는 모델 (C++ 뷰가 부르는 가상 함수라 하위 클래스로 감쌈)
+    touched = set()
+
+    class CountingModel(bank_rate_board.RateTableModel):
+        def data(self, index, role=Qt.DisplayRole):
+            touched.add(index.row())
+            return super().data(index, role)
+
+    bank_rate_board.RateTableModel = CountingModel
+    board = bank_rate_board.BankRateBoard()
+    board.engine.quote_updated.disconnect(board.model.on_quote)   # 합성 시세만 반영
+    board.resize(820, 640)
+    board.show()
+    app.processEvents()
+
+    model = board.model
+    changed = [0]
+    model.dataChanged.connect(lambda *args: changed.__setitem__(0, changed[0] + 1))
+    rnd = random.Random(1)
+    prices = {ticker: 100.0 + i for i, ticker in enumerate(model.tickers)}
+
+    def measure(label):
+        update_s = paint_s = 0.0
+        touched_rows = signals = 0
+        for _ in range(rounds):
+            quotes = []
+            for ticker, price in prices.items():
+                price *= 1 + rnd.gauss(0, 0.001)
+                prices[ticker] = price
+                quotes.append(Quote(ticker, price, price - 100.0, 100.0, int(time.time())))
+
+            changed[0] = 0
+            t0 = time.perf_counter()
+            for quote in quotes:
+                model.on_quote(quote)
+            update_s += time.perf_counter() - t0
+            signals += changed[0]
+
+            touched.clear()
+            t0 = time.perf_counter()
+            board.view.viewport().repaint()
+            paint_s += time.perf_counter() - t0
+            touched_rows += len(touched)
+
+        count = len(prices)
+        print(f"  {label:<24} on_quote {update_s / rounds / count * 1e6:6.1f} us   "
+              f"dataChanged {signals / rounds:5.0f}/round   "
+              f"rows read by paint {touched_rows / rounds:5.1f} of {count}   "
+              f"paint {paint_s / rounds * 1000:6.2f} ms")
+
+    print(f"{model.rowCount()} currencies, {rounds} rounds (every currency moves each round)")
+    measure("default order")
+    board.view.sortByColumn(bank_rate_board.RateTableModel.COL_RATE, Qt.DescendingOrder)
+    measure("sorted by rate (desc)")
+    board.search.setText("달러")
+    measure(f"filter '달러' ({board.proxy.rowCount()} rows)")
+
+    board.close()
+    board.engine.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="환율 고시판 모델/뷰 갱신 비용")
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    # 엔진은 만들어지지만 조회할 곳이 없도록 (합성 시세만 측정)
+    os.environ.update(QUOTE_HUB="0", QUOTE_HISTORY="0", QUOTE_BASE_URL="http://127.0.0.1:9")
+
+    workdir = tempfile.mkdtemp(prefix="bench-board-")
+    os.chdir(workdir)   # 캐시 파일을 임시 폴더에 씀
+    try:
+        run(args.rounds)
+    finally:
+        os.chdir(ROOT)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
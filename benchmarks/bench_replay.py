@@ -0,0 +1,182 @@
+"""
+===================================================================================
+녹화 재생 벤치마크 (위젯 update_ui / 가격 알림 / 차트 그리기)
+===================================================================================
+변동이 큰 하루를 흉내 낸 녹화 파일을 만들고(또는 QUOTE_RECORD로 녹화한 파일을 받아),
+실제 위젯(GhostExchangeWidget + 대시보드)에 QuoteEngine 시그널 경로 그대로 재생합니다.
+네트워크 없이 같은 입력으로 반복 측정할 수 있습니다.
+
+보고 항목:
+    - 재생한 응답 수, 걸린 시간, 초당 응답/시세 수
+    - 위젯 update_ui 호출 수와 평균 시간
+    - 발동한 가격 알림 수와 알림 엔진 평균 시간
+    - 스파크라인 paintEvent 수와 평균 시간
+
+사용법:
+    python benchmarks/bench_replay.py --responses 2000              # 합성 녹화 + 최대 속도 재생
+    python benchmarks/bench_replay.py --file day.jsonl.gz --speed 60
+===================================================================================
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+LEGS = {"KRW=X": 1380.0, "JPYKRW=X": 9.2, "BTC-USD": 67000.0, "ETH-USD": 3500.0}
+STEP = 20   # 합성 녹화의 응답 간격 (초, 장중 조회 주기)
+
+
+def make_recording(path, responses, seed=1):
+    """
+    변동이 큰 날의 합성 녹화 파일을 만듭니다.
+
+    평소 움직임(0.1%) + 가끔 큰 급등락(1~3%)을 섞은 랜덤 워크이며,
+    응답마다 최근 1분봉 몇 개를 함께 넣습니다 (실제 응답의 꼬리 부분과 같은 모양).
+    """
+    from quote_recorder import QuoteRecorder
+
+    rnd = random.Random(seed)
+    recorder = QuoteRecorder(path)
+    prices = dict(LEGS)
+    bars = {t: [] for t in LEGS}   # 티커 -> [(분, 종가)]
+    start = int(time.time()) - responses * STEP
+
+    for i in range(responses):
+        now = start + i * STEP
+        minute = now - now % 60
+        results = {}
+        for ticker, prev_close in LEGS.items():
+            move = rnd.gauss(0, 0.001)
+            if rnd.random() < 0.01:
+                move += rnd.choice((-1, 1)) * rnd.uniform(0.01, 0.03)
+            prices[ticker] *= 1 + move
+            series = bars[ticker]
+            if series and series[-1][0] == minute:
+                series[-1] = (minute, prices[ticker])
+            else:
+                series.append((minute, prices[ticker]))
+            tail = series[-5:]
+            results[ticker] = {
+                "timestamp": [ts for ts, _ in tail], "symbol": ticker,
+                "previousClose": None, "chartPreviousClose": prev_close,
+                "close": [round(c, 4) for _, c in tail], "dataGranularity": 60,
+            }
+        recorder.write({"t": now, "provider": "synthetic", "symbols": list(LEGS),
+                        "raw": json.dumps(results)})
+    recorder.close()
+
+
+class Timer:
+    """함수를 감싸 호출 수와 누적 시간을 잽니다."""
+
+    def __init__(self, func):
+        self.func = func
+        self.calls = 0
+        self.seconds = 0.0
+
+    def __call__(self, *args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return self.func(*args, **kwargs)
+        finally:
+            self.seconds += time.perf_counter() - started
+            self.calls += 1
+
+    def line(self, label):
+        mean = self.seconds / self.calls * 1e6 if self.calls else 0
+        return f"  {label:<22} {self.calls:>8} calls   mean {mean:8.1f} us   total {self.seconds * 1000:8.1f} ms"
+
+
+def run(speed, rules_per_ticker):
+    from PyQt5.QtCore import QTimer
+    from PyQt5.QtWidgets import QApplication
+    import sparkline
+    import exchange_widget
+    from alert_engine import AlertRule
+    from exchange_dashboard import ExchangeDashboard
+
+    app = QApplication(sys.argv)
+
+    paint = Timer(sparkline.Sparkline.paintEvent)
+    sparkline.Sparkline.paintEvent = lambda self, event: paint(self, event)
+
+    widget = exchange_widget.GhostExchangeWidget()
+    widget.update_ui = update_ui = Timer(widget.update_ui)
+
+    # 티커마다 기준가 위아래로 rules_per_ticker개의 가격 알림 (쿨다운 없음)
+    alerts = widget.alerts
+    for ticker, price in LEGS.items():
+        for i in range(rules_per_ticker):
+            level = price * (1 + (i - rules_per_ticker / 2) * 0.002)
+            alerts.add_rule(AlertRule(ticker, "above" if i % 2 else "below", level, cooldown=0))
+    fired = [0]
+    alerts.alert_triggered.connect(lambda alert: fired.__setitem__(0, fired[0] + 1))
+    widget.engine.quote_updated.disconnect(alerts.on_quote)
+    alert_timer = Timer(alerts.on_quote)
+    widget.engine.quote_updated.connect(alert_timer)
+
+    quotes = [0]
+    widget.engine.quote_updated.connect(lambda quote: quotes.__setitem__(0, quotes[0] + 1))
+
+    dashboard = ExchangeDashboard()
+    widget.show()
+    dashboard.show()
+
+    provider = widget.engine.fetcher.providers[0]
+    started = time.perf_counter()
+
+    def check():
+        if provider.finished:
+            QTimer.singleShot(200, app.quit)  # 마지막 시그널/그리기 처리
+        else:
+            QTimer.singleShot(20, check)
+
+    check()
+    app.exec_()
+    elapsed = time.perf_counter() - started
+    widget.engine.stop()
+
+    print(f"replayed {provider.position} responses in {elapsed:.2f} s "
+          f"({provider.position / elapsed:,.0f} responses/s, {quotes[0] / elapsed:,.0f} quotes/s, speed {speed:g})")
+    print(update_ui.line("widget update_ui"))
+    print(alert_timer.line(f"alerts ({len(alerts.rules())} rules)") + f"   fired {fired[0]}")
+    print(paint.line("sparkline paintEvent"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="녹화 재생으로 위젯/알림/차트 측정")
+    parser.add_argument("--file", help="재생할 녹화 파일 (없으면 합성 녹화를 만듦)")
+    parser.add_argument("--responses", type=int, default=2000, help="합성 녹화의 응답 수")
+    parser.add_argument("--speed", type=float, default=0, help="재생 배속 (0: 최대한 빠르게)")
+    parser.add_argument("--rules", type=int, default=50, help="티커당 가격 알림 규칙 수")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench-replay-")
+    path = os.path.abspath(args.file) if args.file else os.path.join(workdir, "synthetic.jsonl.gz")
+
+    # 재생 설정은 엔진 모듈을 불러오기 전에 (quote_recorder가 불러올 때 환경 변수를 읽음)
+    os.environ.update(QUOTE_REPLAY=path, QUOTE_REPLAY_SPEED=str(args.speed), QUOTE_HUB="0", QUOTE_HISTORY="0")
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    if not args.file:
+        make_recording(path, args.responses)
+        print(f"synthetic recording: {args.responses} responses, {os.path.getsize(path) / 1024:.0f} KB")
+
+    os.chdir(workdir)  # 위젯 설정/캐시 파일을 임시 폴더에 씀
+    try:
+        run(args.speed, args.rules)
+    finally:
+        os.chdir(ROOT)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""
+===================================================================================
+시작 시간 벤치마크 (임원용 환율 모니터)
+===================================================================================
+모니터를 여러 번 새로 실행해서
+    - first_paint: 실행부터 창이 처음 그려질 때까지
+    - first_cached_quote: 캐시에 있던 시세가 표시될 때까지 (--warm-cache일 때)
+    - first_quote: 새로 받은 시세가 표시될 때까지
+의 중앙값/최댓값을 보고합니다. 시점은 프로그램이 EXM_STARTUP_TRACE 파일에 남깁니다
+(startup_trace.py 참고). 실행마다 새 임시 폴더에서 돌리므로 기본은 캐시가 없는 상태입니다.
+
+--exe를 주면 PyInstaller로 빌드한 exe(onefile 또는 onedir)를 잽니다.
+onefile exe는 매번 임시 폴더에 압축을 풀기 때문에 이 시간이 first_paint에 그대로 포함됩니다.
+
+사용법:
+    python benchmarks/bench_startup.py --runs 10 --stub
+    python benchmarks/bench_startup.py --exe dist/executive_exchange_monitor.exe --stub
+    python benchmarks/bench_startup.py --importtime     # 시작할 때 불러오는 모듈 상위 목록
+===================================================================================
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+EVENTS = ("first_paint", "first_cached_quote", "first_quote")
+
+
+def read_trace(path):
+    """트레이스 파일 -> {시점 이름: 유닉스 시간}"""
+    marks = {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                name, _, value = line.partition(" ")
+                marks[name] = float(value)
+    except (OSError, ValueError):
+        pass
+    return marks
+
+
+def launch(command, workdir, env, timeout):
+    """
+    모니터를 한 번 실행하고 first_quote가 기록되면(또는 timeout이 지나면) 종료합니다.
+
+    Returns:
+        dict: 시점 이름 -> 실행부터 걸린 시간 (초)
+    """
+    trace = os.path.join(workdir, "startup_trace.txt")
+    if os.path.exists(trace):
+        os.remove(trace)
+    env = dict(env, EXM_STARTUP_TRACE=trace)
+
+    started = time.time()
+    process = subprocess.Popen(command, cwd=workdir, env=env,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        while time.time() - started < timeout:
+            if "first_quote" in read_trace(trace) or process.poll() is not None:
+                break
+            time.sleep(0.01)
+    finally:
+        process.terminate()
+        try:
+            process.wait(5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+    return {name: stamp - started for name, stamp in read_trace(trace).items()}
+
+
+def report(results):
+    for name in EVENTS:
+        values = sorted(r[name] for r in results if name in r)
+        if not values:
+            continue
+        median = values[len(values) // 2]
+        print(f"  {name:<20} median {median * 1000:7.0f} ms   max {values[-1] * 1000:7.0f} ms   "
+              f"({len(values)}/{len(results)} runs)")
+
+
+def import_report(top):
+    """python -X importtime 결과에서 누적 시간이 큰 모듈 상위 top개를 출력합니다."""
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    output = subprocess.run([sys.executable, "-X", "importtime", "-c", "import executive_exchange_monitor"],
+                            cwd=ROOT, env=env, capture_output=True, text=True).stderr
+    rows = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line.split(":", 1)[1].split("|")
+        rows.append((int(cumulative_us), int(self_us), name.rstrip()))
+
+    total = next((row for row in rows if row[2].strip() == "executive_exchange_monitor"), None)
+    print(f"{len(rows)} modules imported"
+          + (f", executive_exchange_monitor {total[0] / 1000:.1f} ms" if total else ""))
+    for cumulative_us, self_us, name in sorted(rows, reverse=True)[:top]:
+        print(f"  {cumulative_us / 1000:7.1f} ms (self {self_us / 1000:5.1f})  {name}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="모니터 시작 시간 측정")
+    parser.add_argument("--runs", type=int, default=5, help="실행 횟수")
+    parser.add_argument("--exe", help="빌드한 exe 경로 (없으면 python으로 스크립트 실행)")
+    parser.add_argument("--stub", action="store_true", help="야후 대신 로컬 스텁 서버 사용")
+    parser.add_argument("--warm-cache", action="store_true", help="시세 캐시가 있는 상태에서 측정")
+    parser.add_argument("--hub", action="store_true", help="시세 허브 사용 (기본은 QUOTE_HUB=0)")
+    parser.add_argument("--timeout", type=float, default=15.0, help="실행 한 번의 최대 대기 시간 (초)")
+    parser.add_argument("--importtime", action="store_true", help="시작 시 불러오는 모듈 상위 목록만 출력")
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    if args.importtime:
+        import_report(args.top)
+        return
+
+    if args.exe:
+        command = [os.path.abspath(args.exe)]
+    else:
+        command = [sys.executable, os.path.join(ROOT, "executive_exchange_monitor.py")]
+
+    env = dict(os.environ)
+    env.setdefault("QUOTE_HUB", "1" if args.hub else "0")
+    server = None
+    if args.stub:
+        from yahoo_stub import start_stub_server
+        server = start_stub_server()
+        env["QUOTE_BASE_URL"] = server.base_url
+
+    shared = tempfile.mkdtemp(prefix="exm-startup-") if args.warm_cache else None
+    if shared:
+        shutil.copy(os.path.join(ROOT, "usa.png"), shared)
+        launch(command, shared, env, args.timeout)  # 캐시 채우기 (결과에서 제외)
+
+    results = []
+    for _ in range(args.runs):
+        workdir = shared or tempfile.mkdtemp(prefix="exm-startup-")
+        if not shared:
+            shutil.copy(os.path.join(ROOT, "usa.png"), workdir)
+        results.append(launch(command, workdir, env, args.timeout))
+        if not shared:
+            shutil.rmtree(workdir, ignore_errors=True)
+    if shared:
+        shutil.rmtree(shared, ignore_errors=True)
+
+    print(f"{os.path.basename(command[-1])}: {args.runs} runs"
+          f"{', stub server' if server else ''}{', warm cache' if shared else ''}")
+    report(results)
+    if server:
+        print(f"  stub requests {server.request_count}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+===================================================================================
+스트리밍 시세 벤치마크 (폴링 / 스트림 / 스트림 없음 -> 폴링 대체)
+===================================================================================
+로컬 스텁 서버를 상대로 같은 티커를 세 가지 방식으로 받아 봅니다.
+    - poll:     폴링만 (QUOTE_STREAM_URL 없음)
+    - stream:   스트림 + 드문 폴링 (순번 누락 / 연결 끊김을 흉내 내어 재동기화와 재연결 확인)
+    - fallback: 스트림 주소가 404 -> 폴링으로 계속 동작하는지
+
+보고 항목:
+    - 스트림 연결을 뺀 HTTP 요청 수 (폴링 + 실패한 스트림 연결 시도), 스트림 연결 수
+    - 받은 이벤트 / 시세 수와 실제로 보낸 quote_updated 수 (모아 보내기 효과)
+    - 순번 누락 감지 횟수, 티커별 평균 갱신 간격
+
+사용법:
+    python benchmarks/bench_stream.py --symbols 20 --duration 10 --stream-interval 0.01
+===================================================================================
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def run_mode(app, server, label, stream_url, symbols, duration, interval):
+    from PyQt5.QtCore import QTimer
+    from market_hours import PollScheduler
+    from quote_cache import QuoteCache
+    from quote_engine import QuoteEngine
+
+    workdir = tempfile.mkdtemp(prefix="bench-stream-")
+    engine = QuoteEngine(base_url=server.base_url, cache=QuoteCache(os.path.join(workdir, "quote_cache.json")),
+                         stream_url=stream_url)
+    engine.scheduler = PollScheduler(fixed_interval=interval)
+
+    counts = {"signals": 0, "polls": 0}
+    updates = {}   # 티커 -> 갱신 시각 목록
+
+    def on_quote(quote):
+        counts["signals"] += 1
+        updates.setdefault(quote.ticker, []).append(time.perf_counter())
+
+    engine.quote_updated.connect(on_quote)
+    engine.poll_finished.connect(lambda: counts.__setitem__("polls", counts["polls"] + 1))
+
+    requests_before, streams_before = server.request_count, server.stream_count
+    for symbol in symbols:
+        engine.subscribe(symbol)
+    QTimer.singleShot(int(duration * 1000), app.quit)
+    app.exec_()
+    engine.stop()
+    engine.wait(2)
+    shutil.rmtree(workdir, ignore_errors=True)
+
+    streams = server.stream_count - streams_before
+    gaps = [b - a for times in updates.values() for a, b in zip(times, times[1:])]
+    stream = engine.stream
+    print(f"{label:<9} {server.request_count - requests_before - streams:>6} {streams:>8} "
+          f"{stream.events if stream else 0:>7} {stream.received if stream else 0:>8} {counts['signals']:>8} "
+          f"{stream.gaps if stream else 0:>5} {counts['polls']:>6} "
+          f"{(sum(gaps) / len(gaps) * 1000 if gaps else 0):>10.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="스트리밍 / 폴링 시세 비교")
+    parser.add_argument("--symbols", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=10, help="방식별 측정 시간 (초)")
+    parser.add_argument("--interval", type=float, default=5, help="평소 폴링 주기 (초)")
+    parser.add_argument("--stream-interval", type=float, default=0.01, help="스텁 스트림 이벤트 간격 (초)")
+    parser.add_argument("--drop-rate", type=float, default=0.002, help="스트림 순번 누락 비율")
+    parser.add_argument("--max-events", type=int, default=300, help="스트림 연결당 이벤트 수 (넘으면 끊음)")
+    args = parser.parse_args()
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    os.environ.update(QUOTE_HUB="0", QUOTE_HISTORY="0")
+    os.environ.pop("QUOTE_STREAM_URL", None)
+
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from PyQt5.QtCore import QCoreApplication
+    from yahoo_stub import start_stub_server
+
+    app = QCoreApplication(sys.argv)
+    server = start_stub_server(stream_interval=args.stream_interval, stream_drop_rate=args.drop_rate,
+                               stream_max_events=args.max_events)
+    symbols = [f"SYM{i:03d}=X" for i in range(args.symbols)]
+
+    print(f"{args.symbols} symbols, {args.duration:g} s per mode, poll interval {args.interval:g} s, "
+          f"stream event every {args.stream_interval * 1000:g} ms")
+    print(f"{'mode':<9} {'http':>6} {'streams':>8} {'events':>7} {'received':>8} {'signals':>8} "
+          f"{'gaps':>5} {'cycles':>6} {'update_ms':>10}")
+    run_mode(app, server, "poll", None, symbols, args.duration, args.interval)
+    run_mode(app, server, "stream", server.base_url + "/stream", symbols, args.duration, args.interval)
+    run_mode(app, server, "fallback", server.base_url + "/no-stream", symbols, args.duration, args.interval)
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
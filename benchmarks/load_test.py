@@ -0,0 +1,317 @@
+"""
+===================================================================================
+부하 테스트 (티커 수 x 위젯 수)
+===================================================================================
+로컬 야후 호환 스텁 서버(응답 지연 / 오류 / 요청 제한 설정 가능)를 띄우고,
+티커 수와 위젯(창) 수를 바꿔 가며 시세 엔진 + 위젯을 Qt offscreen 환경에서 돌립니다.
+
+조합마다 별도 프로세스에서 측정하며 (스텁 서버는 부모 프로세스에서 돌아 CPU에 섞이지 않음)
+보고 항목은 다음과 같습니다.
+    - CPU 시간, 메모리(RSS), 스레드 수 (파이썬 스레드 / OS 스레드)
+    - 받은 시세 수, 조회 주기 수, 오류 수
+    - 요청 응답 시간 백분위수 (p50 / p95 / p99)
+    - UI 이벤트 루프 지연 (50ms 타이머가 늦게 불린 정도, p50 / p99 / 최대)
+
+결과는 benchmarks/results/에 JSON으로 저장되며 (git 버전 포함)
+--compare로 이전 결과(예: 지난 릴리스)와 나란히 비교할 수 있습니다.
+
+사용법:
+    python benchmarks/load_test.py                                   # 티커 10/50/200 x 위젯 1/10
+    python benchmarks/load_test.py --symbols 200 --widgets 1,5,20 --latency 0.3 --error-rate 0.05
+    python benchmarks/load_test.py --rate-limit 5 --compare benchmarks/results/load-20260101-120000.json
+===================================================================================
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_engine_resources import current_rss_mb
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+LAG_TICK_MS = 50      # 이벤트 루프 지연을 재는 타이머 간격
+
+# 표와 비교에 쓰는 항목 (키, 제목, 너비)
+COLUMNS = (
+    ("symbols", "symbols", 7), ("widgets", "widgets", 7),
+    ("cpu_pct", "cpu%", 6), ("rss_mb", "rss_mb", 7), ("threads", "py_thr", 6), ("os_threads", "os_thr", 6),
+    ("quotes", "quotes", 7), ("polls", "polls", 5), ("errors", "errors", 6),
+    ("fetch_p50_ms", "f_p50", 6), ("fetch_p95_ms", "f_p95", 6), ("fetch_p99_ms", "f_p99", 6),
+    ("lag_p50_ms", "lag50", 6), ("lag_p99_ms", "lag99", 6), ("lag_max_ms", "lagmax", 6),
+)
+
+
+def percentile(samples, p):
+    """정렬하지 않은 표본의 백분위수 (표본이 없으면 None)"""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))]
+
+
+def ms(seconds):
+    return None if seconds is None else round(seconds * 1000, 1)
+
+
+def os_thread_count():
+    """프로세스의 OS 스레드 수 (Qt 내부 스레드 포함, /proc가 없으면 None)"""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("Threads:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def git_version():
+    try:
+        return subprocess.run(["git", "describe", "--always", "--dirty"], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# ===================================================================================
+# [자식 프로세스] 엔진 + 위젯 실행
+# ===================================================================================
+
+def build_window(tickers):
+    """대시보드와 같은 셀/스타일을 쓰는 창 하나 (임의의 티커 표시용)"""
+    from PyQt5.QtWidgets import QGridLayout, QWidget
+    from exchange_dashboard import STYLE_SHEET, QuoteCell
+
+    window = QWidget()
+    window.setStyleSheet(STYLE_SHEET)
+    layout = QGridLayout(window)
+    window.cells = {}
+    for i, ticker in enumerate(tickers):
+        cell = QuoteCell(ticker)
+        window.cells[ticker] = cell
+        layout.addWidget(cell, i // 4, i % 4)
+
+    def on_quote(quote):
+        cell = window.cells.get(quote.ticker)
+        if cell:
+            cell.set_quote(quote)
+
+    window.on_quote = on_quote
+    return window
+
+
+def run_child(args):
+    """티커 args.child_symbols개, 위젯 args.child_widgets개로 돌리고 결과를 JSON 한 줄로 출력합니다."""
+    from PyQt5.QtCore import Qt, QTimer
+    from PyQt5.QtWidgets import QApplication
+    from market_hours import PollScheduler
+    from quote_cache import QuoteCache
+    from quote_engine import QuoteEngine
+    from quote_providers import LatencyTracker
+
+    app = QApplication(sys.argv)
+    symbols = [f"SYM{i:03d}=X" for i in range(args.child_symbols)]
+
+    engine = QuoteEngine(base_url=args.base_url, cache=QuoteCache(os.path.join(os.getcwd(), "quote_cache.json")))
+    engine.scheduler = PollScheduler(fixed_interval=args.interval)
+    # 측정 시간 동안의 응답 시간을 모두 보관 (기본 창은 최근 200개)
+    engine.fetcher.latency = {name: LatencyTracker(window=1000000) for name in engine.fetcher.latency}
+
+    counts = {"quotes": 0, "polls": 0, "errors": 0}
+
+    def count(key):
+        counts[key] += 1
+
+    engine.quote_updated.connect(lambda quote: count("quotes"))
+    engine.poll_finished.connect(lambda: count("polls"))
+    engine.error_occurred.connect(lambda error: count("errors"))
+
+    # 위젯마다 cells개씩 돌아가며 티커를 맡음 (위젯이 많으면 같은 티커를 여러 창이 표시)
+    windows = []
+    for w in range(args.child_widgets):
+        tickers = [symbols[(w * args.cells + k) % len(symbols)] for k in range(min(args.cells, len(symbols)))]
+        window = build_window(tickers)
+        engine.quote_updated.connect(window.on_quote)
+        window.show()
+        windows.append(window)
+
+    # 이벤트 루프 지연: 타이머가 예정보다 얼마나 늦게 불렸는지
+    lags = []
+    last = [time.perf_counter()]
+
+    def on_tick():
+        now = time.perf_counter()
+        lags.append(max(0.0, now - last[0] - LAG_TICK_MS / 1000))
+        last[0] = now
+
+    ticker_timer = QTimer()
+    ticker_timer.setTimerType(Qt.PreciseTimer)
+    ticker_timer.timeout.connect(on_tick)
+
+    rss_before = current_rss_mb()
+    cpu_before = time.process_time()
+    wall_before = time.perf_counter()
+
+    for symbol in symbols:
+        engine.subscribe(symbol)
+    for window in windows:
+        for ticker in window.cells:
+            engine.subscribe(ticker)
+    ticker_timer.start(LAG_TICK_MS)
+
+    QTimer.singleShot(int(args.duration * 1000), app.quit)
+    app.exec_()
+
+    wall = time.perf_counter() - wall_before
+    cpu = time.process_time() - cpu_before
+    fetch = [s for tracker in engine.fetcher.latency.values() for s in tracker.samples]
+    result = {
+        "symbols": len(symbols),
+        "widgets": len(windows),
+        "cpu_s": round(cpu, 3),
+        "cpu_pct": round(cpu / wall * 100, 1),
+        "rss_mb": round(current_rss_mb(), 1),
+        "rss_growth_mb": round(current_rss_mb() - rss_before, 1),
+        "threads": threading.active_count(),
+        "os_threads": os_thread_count(),
+        "quotes": counts["quotes"],
+        "polls": counts["polls"],
+        "errors": counts["errors"],
+        "requests": len(fetch) + sum(t.failures for t in engine.fetcher.latency.values()),
+        "fetch_p50_ms": ms(percentile(fetch, 50)),
+        "fetch_p95_ms": ms(percentile(fetch, 95)),
+        "fetch_p99_ms": ms(percentile(fetch, 99)),
+        "lag_p50_ms": ms(percentile(lags, 50)),
+        "lag_p99_ms": ms(percentile(lags, 99)),
+        "lag_max_ms": ms(max(lags) if lags else None),
+    }
+    engine.stop()
+    print(json.dumps(result))
+
+
+# ===================================================================================
+# [부모 프로세스] 스텁 서버 + 조합별 실행 + 저장 / 비교
+# ===================================================================================
+
+def format_row(row):
+    cells = []
+    for key, _, width in COLUMNS:
+        value = row.get(key)
+        cells.append(f"{'-' if value is None else value:>{width}}")
+    return " ".join(cells)
+
+
+def header():
+    return " ".join(f"{title:>{width}}" for _, title, width in COLUMNS)
+
+
+def compare(results, path):
+    """이전 결과 파일과 같은 (티커 수, 위젯 수) 조합끼리 나란히 출력합니다."""
+    with open(path, encoding="utf-8") as f:
+        previous = json.load(f)
+    old_rows = {(r["symbols"], r["widgets"]): r for r in previous["results"]}
+
+    print(f"\ncompare with {os.path.basename(path)} ({previous['meta'].get('version')}) - old / new")
+    print(header())
+    for row in results:
+        old = old_rows.get((row["symbols"], row["widgets"]))
+        if old is None:
+            continue
+        print(format_row(old))
+        print(format_row(row))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="티커 / 위젯 수에 따른 부하 테스트")
+    parser.add_argument("--symbols", default="10,50,200", help="티커 수 목록 (쉼표 구분)")
+    parser.add_argument("--widgets", default="1,10", help="위젯(창) 수 목록 (쉼표 구분)")
+    parser.add_argument("--cells", type=int, default=20, help="위젯 하나가 표시할 티커 수")
+    parser.add_argument("--duration", type=float, default=10, help="조합별 측정 시간 (초)")
+    parser.add_argument("--interval", type=float, default=1, help="엔진 조회 주기 (초)")
+    parser.add_argument("--latency", type=float, default=0.05, help="스텁 응답 지연 (초)")
+    parser.add_argument("--jitter", type=float, default=0.05, help="스텁 추가 무작위 지연 최대값 (초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="스텁 503 응답 비율")
+    parser.add_argument("--rate-limit", type=float, help="스텁 초당 허용 요청 수 (넘으면 429)")
+    parser.add_argument("--output", help="결과 JSON 경로 (기본값: benchmarks/results/load-<시각>.json)")
+    parser.add_argument("--no-save", action="store_true", help="결과를 저장하지 않음")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON")
+    parser.add_argument("--child-symbols", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--child-widgets", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--base-url", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child_symbols is not None:
+        run_child(args)
+        return
+
+    from yahoo_stub import start_stub_server
+
+    server = start_stub_server(latency=args.latency, jitter=args.jitter,
+                               error_rate=args.error_rate, rate_limit=args.rate_limit)
+    # 자식 프로세스: offscreen, 허브/기록 없이, 캐시 파일은 임시 폴더에
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen", QUOTE_HUB="0", QUOTE_HISTORY="0")
+    for key in ("QUOTE_RECORD", "QUOTE_REPLAY", "QUOTE_METRICS_PORT"):
+        env.pop(key, None)
+
+    print(f"stub: latency {args.latency}s + jitter {args.jitter}s, error rate {args.error_rate}, "
+          f"rate limit {args.rate_limit or '-'}/s, interval {args.interval}s, {args.duration}s per run")
+    print(header())
+
+    results = []
+    for symbol_count in (int(s) for s in args.symbols.split(",")):
+        for widget_count in (int(w) for w in args.widgets.split(",")):
+            workdir = tempfile.mkdtemp(prefix="load-test-")
+            requests_before = server.request_count
+            try:
+                output = subprocess.run(
+                    [sys.executable, os.path.abspath(__file__),
+                     "--child-symbols", str(symbol_count), "--child-widgets", str(widget_count),
+                     "--cells", str(args.cells), "--duration", str(args.duration),
+                     "--interval", str(args.interval), "--base-url", server.base_url],
+                    check=True, capture_output=True, text=True, cwd=workdir, env=env,
+                ).stdout
+            finally:
+                shutil.rmtree(workdir, ignore_errors=True)
+            row = json.loads(output.strip().splitlines()[-1])
+            row["stub_requests"] = server.request_count - requests_before
+            results.append(row)
+            print(format_row(row))
+
+    print(f"stub totals: {server.request_count} requests, {server.rejected_count} x 429, {server.error_count} x 503")
+    server.shutdown()
+
+    report = {
+        "meta": {
+            "version": git_version(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "options": {key: value for key, value in vars(args).items()
+                        if not key.startswith(("child", "base_url", "output", "no_save", "compare"))},
+        },
+        "results": results,
+    }
+    if not args.no_save:
+        path = args.output or os.path.join(RESULTS_DIR, time.strftime("load-%Y%m%d-%H%M%S.json"))
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"saved {os.path.relpath(path)}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
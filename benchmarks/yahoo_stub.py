@@ -0,0 +1,340 @@
+"""
+===================================================================================
+Yahoo Finance 호환 로컬 스텁 서버
+===================================================================================
+목적: 실제 야후 서버 대신 로컬에서 시세 응답을 흉내 냅니다.
+      위젯/엔진을 네트워크나 요청 제한 걱정 없이 시험할 수 있습니다.
+
+사용법:
+    python benchmarks/yahoo_stub.py --port 8765
+    QUOTE_BASE_URL=http://127.0.0.1:8765 python exchange_widget.py
+
+    느린 서버 / 오류 / 요청 제한 흉내:
+    python benchmarks/yahoo_stub.py --latency 0.2 --jitter 0.1 --error-rate 0.05 --rate-limit 5
+
+    HTTPS로 띄우려면 --certfile/--keyfile을 지정합니다 (make_self_signed_cert 참고).
+
+지원 엔드포인트:
+    /v8/finance/spark?symbols=A,B,C   여러 티커 배치 조회 (티커별 평평한 맵 - 엔진이 요청하는 형식)
+    /v7/finance/spark?symbols=A,B,C   예전 형식 (spark -> result -> response[0].meta)
+    /v8/finance/chart/{ticker}        단일 티커 조회
+    /stream?symbols=A,B,C             스트리밍 시세 (Server-Sent Events, quote_stream 참고)
+
+    스트림 순번 누락 / 연결 끊김 흉내:
+    python benchmarks/yahoo_stub.py --stream-interval 0.05 --stream-drop-rate 0.01 --stream-max-events 500
+===================================================================================
+"""
+
+import argparse
+import gzip
+import json
+import os
+import random
+import ssl
+import subprocess
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs, unquote
+
+
+# 알려진 티커의 대략적인 기준가 (그 외 티커는 100 근처에서 시작)
+BASE_PRICES = {
+    "KRW=X": 1380.0,
+    "JPYKRW=X": 9.2,
+    "BTC-USD": 67000.0,
+    "ETH-USD": 3500.0,
+}
+
+
+class StubMarket:
+    """
+    티커별로 랜덤 워크하는 가짜 시장
+
+    요청이 올 때마다 가격이 조금씩 움직이며, 1분봉 시계열도 함께 만들어 줍니다.
+    """
+
+    def __init__(self, bars=390, seed=None):
+        self.bars = bars
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.prices = {}
+
+    def quote(self, ticker):
+        with self.lock:
+            base = BASE_PRICES.get(ticker, 100.0)
+            price = self.prices.get(ticker, base)
+            price *= 1 + self.random.uniform(-0.001, 0.001)
+            self.prices[ticker] = price
+            return base, price
+
+    def chart_response(self, ticker):
+        """야후 chart 응답의 result[0] 항목을 만듭니다."""
+        prev_close, price = self.quote(ticker)
+        now = int(time.time())
+        start = now - now % 60 - (self.bars - 1) * 60
+
+        timestamps = [start + i * 60 for i in range(self.bars)]
+        closes = [round(prev_close + (price - prev_close) * i / (self.bars - 1), 4)
+                  for i in range(self.bars)]
+
+        return {
+            "meta": {
+                "currency": "USD",
+                "symbol": ticker,
+                "regularMarketPrice": round(price, 4),
+                "chartPreviousClose": prev_close,
+                "previousClose": prev_close,
+                "regularMarketTime": now,
+                "dataGranularity": "1m",
+                "range": "1d",
+            },
+            "timestamp": timestamps,
+            "indicators": {"quote": [{"close": closes}]},
+        }
+
+
+    def spark_entry(self, ticker):
+        """야후 v8 spark 응답의 티커 항목 (키 순서도 실제 응답과 같게)"""
+        chart = self.chart_response(ticker)
+        return {
+            "timestamp": chart["timestamp"],
+            "symbol": ticker,
+            "previousClose": None,
+            "chartPreviousClose": chart["meta"]["chartPreviousClose"],
+            "end": None,
+            "start": None,
+            "close": chart["indicators"]["quote"][0]["close"],
+            "dataGranularity": 60,
+        }
+
+    def spark_v8(self, symbols):
+        return {s: self.spark_entry(s) for s in symbols if s}
+
+    def spark_v7(self, symbols):
+        return {"spark": {"result": [{"symbol": s, "response": [self.chart_response(s)]}
+                                     for s in symbols if s], "error": None}}
+
+
+class RateLimiter:
+    """
+    토큰 버킷 요청 제한 (초당 rate개, 최대 burst개까지 몰아서 허용)
+
+    야후처럼 제한을 넘으면 429를 돌려줄 때 씁니다.
+    """
+
+    def __init__(self, rate, burst=None):
+        self.rate = rate
+        self.burst = burst or max(1.0, rate)
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def allow(self):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+
+class YahooStubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive 지원
+    disable_nagle_algorithm = True  # 헤더/본문 분할 전송 시 지연(ACK 대기) 방지
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        server = self.server
+        market = server.market
+        server.request_count += 1
+
+        # 요청 제한 -> 429 / 응답 지연 -> 오류(503) 순서로 흉내
+        if server.limiter and not server.limiter.allow():
+            server.rejected_count += 1
+            self.send_error(429, "Too Many Requests")
+            return
+        delay = server.latency + (market.random.uniform(0, server.jitter) if server.jitter else 0)
+        if delay > 0:
+            time.sleep(delay)
+        if server.error_rate and market.random.random() < server.error_rate:
+            server.error_count += 1
+            self.send_error(503, "Service Unavailable")
+            return
+
+        if url.path == "/stream":
+            self.stream(query.get("symbols", [""])[0].split(","), self.headers.get("Last-Event-ID"))
+            return
+        elif url.path == "/v8/finance/spark":
+            body = market.spark_v8(query.get("symbols", [""])[0].split(","))
+        elif url.path == "/v7/finance/spark":
+            body = market.spark_v7(query.get("symbols", [""])[0].split(","))
+        elif url.path.startswith("/v8/finance/chart/"):
+            ticker = unquote(url.path.rsplit("/", 1)[-1])
+            body = {"chart": {"result": [market.chart_response(ticker)], "error": None}}
+        else:
+            self.send_error(404)
+            return
+
+        payload = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            payload = gzip.compress(payload, compresslevel=5)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def stream(self, symbols, last_event_id):
+        """
+        stream_interval마다 일부 티커의 새 가격을 SSE 이벤트로 보냅니다.
+
+        Last-Event-ID를 받으면 그 다음 순번부터 이어 갑니다 (놓친 이벤트를 다시 보내지는 않음).
+        stream_drop_rate 확률로 순번 하나를 건너뛰고, stream_max_events개를 보내면 연결을 끊습니다.
+        """
+        server = self.server
+        market = server.market
+        symbols = [s for s in symbols if s]
+        try:
+            seq = int(last_event_id or 0)
+        except ValueError:
+            seq = 0
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")  # 길이가 없는 본문 -> 연결을 닫아 끝을 알림
+        self.end_headers()
+        self.close_connection = True
+        server.stream_count += 1
+
+        sent = 0
+        try:
+            while not server.stream_max_events or sent < server.stream_max_events:
+                time.sleep(server.stream_interval)
+                seq += 1
+                if server.stream_drop_rate and market.random.random() < server.stream_drop_rate:
+                    continue  # 순번 누락
+                quotes = []
+                for ticker in symbols:
+                    if market.random.random() < 0.5:  # 매번 모든 티커가 움직이지는 않음
+                        prev_close, price = market.quote(ticker)
+                        quotes.append({"symbol": ticker, "price": round(price, 4),
+                                       "previousClose": prev_close, "time": int(time.time())})
+                if not quotes:
+                    continue
+                data = json.dumps({"quotes": quotes})
+                self.wfile.write(f"id: {seq}\ndata: {data}\n\n".encode())
+                sent += 1
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # 클라이언트가 끊음
+
+    def log_message(self, format, *args):
+        pass  # 요청마다 로그를 찍지 않음
+
+
+def make_self_signed_cert(directory):
+    """
+    127.0.0.1용 자체 서명 인증서를 만듭니다 (openssl 명령 필요).
+
+    Returns:
+        tuple: (certfile, keyfile) 경로. 클라이언트는 certfile을 CA로 지정하면 됩니다.
+    """
+    certfile = os.path.join(directory, "stub-cert.pem")
+    keyfile = os.path.join(directory, "stub-key.pem")
+    subprocess.run(
+        ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+         "-subj", "/CN=127.0.0.1", "-addext", "subjectAltName=IP:127.0.0.1",
+         "-keyout", keyfile, "-out", certfile],
+        check=True, capture_output=True,
+    )
+    return certfile, keyfile
+
+
+def create_stub_server(port=0, market=None, certfile=None, keyfile=None,
+                       latency=0.0, jitter=0.0, error_rate=0.0, rate_limit=None,
+                       stream_interval=0.2, stream_drop_rate=0.0, stream_max_events=None):
+    """
+    스텁 서버를 만듭니다 (아직 요청을 받지는 않음).
+
+    Args:
+        port (int): 포트 번호 (0이면 빈 포트 자동 선택)
+        market (StubMarket): 가격 생성기 (기본값: 새 StubMarket)
+        certfile, keyfile (str): 지정하면 HTTPS로 동작
+        latency (float): 모든 응답에 더할 지연 (초)
+        jitter (float): 0~jitter초의 무작위 지연을 추가로 더함
+        error_rate (float): 이 확률로 503 응답
+        rate_limit (float): 초당 허용 요청 수 (넘으면 429, None이면 제한 없음)
+        stream_interval (float): 스트림 이벤트 간격 (초)
+        stream_drop_rate (float): 이 확률로 스트림 순번 하나를 건너뜀
+        stream_max_events (int): 스트림 연결 하나에 보낼 최대 이벤트 수 (넘으면 끊음)
+
+    Returns:
+        ThreadingHTTPServer: server.base_url로 주소를, server.request_count로 요청 수를 확인
+            (server.rejected_count: 429 수, server.error_count: 503 수, server.stream_count: 스트림 연결 수)
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", port), YahooStubHandler)
+    server.daemon_threads = True
+    server.market = market or StubMarket()
+    server.request_count = 0
+    server.rejected_count = 0
+    server.error_count = 0
+    server.latency = latency
+    server.jitter = jitter
+    server.error_rate = error_rate
+    server.limiter = RateLimiter(rate_limit) if rate_limit else None
+    server.stream_count = 0
+    server.stream_interval = stream_interval
+    server.stream_drop_rate = stream_drop_rate
+    server.stream_max_events = stream_max_events
+
+    scheme = "http"
+    if certfile:
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(certfile, keyfile)
+        server.socket = context.wrap_socket(server.socket, server_side=True)
+        scheme = "https"
+
+    server.base_url = f"{scheme}://127.0.0.1:{server.server_address[1]}"
+    return server
+
+
+def start_stub_server(port=0, market=None, certfile=None, keyfile=None, **options):
+    """스텁 서버를 만들어 백그라운드 스레드에서 실행합니다 (options는 create_stub_server 참고)."""
+    server = create_stub_server(port, market, certfile, keyfile, **options)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Yahoo Finance 호환 로컬 스텁 서버")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--certfile", help="HTTPS 인증서 (PEM)")
+    parser.add_argument("--keyfile", help="HTTPS 개인키 (PEM)")
+    parser.add_argument("--latency", type=float, default=0.0, help="응답 지연 (초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="추가 무작위 지연 최대값 (초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="503 응답 비율")
+    parser.add_argument("--rate-limit", type=float, help="초당 허용 요청 수 (넘으면 429)")
+    parser.add_argument("--stream-interval", type=float, default=0.2, help="스트림 이벤트 간격 (초)")
+    parser.add_argument("--stream-drop-rate", type=float, default=0.0, help="스트림 순번 누락 비율")
+    parser.add_argument("--stream-max-events", type=int, help="스트림 연결당 최대 이벤트 수")
+    args = parser.parse_args()
+
+    server = create_stub_server(args.port, certfile=args.certfile, keyfile=args.keyfile,
+                                latency=args.latency, jitter=args.jitter,
+                                error_rate=args.error_rate, rate_limit=args.rate_limit,
+                                stream_interval=args.stream_interval, stream_drop_rate=args.stream_drop_rate,
+                                stream_max_events=args.stream_max_events)
+    print(f"Yahoo stub listening on {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
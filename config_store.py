@@ -0,0 +1,264 @@
+"""
+===================================================================================
+Config Store (위젯 설정 저장소)
+===================================================================================
+목적: widget_config.json을 메모리에 들고 있다가 바뀐 내용을 모아서 저장합니다.
+
+    - set()/update()는 메모리 값만 바꾸고 저장 타이머를 다시 시작합니다 (디바운스).
+      창을 드래그하는 동안 위치가 수백 번 바뀌어도 파일은 멈춘 뒤 한 번만 씁니다.
+    - 파일 쓰기는 별도 스레드에서 하므로 GUI가 디스크를 기다리지 않습니다.
+    - 임시 파일에 쓴 뒤 교체(os.replace)하므로 쓰는 도중 꺼져도 기존 파일이 깨지지 않습니다.
+    - 다른 프로그램(메모장 등)이 파일을 고치면 다시 읽어서 changed 시그널로 알립니다.
+    - 깨진 파일은 조용히 기본값으로 덮어쓰지 않고 .corrupt 파일로 옮겨 둔 뒤 경고합니다.
+===================================================================================
+"""
+
+import copy
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt5.QtCore import QObject, QTimer, QFileSystemWatcher, pyqtSignal
+
+
+CONFIG_FILE = 'widget_config.json'
+
+DEFAULT_CONFIG = {
+    "currency": "USD/KRW",
+    "pos_x": 100,
+    "pos_y": 100,
+    "alerts": []
+}
+
+SAVE_DELAY_MS = 500     # 마지막 변경 후 이만큼 조용하면 저장
+RELOAD_DELAY_MS = 200   # 외부 편집기는 여러 번에 나눠 쓰므로 잠깐 기다렸다가 읽음
+
+
+class ConfigError(Exception):
+    """설정 파일을 해석할 수 없음 (JSON 오류 또는 최상위가 객체가 아님)"""
+
+
+def read_config(path):
+    """
+    설정 파일을 읽습니다.
+
+    Returns:
+        dict: 파일 내용 (파일이 없으면 None)
+
+    Raises:
+        ConfigError: 파일이 깨진 경우
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        raise ConfigError(str(e))
+    if not isinstance(data, dict):
+        raise ConfigError(f"top level is {type(data).__name__}, not an object")
+    return data
+
+
+def write_atomic(path, text):
+    """같은 폴더의 임시 파일에 쓴 뒤 교체합니다 (쓰는 도중 꺼져도 기존 파일 유지)."""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.widget_config-', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class ConfigStore(QObject):
+    """
+    디바운스 + 원자적 쓰기 + 외부 편집 감지를 하는 설정 저장소
+
+    GUI 스레드에서만 사용합니다 (파일 쓰기만 작업 스레드에서 함).
+
+    시그널 (Signals):
+        - changed: 외부 편집으로 바뀐 키 목록 (set)
+
+    Attributes:
+        load_error (str): 시작할 때 파일이 깨져 있었다면 그 내용 (없으면 None)
+        backup_path (str): 깨진 파일을 옮겨 둔 경로
+    """
+
+    changed = pyqtSignal(object)
+
+    def __init__(self, path=CONFIG_FILE, defaults=DEFAULT_CONFIG, delay_ms=SAVE_DELAY_MS, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.defaults = defaults
+        self.load_error = None
+        self.backup_path = None
+
+        self._pending = set()     # 저장 전에 바뀐 키 (외부 편집보다 우선)
+        self._last_text = None    # 마지막으로 쓴(또는 읽은) 파일 내용 - 자기 쓰기 알림 무시용
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="config-writer")
+        self._write = None        # 마지막 쓰기 작업 (Future)
+
+        self._data = self.load()
+
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(delay_ms)
+        self._save_timer.timeout.connect(self.flush)
+
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(RELOAD_DELAY_MS)
+        self._reload_timer.timeout.connect(self.reload)
+
+        # 파일이 교체(os.replace)되면 감시가 풀리는 OS가 있어 폴더도 함께 감시
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self.on_file_changed)
+        self._watcher.directoryChanged.connect(self.on_directory_changed)
+        self._watcher.addPath(os.path.dirname(os.path.abspath(path)))
+        self._watch_file()
+
+    # --- 읽기 / 쓰기 (메모리) ---
+    def get(self, key, default=None):
+        value = self._data.get(key, default)
+        # 목록/딕셔너리는 복사본을 돌려줌 (밖에서 고쳐도 저장되지 않는 문제 방지)
+        return copy.deepcopy(value) if isinstance(value, (list, dict)) else value
+
+    def set(self, key, value):
+        self.update({key: value})
+
+    def update(self, values):
+        """
+        여러 값을 한 번에 바꿉니다. 실제로 바뀐 값이 있을 때만 저장을 예약합니다.
+
+        Args:
+            values (dict): 키 -> 새 값
+        """
+        dirty = False
+        for key, value in values.items():
+            if self._data.get(key) != value:
+                self._data[key] = copy.deepcopy(value)
+                self._pending.add(key)
+                dirty = True
+        if dirty:
+            self._save_timer.start()  # 이미 돌고 있으면 처음부터 다시
+
+    # --- 파일 ---
+    def load(self):
+        """
+        파일을 읽어 기본값 위에 덮어씁니다.
+
+        깨진 파일은 <이름>.corrupt-<시각>으로 옮기고 기본값으로 시작합니다
+        (다음 저장이 깨진 파일을 덮어써서 원래 내용을 잃지 않도록).
+        """
+        data = copy.deepcopy(self.defaults)
+        try:
+            loaded = read_config(self.path)
+        except ConfigError as e:
+            self.load_error = str(e)
+            self.backup_path = f"{self.path}.corrupt-{time.strftime('%Y%m%d-%H%M%S')}"
+            try:
+                os.replace(self.path, self.backup_path)
+            except OSError:
+                self.backup_path = None
+            print(f"Config Load Failed: {e} (backup: {self.backup_path})")
+            return data
+
+        if loaded is not None:
+            data.update(loaded)
+            self._last_text = self._dump(loaded)
+        return data
+
+    def flush(self, wait=False):
+        """
+        바뀐 내용을 지금 저장합니다 (저장 타이머가 만료되면 자동 호출).
+
+        Args:
+            wait (bool): True면 파일 쓰기가 끝날 때까지 기다림 (프로그램 종료 시)
+        """
+        self._save_timer.stop()
+        if self._pending:
+            # 직렬화는 GUI 스레드에서 (작업 스레드와 딕셔너리를 공유하지 않도록)
+            text = self._dump(self._data)
+            self._pending.clear()
+            self._last_text = text
+            self._write = self._writer.submit(self._write_file, text)
+        if wait and self._write is not None:
+            self._write.result()
+
+    def _write_file(self, text):
+        # 작업 스레드
+        try:
+            write_atomic(self.path, text)
+        except OSError as e:
+            print(f"Config Save Failed: {e}")
+
+    @staticmethod
+    def _dump(data):
+        return json.dumps(data, indent=4, ensure_ascii=False)
+
+    # --- 외부 편집 감지 ---
+    def _watch_file(self):
+        """파일 감시를 (다시) 겁니다. 새로 걸었으면 True"""
+        if os.path.exists(self.path) and self.path not in self._watcher.files():
+            return self._watcher.addPath(self.path)
+        return False
+
+    def on_file_changed(self, _path):
+        self._watch_file()
+        self._reload_timer.start()
+
+    def on_directory_changed(self, _path):
+        # 폴더의 다른 파일(quote_cache.json 등)이 바뀐 경우는 무시하고
+        # 설정 파일이 교체/새로 생겨 감시가 풀렸던 경우만 다시 읽음
+        if self._watch_file():
+            self._reload_timer.start()
+
+    def reload(self):
+        """파일이 밖에서 바뀌었으면 다시 읽고 바뀐 키를 changed로 알립니다."""
+        if self._write is not None and not self._write.done():
+            self._reload_timer.start()  # 우리 쓰기가 끝난 뒤에 비교
+            return
+        try:
+            loaded = read_config(self.path)
+        except ConfigError as e:
+            # 편집 중인 파일일 수 있으므로 옮기지 않고 메모리 값을 유지 (다음 저장 때 정상 내용으로 덮임)
+            print(f"Config Reload Skipped: {e}")
+            return
+        if loaded is None:
+            return
+
+        text = self._dump(loaded)
+        if text == self._last_text:
+            return  # 우리가 쓴 내용 (또는 내용 변화 없음)
+        self._last_text = text
+
+        keys = set()
+        for key, value in loaded.items():
+            if key in self._pending:
+                continue  # 아직 저장하지 않은 위젯 쪽 변경이 우선
+            if self._data.get(key) != value:
+                self._data[key] = value
+                keys.add(key)
+        if keys:
+            self.changed.emit(keys)
+
+
+_shared_config = None
+
+
+def shared_config():
+    """같은 프로세스의 위젯들이 함께 쓰는 설정 저장소 (widget_config.json)"""
+    global _shared_config
+    if _shared_config is None:
+        _shared_config = ConfigStore()
+    return _shared_config
@@ -0,0 +1,196 @@
+"""
+===================================================================================
+Cross Rates (교차 환율)
+===================================================================================
+목적: 이미 조회 중인 티커(다리, leg)들을 곱하고 나눠서 다른 통화 쌍을 계산합니다.
+      파생 통화 쌍은 야후에 따로 요청하지 않으므로 네트워크 비용이 없습니다.
+
+    예: BTC/KRW = BTC-USD(BTC->USD) x KRW=X(USD->KRW)
+        USD/JPY = KRW=X(USD->KRW) / JPYKRW=X(JPY->KRW)
+
+파생 티커는 "기준/표시" 형식("BTC/KRW")으로 씁니다 ("/"가 있으면 파생 티커).
+통화를 노드, 다리 티커를 양방향 간선으로 보는 그래프에서 너비 우선 탐색으로
+가장 적은 다리를 거치는 경로를 고릅니다.
+파생 시세의 시각은 다리 중 가장 오래된 시각이고, 다리 중 하나라도 캐시 값이면 stale입니다.
+===================================================================================
+"""
+
+from array import array
+from bisect import bisect_right
+from collections import deque
+
+from quote_decode import Quote
+
+
+# 파생 통화 쌍 계산에 쓸 수 있는 다리 (위젯이 이미 조회하는 티커 - exchange_widget.CURRENCY_MAP)
+LEG_TICKERS = ("KRW=X", "JPYKRW=X", "BTC-USD", "ETH-USD")
+
+
+def is_derived(ticker):
+    return "/" in ticker
+
+
+def leg_currencies(ticker):
+    """
+    야후 티커 -> (기준 통화, 표시 통화). 가격은 "기준 통화 1단위 = 표시 통화 몇"
+
+    예: "KRW=X" -> ("USD", "KRW"), "JPYKRW=X" -> ("JPY", "KRW"), "BTC-USD" -> ("BTC", "USD")
+
+    Returns:
+        tuple: (기준, 표시) 또는 None (해석할 수 없는 티커)
+    """
+    if ticker.endswith("=X"):
+        body = ticker[:-2]
+        if len(body) == 3:
+            return "USD", body       # 야후는 USD 기준 환율을 통화 코드만 써서 표시
+        if len(body) == 6:
+            return body[:3], body[3:]
+    elif "-" in ticker:
+        base, _, quote = ticker.partition("-")
+        if base and quote:
+            return base, quote
+    return None
+
+
+def find_path(base, quote, tickers):
+    """
+    base -> quote로 가는 가장 짧은 환산 경로를 찾습니다.
+
+    Args:
+        base, quote (str): 통화 코드
+        tickers (iterable): 쓸 수 있는 다리 티커 (앞쪽 티커를 먼저 탐색)
+
+    Returns:
+        list: [(다리 티커, 역수 여부)] 또는 None (경로 없음)
+    """
+    graph = {}
+    for ticker in tickers:
+        pair = leg_currencies(ticker)
+        if pair:
+            graph.setdefault(pair[0], []).append((pair[1], ticker, False))
+            graph.setdefault(pair[1], []).append((pair[0], ticker, True))
+
+    previous = {base: None}   # 통화 -> (이전 통화, 티커, 역수 여부)
+    queue = deque([base])
+    while queue:
+        currency = queue.popleft()
+        if currency == quote:
+            break
+        for neighbor, ticker, inverted in graph.get(currency, ()):
+            if neighbor not in previous:
+                previous[neighbor] = (currency, ticker, inverted)
+                queue.append(neighbor)
+
+    if quote not in previous or base == quote:
+        return None
+    path = []
+    currency = quote
+    while previous[currency] is not None:
+        currency, ticker, inverted = previous[currency]
+        path.append((ticker, inverted))
+    return path[::-1]
+
+
+class CrossRates:
+    """
+    파생 티커별 경로를 기억하고, 다리 시세로 파생 시세/분봉을 계산합니다.
+
+    Args:
+        legs (tuple): 기본으로 쓸 수 있는 다리 티커
+    """
+
+    def __init__(self, legs=LEG_TICKERS):
+        self.legs = tuple(legs)
+        self.paths = {}   # 파생 티커 -> [(다리 티커, 역수 여부)]
+
+    def resolve(self, ticker, preferred=()):
+        """
+        파생 티커의 경로를 정합니다 (한 번 정하면 유지).
+
+        Args:
+            ticker (str): "BTC/KRW" 형식
+            preferred (iterable): 이미 구독 중인 티커 (같은 길이면 이쪽 경로를 씀)
+
+        Returns:
+            list: [(다리 티커, 역수 여부)] 또는 None
+        """
+        path = self.paths.get(ticker)
+        if path is None:
+            base, _, quote = ticker.partition("/")
+            candidates = list(dict.fromkeys([t for t in preferred if not is_derived(t)] + list(self.legs)))
+            path = find_path(base, quote, candidates)
+            if path:
+                self.paths[ticker] = path
+        return path
+
+    def legs_of(self, ticker):
+        return [leg for leg, _ in self.paths.get(ticker, ())]
+
+    def dependents(self, legs, derived):
+        """derived 중 legs 가운데 하나라도 거치는 파생 티커"""
+        legs = set(legs)
+        return [ticker for ticker in derived if legs.intersection(self.legs_of(ticker))]
+
+    def combine(self, ticker, quotes):
+        """
+        다리 시세로 파생 시세를 계산합니다.
+
+        Args:
+            ticker (str): 파생 티커
+            quotes (dict): 다리 티커 -> Quote (없는 다리가 있으면 None을 돌려줌)
+
+        Returns:
+            Quote: 파생 시세 또는 None
+        """
+        path = self.paths.get(ticker)
+        if not path:
+            return None
+        price, prev_close = 1.0, 1.0
+        timestamps, stale = [], False
+        for leg, inverted in path:
+            quote = quotes.get(leg)
+            if quote is None or not quote.price or not quote.prev_close:
+                return None
+            if inverted:
+                price /= quote.price
+                prev_close /= quote.prev_close
+            else:
+                price *= quote.price
+                prev_close *= quote.prev_close
+            timestamps.append(quote.timestamp)
+            stale = stale or quote.stale
+        return Quote(ticker, price, price - prev_close, prev_close, min(timestamps), stale)
+
+    def combine_series(self, ticker, series):
+        """
+        다리 분봉으로 파생 분봉을 계산합니다.
+
+        첫 다리의 봉 시각마다 다른 다리는 그 시각 이전의 마지막 종가를 씁니다
+        (외환과 암호화폐는 봉이 비는 분이 서로 달라 시각이 정확히 겹치지 않음).
+
+        Args:
+            ticker (str): 파생 티커
+            series (dict): 다리 티커 -> (array 시각, array 종가)
+
+        Returns:
+            tuple: (array('q') 시각, array('d') 종가)
+        """
+        out_ts, out_closes = array('q'), array('d')
+        path = self.paths.get(ticker)
+        if not path:
+            return out_ts, out_closes
+
+        (first, first_inverted), rest = path[0], path[1:]
+        timestamps, closes = series.get(first, ((), ()))
+        for ts, close in zip(timestamps, closes):
+            value = 1.0 / close if first_inverted else close
+            for leg, inverted in rest:
+                leg_ts, leg_closes = series.get(leg, ((), ()))
+                i = bisect_right(leg_ts, ts) - 1
+                if i < 0:
+                    break
+                value = value / leg_closes[i] if inverted else value * leg_closes[i]
+            else:
+                out_ts.append(ts)
+                out_closes.append(value)
+        return out_ts, out_closes
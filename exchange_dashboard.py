@@ -0,0 +1,169 @@
+import sys
+from PyQt5.QtWidgets import QApplication, QWidget, QFrame, QLabel, QVBoxLayout, QGridLayout, QMenu
+from PyQt5.QtCore import Qt, QPoint
+
+from quote_hub import shared_quote_source
+from config_store import shared_config
+from exchange_widget import CURRENCY_MAP
+from ui_render import set_text, set_state, trend_of, RepaintCounter
+
+# 대시보드 전체 스타일 (창에 한 번만 적용, 변동폭 색상은 trend 속성으로 전환)
+STYLE_SHEET = """
+ExchangeDashboard { background-color: #1E1E1E; }
+QFrame#cell { background-color: #262626; border-radius: 6px; }
+QLabel#title { color: #AAAAAA; font-size: 11px; font-weight: bold; }
+QLabel#rate { color: white; font-size: 20px; font-weight: bold; font-family: 'Segoe UI'; }
+QLabel#change { color: white; font-size: 13px; }
+QLabel#change[trend="up"] { color: #FF5555; font-weight: bold; }
+QLabel#change[trend="down"] { color: #5555FF; font-weight: bold; }
+"""
+
+# ==========================================
+# 1. 시세 셀 (Quote Cell)
+#    - 통화 쌍 하나의 이름 / 환율 / 변동폭을 표시합니다.
+#    - 표시 중인 값과 같으면 아무것도 다시 그리지 않습니다.
+# ==========================================
+class QuoteCell(QFrame):
+    ARROWS = {"up": "▲", "down": "▼", "flat": "-"}
+
+    def __init__(self, pair, parent=None):
+        super().__init__(parent)
+        self.pair = pair
+        self.shown = None      # 표시 중인 (가격, 변동폭, stale)
+
+        self.setObjectName("cell")
+        layout = QVBoxLayout()
+        layout.setContentsMargins(10, 6, 10, 6)
+        layout.setSpacing(2)
+        self.setLayout(layout)
+
+        self.lbl_title = QLabel(pair)
+        self.lbl_title.setObjectName("title")
+        layout.addWidget(self.lbl_title)
+
+        self.lbl_rate = QLabel("Loading...")
+        self.lbl_rate.setObjectName("rate")
+        layout.addWidget(self.lbl_rate)
+
+        self.lbl_change = QLabel("-")
+        self.lbl_change.setObjectName("change")
+        self.lbl_change.setProperty("trend", "flat")
+        layout.addWidget(self.lbl_change)
+
+    def set_quote(self, quote):
+        """
+        시세를 반영합니다. 표시 중인 값과 같으면 아무것도 하지 않습니다.
+
+        Returns:
+            bool: 화면이 바뀌었으면 True
+        """
+        state = (quote.price, quote.change, quote.stale)
+        if state == self.shown:
+            return False
+        self.shown = state
+
+        # 셀 안에서도 바뀐 라벨만 갱신 (색상은 방향이 바뀔 때만 다시 적용)
+        trend = trend_of(quote.change)
+        set_text(self.lbl_title, f"{self.pair} (stale)" if quote.stale else self.pair)
+        set_text(self.lbl_rate, f"{quote.price:,.2f}")
+        set_text(self.lbl_change, f"{self.ARROWS[trend]} {abs(quote.change):,.2f}")
+        set_state(self.lbl_change, "trend", trend)
+        return True
+
+    def labels(self):
+        return self.lbl_title, self.lbl_rate, self.lbl_change
+
+# ==========================================
+# 2. 대시보드 (Dashboard)
+#    - 여러 통화 쌍을 격자로 한 화면에 표시합니다.
+#    - 셀마다 워커를 두지 않고 공용 시세 공급원(허브 또는 QuoteEngine) 하나의 배치 조회를 나눠 씁니다.
+# ==========================================
+class ExchangeDashboard(QWidget):
+    COLUMNS = 2
+
+    def __init__(self, pairs=None):
+        super().__init__()
+
+        # 표시할 통화 쌍 (설정 파일의 dashboard_pairs, 없으면 지원 통화 전체)
+        self.config = shared_config()
+        pairs = pairs or self.config.get("dashboard_pairs") or list(CURRENCY_MAP)
+        self.pairs = [p for p in pairs if p in CURRENCY_MAP]
+
+        self.cells = {}  # 티커 -> QuoteCell
+        self.subscribed = False
+        self.initUI()
+
+        # 공용 시세 엔진 연결 (셀이 몇 개든 조회 루프는 하나)
+        self.engine = shared_quote_source()
+        self.engine.quote_updated.connect(self.on_quote)
+        self.engine.poll_finished.connect(self.repaints.tick)
+
+    def initUI(self):
+        self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool)
+        self.setAttribute(Qt.WA_StyledBackground)
+        self.setStyleSheet(STYLE_SHEET)
+        self.setWindowTitle("Exchange Dashboard")
+
+        layout = QGridLayout()
+        layout.setContentsMargins(10, 10, 10, 10)
+        layout.setSpacing(8)
+        self.setLayout(layout)
+
+        for i, pair in enumerate(self.pairs):
+            cell = QuoteCell(pair)
+            self.cells[CURRENCY_MAP[pair]] = cell
+            layout.addWidget(cell, i // self.COLUMNS, i % self.COLUMNS)
+
+        # 조회 한 번에 셀 라벨이 몇 번 다시 그려지는지 계측 (RENDER_STATS=1 이면 출력)
+        self.repaints = RepaintCounter(
+            "dashboard", (label for cell in self.cells.values() for label in cell.labels()), parent=self)
+
+    def on_quote(self, quote):
+        # 딕셔너리 조회 한 번으로 해당 셀만 갱신 (구독하지 않은 티커는 무시)
+        cell = self.cells.get(quote.ticker)
+        if cell:
+            cell.set_quote(quote)
+
+    # 우클릭 메뉴
+    def contextMenuEvent(self, event):
+        menu = QMenu(self)
+        close_action = menu.addAction("닫기 (Close)")
+        if menu.exec_(self.mapToGlobal(event.pos())) == close_action:
+            self.close()
+
+    # 보이는 동안만 구독 (닫았다가 다시 열 수 있음)
+    def showEvent(self, event):
+        if not self.subscribed:
+            self.subscribed = True
+            for ticker in self.cells:
+                self.engine.subscribe(ticker)
+        super().showEvent(event)
+
+    def closeEvent(self, event):
+        # 구독만 해제 (엔진은 다른 위젯과 공유하므로 멈추지 않음)
+        if self.subscribed:
+            self.subscribed = False
+            for ticker in self.cells:
+                self.engine.unsubscribe(ticker)
+        event.accept()
+
+    # 창 드래그 이동 로직
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            self.oldPos = event.globalPos()
+
+    def mouseMoveEvent(self, event):
+        if event.buttons() == Qt.LeftButton:
+            delta = QPoint(event.globalPos() - self.oldPos)
+            self.move(self.x() + delta.x(), self.y() + delta.y())
+            self.oldPos = event.globalPos()
+
+if __name__ == '__main__':
+    app = QApplication(sys.argv)
+    dashboard = ExchangeDashboard()
+    dashboard.show()
+    exit_code = app.exec_()
+
+    shared_quote_source().stop()
+    shared_quote_source().wait(1.0)
+    sys.exit(exit_code)
@@ -1,108 +1,57 @@
 import sys
-import requests
-import json
-import os
-import time
 from PyQt5.QtWidgets import (QApplication, QWidget, QLabel, QVBoxLayout, 
-                             QMenu, QSystemTrayIcon, QAction, qApp)
-from PyQt5.QtCore import Qt, QPoint, QThread, pyqtSignal
+                             QMenu, QSystemTrayIcon, QAction, QInputDialog, qApp)
+from PyQt5.QtCore import Qt, QPoint
 from PyQt5.QtGui import QIcon, QCursor
 
+from config_store import shared_config
+from quote_hub import shared_quote_source, run_hub, HUB_FLAG
+from sparkline import Sparkline
+from ui_render import set_text, set_state, trend_of, RepaintCounter
+from alert_engine import AlertEngine, AlertRule
+from metrics_overlay import MetricsOverlay
+
 # ==========================================
-# 1. 설정 관리자 (Config Manager)
-#    - 사용자의 마지막 위치, 선택한 통화를 기억합니다.
+# 1. 설정
+#    - 사용자의 마지막 위치, 선택한 통화, 가격 알림 규칙은 config_store.ConfigStore가 기억합니다.
+#    - 값을 바꾸면 메모리에만 반영되고, 잠시 뒤 한 번에 파일로 저장됩니다 (드래그 중 디스크 쓰기 없음).
 # ==========================================
-class ConfigManager:
-    CONFIG_FILE = 'widget_config.json'
-    DEFAULT_CONFIG = {
-        "currency": "USD/KRW",
-        "pos_x": 100,
-        "pos_y": 100
-    }
-
-    @classmethod
-    def load(cls):
-        if not os.path.exists(cls.CONFIG_FILE):
-            return cls.DEFAULT_CONFIG
-        try:
-            with open(cls.CONFIG_FILE, 'r') as f:
-                return json.load(f)
-        except:
-            return cls.DEFAULT_CONFIG
-
-    @classmethod
-    def save(cls, config_data):
-        try:
-            with open(cls.CONFIG_FILE, 'w') as f:
-                json.dump(config_data, f, indent=4)
-        except Exception as e:
-            print(f"Config Save Failed: {e}")
 
 # ==========================================
-# 2. 데이터 워커 (Worker Thread)
-#    - UI와 분리되어 백그라운드에서 데이터를 가져옵니다.
-#    - Non-blocking Sleep을 구현하여 즉시 종료가 가능합니다.
+# 2. 지원 통화 (Currency Map)
+#    - 시세 조회는 공용 QuoteEngine(여러 창이 떠 있으면 quote_hub 프로세스)이 한 번의 요청으로 처리합니다.
 # ==========================================
-class ExchangeWorker(QThread):
-    rate_updated = pyqtSignal(float, float, str, str) # price, change, pair, symbol
-    error_occurred = pyqtSignal(str)
-
-    # 지원 통화 및 야후 파이낸스 티커 매핑
-    CURRENCY_MAP = {
-        "USD/KRW": "KRW=X",
-        "JPY/KRW": "JPYKRW=X",
-        "BTC/USD": "BTC-USD",
-        "ETH/USD": "ETH-USD"
-    }
-
-    def __init__(self, currency_pair, parent=None):
-        super().__init__(parent)
-        self.currency_pair = currency_pair
-        self.running = True
-
-    def run(self):
-        ticker = self.CURRENCY_MAP.get(self.currency_pair)
-        if not ticker:
-            self.error_occurred.emit("Unsupported Pair")
-            return
+# 지원 통화 및 야후 파이낸스 티커 매핑
+# "/"가 있는 티커는 위 티커들로 계산하는 교차 환율이라 추가 요청이 없습니다 (cross_rates.py 참고)
+CURRENCY_MAP = {
+    "USD/KRW": "KRW=X",
+    "JPY/KRW": "JPYKRW=X",
+    "BTC/USD": "BTC-USD",
+    "ETH/USD": "ETH-USD",
+    "BTC/KRW": "BTC/KRW",   # BTC-USD x KRW=X
+    "ETH/KRW": "ETH/KRW",   # ETH-USD x KRW=X
+    "USD/JPY": "USD/JPY",   # KRW=X / JPYKRW=X
+}
 
-        while self.running:
-            try:
-                # 야후 파이낸스 비공식 API 사용 (상용화 시 유료 API 권장)
-                url = f"https://query1.finance.yahoo.com/v8/finance/chart/{ticker}?interval=1m&range=1d"
-                headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/120.0.0.0 Safari/537.36'}
-                
-                response = requests.get(url, headers=headers, timeout=5)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    result = data.get('chart', {}).get('result', [])
-                    if result:
-                        meta = result[0]['meta']
-                        price = meta['regularMarketPrice']
-                        prev_close = meta['chartPreviousClose']
-                        change = price - prev_close
-                        
-                        # 성공 시 데이터 전송
-                        self.rate_updated.emit(price, change, self.currency_pair, ticker)
-                    else:
-                        self.error_occurred.emit("Data Error")
-                else:
-                    self.error_occurred.emit(f"HTTP {response.status_code}")
-
-            except Exception as e:
-                self.error_occurred.emit("Network Error")
-
-            # [핵심 개선] 좀비 프로세스 방지 (Smart Sleep)
-            # 60초를 통으로 쉬지 않고, 0.5초마다 종료 신호(self.running)를 체크함
-            # 앱 종료 시 즉시 루프를 탈출하여 스레드가 안전하게 종료됨
-            for _ in range(120): 
-                if not self.running: break
-                self.msleep(500)
-
-    def stop(self):
-        self.running = False
-        self.wait() # 스레드가 완전히 끝날 때까지 대기
+# 추세 차트 기간: 코드 -> (메뉴 이름, 기간(초))
+#    - 당일은 엔진의 1분봉 링 버퍼, 1주/1개월은 시세 기록(quote_history.db)에서 읽습니다.
+#    - 기록이 아직 없으면(처음 실행, QUOTE_HISTORY=0) 당일 분봉을 보여줍니다.
+CHART_RANGES = {
+    "1D": ("당일", None),
+    "1W": ("1주", 7 * 86400),
+    "1M": ("1개월", 30 * 86400),
+}
+HISTORY_POINTS = 300   # 기록에서 읽을 최대 점 수 (스파크라인 폭보다 조금 많게)
+
+# 위젯 전체 스타일 (한 번만 적용, 색상은 trend 속성으로 전환)
+STYLE_SHEET = """
+QLabel#title { color: #AAAAAA; font-size: 12px; font-weight: bold; }
+QLabel#rate { color: white; font-size: 24px; font-weight: bold; font-family: 'Segoe UI'; }
+QLabel#change { color: white; font-size: 14px; }
+QLabel#change[trend="up"] { color: #FF5555; font-weight: bold; }
+QLabel#change[trend="down"] { color: #5555FF; font-weight: bold; }
+QLabel#change[trend="error"] { color: orange; font-size: 12px; }
+"""
 
 # ==========================================
 # 3. 메인 위젯 (Ghost Widget)
@@ -112,23 +61,48 @@ class GhostExchangeWidget(QWidget):
     def __init__(self):
         super().__init__()
         
-        # 설정 불러오기
-        self.config = ConfigManager.load()
+        # 설정 불러오기 (메모장 등으로 파일을 고치면 changed로 알려줌)
+        self.config = shared_config()
+        self.config.changed.connect(self.on_config_changed)
         self.current_pair = self.config.get("currency", "USD/KRW")
+        self.chart_range = self.config.get("chart_range", "1D")
+        if self.chart_range not in CHART_RANGES:
+            self.chart_range = "1D"
         
-        self.worker = None
+        self.current_ticker = None
+        self.last_quote = None  # 현재 표시 중인 시세 (네트워크 오류 시 계속 표시)
         self.tray_icon = None
+        self.dashboard = None   # 대시보드 창 (처음 열 때 생성)
+        self.overlay = None     # 디버그 정보 창 (처음 열 때 생성)
         
         self.initUI()
         self.initTray()
         
-        # 시작하자마자 워커 가동
-        self.start_worker(self.current_pair)
+        if self.config.load_error:
+            self.tray_icon.showMessage("설정 파일 오류",
+                                       f"설정 파일을 읽을 수 없어 기본값으로 시작합니다.\n원본: {self.config.backup_path}",
+                                       QSystemTrayIcon.Warning, 5000)
+        
+        # 공용 시세 엔진 연결 후 현재 통화 표시
+        self.engine = shared_quote_source()
+        self.engine.quote_updated.connect(self.on_quote)
+        self.engine.series_updated.connect(self.on_series)
+        self.engine.error_occurred.connect(self.on_error)
+        self.engine.poll_finished.connect(self.repaints.tick)
+        
+        # 가격 알림 (규칙은 설정 파일의 alerts 목록, 발동 시 트레이 알림)
+        self.alerts = AlertEngine.from_config(self.config.get("alerts"), parent=self)
+        self.alerts.alert_triggered.connect(self.on_alert)
+        self.engine.quote_updated.connect(self.alerts.on_quote)
+        
+        self.bind_pair(self.current_pair)
+        self.prefetch_all()
 
     def initUI(self):
         # 윈도우 설정 (투명, 테두리 없음, 항상 위)
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool)
         self.setAttribute(Qt.WA_TranslucentBackground)
+        self.setStyleSheet(STYLE_SHEET)
         
         # 마지막 저장된 위치로 이동
         self.move(self.config.get("pos_x", 100), self.config.get("pos_y", 100))
@@ -139,23 +113,32 @@ class GhostExchangeWidget(QWidget):
         
         # 1. 타이틀 (통화 쌍)
         self.lbl_title = QLabel(self.current_pair)
-        self.lbl_title.setStyleSheet("color: #AAAAAA; font-size: 12px; font-weight: bold;")
+        self.lbl_title.setObjectName("title")
         self.lbl_title.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.lbl_title)
         
         # 2. 환율 (메인 숫자)
         self.lbl_rate = QLabel("Connecting...")
-        self.lbl_rate.setStyleSheet("color: white; font-size: 24px; font-weight: bold; font-family: 'Segoe UI';")
+        self.lbl_rate.setObjectName("rate")
         self.lbl_rate.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.lbl_rate)
         
         # 3. 변동폭
         self.lbl_change = QLabel("-")
-        self.lbl_change.setStyleSheet("color: white; font-size: 14px;")
+        self.lbl_change.setObjectName("change")
+        self.lbl_change.setProperty("trend", "flat")
         self.lbl_change.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.lbl_change)
         
-        self.resize(220, 110)
+        # 4. 추세 (당일 1분봉 또는 기록에서 읽은 1주/1개월 스파크라인)
+        self.sparkline = Sparkline()
+        self.sparkline.setFixedHeight(24)
+        layout.addWidget(self.sparkline)
+        
+        self.resize(220, 135)
+        
+        # 조회 한 번에 라벨이 몇 번 다시 그려지는지 계측 (RENDER_STATS=1 이면 출력)
+        self.repaints = RepaintCounter("ghost", (self.lbl_title, self.lbl_rate, self.lbl_change), parent=self)
 
     def initTray(self):
         # 시스템 트레이 아이콘 설정
@@ -181,46 +164,97 @@ class GhostExchangeWidget(QWidget):
         self.tray_icon.activated.connect(self.on_tray_click) # 더블클릭 이벤트 연결
         self.tray_icon.show()
 
-    # --- Worker 관리 ---
-    def start_worker(self, currency_pair):
-        # 기존 워커가 돌고 있다면 정지
-        if self.worker:
-            self.worker.stop()
-        
-        # UI 초기화 상태로 변경
-        self.lbl_rate.setText("Loading...")
-        self.lbl_change.setText("-")
-        self.lbl_title.setText(currency_pair)
-        
-        # 새 워커 시작
-        self.worker = ExchangeWorker(currency_pair)
-        self.worker.rate_updated.connect(self.update_ui)
-        self.worker.error_occurred.connect(self.display_error)
-        self.worker.start()
-
-    def update_ui(self, price, change, pair, ticker):
-        self.lbl_title.setText(pair)
-        self.lbl_rate.setText(f"{price:,.2f}")
-        
-        # 색상 로직: 상승(빨강), 하락(파랑), 변동없음(흰색)
-        if change > 0:
-            self.lbl_change.setText(f"▲ {change:,.2f}")
-            self.lbl_change.setStyleSheet("color: #FF5555; font-size: 14px; font-weight: bold;")
-        elif change < 0:
-            self.lbl_change.setText(f"▼ {abs(change):,.2f}")
-            self.lbl_change.setStyleSheet("color: #5555FF; font-size: 14px; font-weight: bold;")
+    # --- 시세 구독 관리 ---
+    def prefetch_all(self):
+        # 지원 통화 전체를 미리 구독 (배치 요청 한 번이라 추가 비용이 거의 없음)
+        # 통화 전환 시 새 조회를 기다리지 않고 이미 받은 값을 바로 표시할 수 있음
+        for ticker in CURRENCY_MAP.values():
+            self.engine.subscribe(ticker)
+
+    def bind_pair(self, currency_pair):
+        ticker = CURRENCY_MAP.get(currency_pair)
+        if not ticker:
+            self.display_error("Unsupported Pair")
+            return
+        
+        self.current_ticker = ticker
+        self.last_quote = None
+        set_text(self.lbl_title, currency_pair)
+        
+        # 이미 받아 둔 값(최신 또는 캐시)이 있으면 바로 표시
+        quote = self.engine.latest(ticker)
+        if quote:
+            self.on_quote(quote)
+        else:
+            set_text(self.lbl_rate, "Loading...")
+            set_text(self.lbl_change, "-")
+            set_state(self.lbl_change, "trend", "flat")
+        self.on_series(ticker)
+
+    def on_quote(self, quote):
+        # 엔진은 모든 구독 티커의 시세를 보내므로 현재 티커만 골라서 표시
+        if quote.ticker == self.current_ticker:
+            self.last_quote = quote
+            self.update_ui(quote.price, quote.change, self.current_pair, quote.ticker, quote.stale)
+
+    def on_series(self, ticker):
+        # 새 분봉이 생기면 현재 티커 시계열을 받아 다시 그림
+        if ticker != self.current_ticker:
+            return
+        seconds = CHART_RANGES[self.chart_range][1]
+        if seconds:
+            # 1주/1개월: 기록에서 기간에 맞는 단위(1시간봉 등)로 솎아서 읽음 (전일 종가 기준선 없음)
+            _, closes = self.engine.history_series(ticker, seconds, HISTORY_POINTS)
+            if len(closes) >= 2:
+                self.sparkline.set_series(closes, slots=len(closes))
+                return
+        _, closes = self.engine.series(ticker)
+        baseline = self.last_quote.prev_close if self.last_quote else None
+        self.sparkline.set_series(closes, baseline)
+
+    def on_error(self, error):
+        if error.ticker not in (None, self.current_ticker):
+            return
+        
+        if error.kind == "http":
+            msg = str(error)
+        elif error.kind == "data":
+            msg = "Data Error"
+        else:
+            msg = "Network Error"
+        
+        # 보여줄 시세가 있으면 값은 그대로 두고 stale 표시만 (다음 조회 때 자동 복구)
+        if self.last_quote:
+            set_text(self.lbl_title, f"{self.current_pair} (stale)")
+            self.tray_icon.setToolTip(f"{self.current_pair}: {self.last_quote.price:,.2f} ({msg})")
         else:
-            self.lbl_change.setText(f"- {abs(change):,.2f}")
-            self.lbl_change.setStyleSheet("color: white; font-size: 14px;")
+            self.display_error(msg)
+
+    def on_alert(self, alert):
+        self.tray_icon.showMessage("가격 알림", alert.message, QSystemTrayIcon.Information, 5000)
+
+    def update_ui(self, price, change, pair, ticker, stale=False):
+        # 표시 중인 값과 같은 라벨은 건드리지 않음 (ui_render 참고)
+        # stale: 캐시에서 꺼낸 값이라 아직 최신이 아님
+        set_text(self.lbl_title, f"{pair} (stale)" if stale else pair)
+        set_text(self.lbl_rate, f"{price:,.2f}")
+        
+        # 색상 로직: 상승(빨강), 하락(파랑), 변동없음(흰색) - 색은 STYLE_SHEET의 trend 규칙
+        trend = trend_of(change)
+        arrow = {"up": "▲", "down": "▼", "flat": "-"}[trend]
+        set_text(self.lbl_change, f"{arrow} {abs(change):,.2f}")
+        set_state(self.lbl_change, "trend", trend)
             
         # 트레이 아이콘에 마우스 올리면 현재 환율 툴팁 표시
-        self.tray_icon.setToolTip(f"{pair}: {price:,.2f}")
+        tooltip = f"{pair}: {price:,.2f}"
+        if self.tray_icon.toolTip() != tooltip:
+            self.tray_icon.setToolTip(tooltip)
 
     def display_error(self, msg):
         # 에러 발생 시 UI 처리
-        self.lbl_rate.setText("Error")
-        self.lbl_change.setText("Retrying...")
-        self.lbl_change.setStyleSheet("color: orange; font-size: 12px;")
+        set_text(self.lbl_rate, "Error")
+        set_text(self.lbl_change, "Retrying...")
+        set_state(self.lbl_change, "trend", "error")
 
     # --- 이벤트 핸들러 ---
     def on_tray_click(self, reason):
@@ -241,7 +275,7 @@ class GhostExchangeWidget(QWidget):
         
         # 1. 통화 선택 서브메뉴 (동적 생성)
         currency_menu = menu.addMenu("통화 선택 (Currency)")
-        for pair in ExchangeWorker.CURRENCY_MAP.keys():
+        for pair in CURRENCY_MAP.keys():
             action = QAction(pair, self)
             action.setCheckable(True)
             if pair == self.current_pair:
@@ -251,9 +285,35 @@ class GhostExchangeWidget(QWidget):
             action.triggered.connect(lambda checked, p=pair: self.change_currency(p))
             currency_menu.addAction(action)
 
+        # 추세 차트 기간
+        range_menu = menu.addMenu("차트 기간 (Chart Range)")
+        for code, (label, _) in CHART_RANGES.items():
+            action = range_menu.addAction(label)
+            action.setCheckable(True)
+            action.setChecked(code == self.chart_range)
+            action.triggered.connect(lambda checked, c=code: self.change_chart_range(c))
+
+        # 2. 가격 알림 서브메뉴 (현재 통화 기준)
+        alert_menu = menu.addMenu("가격 알림 (Alerts)")
+        alert_menu.addAction("이상일 때 알림...").triggered.connect(lambda: self.add_alert("above"))
+        alert_menu.addAction("이하일 때 알림...").triggered.connect(lambda: self.add_alert("below"))
+        alert_menu.addAction("전일 대비 변동률 알림...").triggered.connect(lambda: self.add_alert("move"))
+        rules = self.alerts.rules(self.current_ticker)
+        if rules:
+            alert_menu.addSeparator()
+            for rule in rules:
+                alert_menu.addAction(self.describe_rule(rule)).setEnabled(False)
+            alert_menu.addAction("이 통화 알림 모두 삭제").triggered.connect(self.clear_alerts)
+        
+        # 3. 전체 통화 대시보드
+        dashboard_action = menu.addAction("대시보드 (Dashboard)")
+        debug_action = menu.addAction("디버그 정보 (Debug)")
+        debug_action.setCheckable(True)
+        debug_action.setChecked(self.overlay is not None and self.overlay.isVisible())
+
         menu.addSeparator()
         
-        # 2. 숨기기 & 종료
+        # 4. 숨기기 & 종료
         hide_action = menu.addAction("숨기기 (Hide to Tray)")
         quit_action = menu.addAction("종료 (Quit)")
         
@@ -261,19 +321,87 @@ class GhostExchangeWidget(QWidget):
         
         if action == quit_action:
             self.quit_app()
+        elif action == dashboard_action:
+            self.show_dashboard()
+        elif action == debug_action:
+            self.toggle_overlay()
         elif action == hide_action:
             self.hide()
             self.tray_icon.showMessage("위젯 숨겨짐", "트레이 아이콘을 더블클릭하면 다시 열립니다.", QSystemTrayIcon.Information, 2000)
 
+    # --- 가격 알림 관리 ---
+    @staticmethod
+    def describe_rule(rule):
+        if rule.type == "above":
+            return f"{rule.value:,.2f} 이상"
+        if rule.type == "below":
+            return f"{rule.value:,.2f} 이하"
+        return f"±{rule.value:g}% 변동"
+
+    def add_alert(self, rule_type):
+        if rule_type == "move":
+            value, ok = QInputDialog.getDouble(self, "가격 알림", f"{self.current_pair} 전일 대비 변동률 (%)",
+                                               3.0, 0.01, 100.0, 2)
+        else:
+            current = self.last_quote.price if self.last_quote else 0.0
+            label = "이상" if rule_type == "above" else "이하"
+            value, ok = QInputDialog.getDouble(self, "가격 알림", f"{self.current_pair} 기준 가격 ({label})",
+                                               current, 0.0, 1e9, 2)
+        if not ok:
+            return
+        
+        self.alerts.add_rule(AlertRule(self.current_ticker, rule_type, value, label=self.current_pair))
+        self.save_alerts()
+
+    def clear_alerts(self):
+        self.alerts.remove_rules(self.current_ticker)
+        self.save_alerts()
+
+    def save_alerts(self):
+        self.config.set("alerts", self.alerts.to_config())
+
+    def on_config_changed(self, keys):
+        # 설정 파일이 밖에서 바뀐 경우 화면에 반영
+        if "currency" in keys:
+            self.change_currency(self.config.get("currency"))
+        if "pos_x" in keys or "pos_y" in keys:
+            self.move(self.config.get("pos_x", self.x()), self.config.get("pos_y", self.y()))
+        if "alerts" in keys:
+            self.alerts.set_rules(AlertEngine.parse_config(self.config.get("alerts")))
+        if "chart_range" in keys:
+            self.change_chart_range(self.config.get("chart_range"))
+
+    def show_dashboard(self):
+        # 순환 import 방지 (대시보드가 이 모듈의 CURRENCY_MAP을 사용)
+        from exchange_dashboard import ExchangeDashboard
+
+        if self.dashboard is None:
+            self.dashboard = ExchangeDashboard()
+            self.dashboard.move(self.x(), self.y() + self.height() + 10)
+        self.dashboard.show()
+        self.dashboard.raise_()
+
+    def toggle_overlay(self):
+        if self.overlay is None:
+            self.overlay = MetricsOverlay(self.engine)
+            self.overlay.move(self.x() + self.width() + 10, self.y())
+        self.overlay.setVisible(not self.overlay.isVisible())
+
     def change_currency(self, new_pair):
-        if new_pair == self.current_pair: return
+        if new_pair == self.current_pair or new_pair not in CURRENCY_MAP: return
         
         self.current_pair = new_pair
-        self.start_worker(new_pair)
+        self.bind_pair(new_pair)
+        
+        # 변경 사항 저장 (잠시 뒤 파일에 기록됨)
+        self.config.set("currency", new_pair)
+
+    def change_chart_range(self, code):
+        if code == self.chart_range or code not in CHART_RANGES: return
         
-        # 변경 사항 즉시 저장
-        self.config["currency"] = new_pair
-        ConfigManager.save(self.config)
+        self.chart_range = code
+        self.on_series(self.current_ticker)
+        self.config.set("chart_range", code)
 
     # 창 드래그 이동 로직
     def mousePressEvent(self, event):
@@ -286,20 +414,32 @@ class GhostExchangeWidget(QWidget):
             self.move(self.x() + delta.x(), self.y() + delta.y())
             self.oldPos = event.globalPos()
 
+    def moveEvent(self, event):
+        # 위치는 움직일 때마다 메모리에만 기록 - 드래그가 멈추면 한 번만 파일에 저장됨
+        # (종료 전에 프로그램이 죽어도 마지막 위치가 남음)
+        self.config.update({"pos_x": self.x(), "pos_y": self.y()})
+        super().moveEvent(event)
+
     # 앱 종료 처리
     def quit_app(self):
-        # 종료 전 현재 위치 저장
-        self.config["pos_x"] = self.x()
-        self.config["pos_y"] = self.y()
-        ConfigManager.save(self.config)
-        
-        # 워커 스레드 안전하게 종료
-        if self.worker:
-            self.worker.stop()
+        # 아직 저장 대기 중인 설정을 지금 기록
+        self.config.flush(wait=True)
+        
+        # 시세 엔진 종료 요청 (진행 중인 요청은 취소, 기다리지 않음)
+        self.engine.stop()
         qApp.quit()
 
 if __name__ == '__main__':
+    # exe로 빌드된 경우 같은 실행 파일이 시세 허브 역할도 함 (quote_hub 참고)
+    if HUB_FLAG in sys.argv:
+        sys.exit(run_hub())
+    
     app = QApplication(sys.argv)
     ex = GhostExchangeWidget()
     ex.show()
-    sys.exit(app.exec_())
\ No newline at end of file
+    exit_code = app.exec_()
+    
+    # 창이 닫힌 뒤 엔진이 캐시 저장을 마칠 시간을 잠깐 줌
+    shared_config().flush(wait=True)
+    shared_quote_source().wait(1.0)
+    sys.exit(exit_code)
\ No newline at end of file
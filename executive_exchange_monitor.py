@@ -8,37 +8,16 @@ Executive Exchange Monitor (임원용 환율 모니터)
 """
 
 import sys
-import os
-import requests
+import time
 from PyQt5.QtWidgets import QApplication, QWidget, QLabel, QVBoxLayout, QHBoxLayout, QMenu, QAction
-from PyQt5.QtCore import Qt, QPoint, QThread, pyqtSignal
-from PyQt5.QtGui import QFont, QPixmap
+from PyQt5.QtCore import Qt, QPoint
+from PyQt5.QtGui import QFont
 
-
-# ===================================================================================
-# [리소스 경로 헬퍼 함수]
-# ===================================================================================
-# PyInstaller로 빌드된 .exe 파일에서 리소스 파일을 찾기 위한 함수
-# ===================================================================================
-
-def resource_path(relative_path):
-    """
-    PyInstaller로 빌드된 .exe에서 리소스 파일의 절대 경로를 반환합니다.
-    
-    Args:
-        relative_path (str): 리소스 파일의 상대 경로
-    
-    Returns:
-        str: 리소스 파일의 절대 경로
-    """
-    try:
-        # PyInstaller가 생성한 임시 폴더 경로
-        base_path = sys._MEIPASS
-    except Exception:
-        # 일반 Python 스크립트로 실행 시 현재 디렉토리 사용
-        base_path = os.path.abspath(".")
-    
-    return os.path.join(base_path, relative_path)
+from quote_hub import shared_quote_source, run_hub, HUB_FLAG
+from sparkline import Sparkline
+from ui_render import set_text, set_state, trend_of, RepaintCounter
+import startup_trace
+from icon_cache import shared_icons
 
 
 # ===================================================================================
@@ -63,128 +42,49 @@ CURRENCY_CONFIG = {
 
 
 # ===================================================================================
-# [클래스 1] 환율 데이터 가져오기 워커 (ExchangeDataWorker)
+# [에러 메시지] 시세 엔진의 에러 종류 -> 화면에 표시할 한글 메시지
 # ===================================================================================
-# 이 클래스는 백그라운드에서 환율 데이터를 가져옵니다.
-# QThread를 사용하면 UI가 멈추지 않고 부드럽게 작동합니다.
+# 환율 데이터는 quote_engine.QuoteEngine이 백그라운드에서 가져옵니다.
+# (같은 PC에 모니터 창이 여러 개면 quote_hub 프로세스 하나가 대신 조회합니다)
+# CURRENCY_CONFIG에 통화가 여러 개 있어도 한 번의 요청으로 모두 조회됩니다.
 # ===================================================================================
 
-class ExchangeDataWorker(QThread):
-    """
-    백그라운드 스레드로 환율 데이터를 가져오는 워커 클래스
-    
-    시그널 (Signals):
-        - rate_updated: 환율 업데이트 성공 시 (가격, 변동폭) 전송
-        - error_occurred: 에러 발생 시 에러 메시지 전송
-    """
-    
-    # PyQt5 시그널 정의 (UI에 데이터를 전달하는 통로)
-    rate_updated = pyqtSignal(float, float)  # (현재가격, 변동폭)
-    error_occurred = pyqtSignal(str)         # 에러 메시지
-    
-    def __init__(self, ticker_symbol, parent=None):
-        """
-        워커 초기화
-        
-        Args:
-            ticker_symbol (str): 야후 파이낸스 티커 심볼 (예: "KRW=X")
-            parent: 부모 위젯 (선택사항)
-        """
-        super().__init__(parent)
-        self.ticker_symbol = ticker_symbol  # 가져올 환율 심볼
-        self.running = True                 # 스레드 실행 상태 플래그
-    
-    def run(self):
-        """
-        스레드 메인 루프
-        60초마다 환율 데이터를 가져옵니다.
-        """
-        while self.running:
-            try:
-                # ===================================================================
-                # [API 호출] 야후 파이낸스에서 환율 데이터 가져오기
-                # ===================================================================
-                # URL 구조:
-                # - chart/{티커}: 특정 통화 쌍의 차트 데이터
-                # - interval=1m: 1분 단위 데이터
-                # - range=1d: 최근 1일 데이터
-                # ===================================================================
-                
-                url = f"https://query1.finance.yahoo.com/v8/finance/chart/{self.ticker_symbol}?interval=1m&range=1d"
-                
-                # User-Agent 헤더를 추가해야 야후 파이낸스가 요청을 받아줍니다
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/120.0.0.0 Safari/537.36'
-                }
-                
-                # HTTP GET 요청 보내기 (5초 타임아웃)
-                response = requests.get(url, headers=headers, timeout=5)
-                
-                # ===================================================================
-                # [데이터 파싱] JSON 응답에서 필요한 정보 추출
-                # ===================================================================
-                if response.status_code == 200:  # 요청 성공
-                    data = response.json()  # JSON 문자열을 Python 딕셔너리로 변환
-                    
-                    # 데이터 구조: chart -> result -> [0] -> meta
-                    result = data.get('chart', {}).get('result', [])
-                    
-                    if result:  # 데이터가 있으면
-                        meta = result[0]['meta']
-                        
-                        # 현재 시장 가격
-                        current_price = meta['regularMarketPrice']
-                        
-                        # 전일 종가
-                        previous_close = meta['chartPreviousClose']
-                        
-                        # 변동폭 계산 (현재가 - 전일종가)
-                        change = current_price - previous_close
-                        
-                        # UI에 데이터 전송 (시그널 발생)
-                        self.rate_updated.emit(current_price, change)
-                    else:
-                        # 데이터가 비어있으면 에러 전송
-                        self.error_occurred.emit("데이터 없음")
-                else:
-                    # HTTP 에러 (예: 404, 500 등)
-                    self.error_occurred.emit(f"HTTP 오류 {response.status_code}")
-            
-            except requests.exceptions.Timeout:
-                # 타임아웃 에러 (5초 안에 응답 없음)
-                self.error_occurred.emit("연결 시간 초과")
-            
-            except requests.exceptions.ConnectionError:
-                # 네트워크 연결 에러
-                self.error_occurred.emit("네트워크 연결 실패")
-            
-            except Exception as e:
-                # 기타 모든 에러
-                self.error_occurred.emit("알 수 없는 오류")
-                print(f"[디버그] 에러 상세: {e}")  # 개발자용 디버그 메시지
-            
-            # ===================================================================
-            # [스마트 대기] 60초 대기 (0.5초씩 120번 체크)
-            # ===================================================================
-            # 한 번에 60초를 기다리면 프로그램 종료 시 60초를 기다려야 합니다.
-            # 0.5초씩 나눠서 기다리면서 self.running을 체크하면
-            # 프로그램 종료 시 즉시 루프를 빠져나갈 수 있습니다.
-            # ===================================================================
-            for _ in range(120):  # 120 × 0.5초 = 60초
-                if not self.running:  # 종료 신호가 오면
-                    break             # 즉시 루프 탈출
-                self.msleep(500)      # 0.5초 대기
-    
-    def stop(self):
-        """
-        스레드를 안전하게 종료합니다.
-        """
-        self.running = False  # 루프 종료 플래그 설정
-        self.wait()           # 스레드가 완전히 끝날 때까지 대기
+FOOTER_TEXT = "실시간 환율 정보 • 장중 자동 업데이트"
 
+ERROR_MESSAGES = {
+    "timeout": "연결 시간 초과",        # 5초 안에 응답 없음
+    "connection": "네트워크 연결 실패",  # 네트워크 연결 에러
+    "data": "데이터 없음",              # 응답에 해당 티커가 없음
+    "unknown": "알 수 없는 오류",       # 기타 모든 에러
+}
 
+
+# ===================================================================================
+# [스타일시트] 창 전체의 디자인 (한 번만 적용)
+# ===================================================================================
+# 라벨은 objectName(#title, #rate 등)으로 구분합니다.
+# 변동폭 색상은 라벨의 trend 속성("up", "down", "flat", "error")에 따라 바뀌므로
+# 시세가 갱신될 때마다 스타일시트를 새로 지정하지 않아도 됩니다. (ui_render.py 참고)
 # ===================================================================================
-# [클래스 2] 메인 UI 위젯 (ExecutiveExchangeMonitor)
+
+STYLE_SHEET = """
+    QWidget { background-color: #1E1E1E; }      /* 딥 차콜 - 고급스러운 다크 모드 */
+    QLabel { background-color: transparent; font-family: 'Malgun Gothic'; }
+
+    QLabel#title { color: #FFD700; font-size: 22px; font-weight: bold; }   /* 골드 색상 */
+    QLabel#separator { color: #404040; font-size: 8px; }
+    QLabel#rate { color: #FFFFFF; font-size: 52px; font-weight: bold; }    /* 매우 큰 흰색 숫자 */
+    QLabel#footer { color: #666666; font-size: 11px; }
+
+    QLabel#change { color: #AAAAAA; font-size: 20px; font-weight: bold; }  /* 변동 없음: 회색 */
+    QLabel#change[trend="up"] { color: #FF4444; }                          /* 상승: 빨간색 */
+    QLabel#change[trend="down"] { color: #4444FF; }                        /* 하락: 파란색 */
+    QLabel#change[trend="error"] { color: #FF9800; font-size: 16px; font-weight: normal; }  /* 경고: 주황색 */
+"""
+
+
+# ===================================================================================
+# [클래스] 메인 UI 위젯 (ExecutiveExchangeMonitor)
 # ===================================================================================
 # 임원용 환율 모니터의 메인 화면입니다.
 # 깔끔하고 고급스러운 디자인으로 환율 정보를 표시합니다.
@@ -211,14 +111,20 @@ class ExecutiveExchangeMonitor(QWidget):
         self.current_currency_name = list(CURRENCY_CONFIG.keys())[0]
         self.current_ticker = CURRENCY_CONFIG[self.current_currency_name]
         
-        # 워커 스레드 (나중에 초기화)
-        self.worker = None
+        # 공용 시세 엔진 (모든 티커를 한 번에 조회)
+        self.engine = shared_quote_source()
+        
+        # 현재 표시 중인 시세 (네트워크 오류 시에도 계속 표시)
+        self.last_quote = None
         
         # UI 구성
         self.init_ui()
         
+        # 시작 시간 기록 (EXM_STARTUP_TRACE를 준 경우만 - startup_trace.py 참고)
+        startup_trace.watch_first_paint(self)
+        
         # 환율 데이터 가져오기 시작
-        self.start_worker()
+        self.start_updates()
     
     def init_ui(self):
         """
@@ -233,11 +139,11 @@ class ExecutiveExchangeMonitor(QWidget):
             Qt.Tool                   # 작업 표시줄에 표시 안 함
         )
         
-        # 배경색 설정 (딥 차콜 - 고급스러운 다크 모드)
-        self.setStyleSheet("background-color: #1E1E1E;")
+        # 스타일 설정 (배경색, 라벨 색상/크기 - 파일 위쪽 STYLE_SHEET 참고)
+        self.setStyleSheet(STYLE_SHEET)
         
         # 창 크기 및 위치
-        self.resize(450, 250)
+        self.resize(450, 290)
         self.move(200, 200)
         
         # ===================================================================
@@ -256,24 +162,14 @@ class ExecutiveExchangeMonitor(QWidget):
         title_layout.setAlignment(Qt.AlignCenter)  # 중앙 정렬
         
         # 국기 이미지 라벨
-        flag_label = QLabel()
-        # resource_path() 함수를 사용하여 .exe에서도 이미지를 찾을 수 있도록 함
-        flag_pixmap = QPixmap(resource_path("usa.png"))
-        if not flag_pixmap.isNull():  # 이미지 로드 성공 시
-            # 이미지 크기 조정 (높이 30px, 비율 유지)
-            scaled_pixmap = flag_pixmap.scaledToHeight(30, Qt.SmoothTransformation)
-            flag_label.setPixmap(scaled_pixmap)
-        flag_label.setStyleSheet("background-color: transparent;")
+        # 공용 아이콘 캐시에서 가져옴 (usa.png 디코드/축소는 작업 스레드에서 한 번만,
+        # 다음 실행부터는 icon_cache/ 폴더의 줄인 이미지를 씀)
+        flag_label = self.flag_label = QLabel()
+        self.show_flag()
         
         # 통화 이름 텍스트 라벨
         self.title_label = QLabel(self.current_currency_name)
-        self.title_label.setStyleSheet("""
-            color: #FFD700;              /* 골드 색상 (고급스러움) */
-            font-size: 22px;             /* 크기 */
-            font-weight: bold;           /* 굵게 */
-            font-family: 'Malgun Gothic'; /* 한글 폰트 */
-            background-color: transparent; /* 배경 투명 */
-        """)
+        self.title_label.setObjectName("title")
         
         # 수평 레이아웃에 국기와 텍스트 추가
         title_layout.addStretch()  # 왼쪽 여백
@@ -288,10 +184,7 @@ class ExecutiveExchangeMonitor(QWidget):
         # [2] 구분선
         # -------------------------------------------------------------------
         separator = QLabel("─" * 40)
-        separator.setStyleSheet("""
-            color: #404040;
-            font-size: 8px;
-        """)
+        separator.setObjectName("separator")
         separator.setAlignment(Qt.AlignCenter)
         main_layout.addWidget(separator)
         
@@ -299,13 +192,7 @@ class ExecutiveExchangeMonitor(QWidget):
         # [3] 환율 라벨 (매우 큰 숫자)
         # -------------------------------------------------------------------
         self.rate_label = QLabel("연결 중...")
-        self.rate_label.setStyleSheet("""
-            color: #FFFFFF;               /* 밝은 흰색 (가독성 최고) */
-            font-size: 52px;              /* 매우 큰 크기 */
-            font-weight: bold;            /* 굵게 */
-            font-family: 'Malgun Gothic'; /* 한글 폰트 */
-            background-color: transparent;
-        """)
+        self.rate_label.setObjectName("rate")
         self.rate_label.setAlignment(Qt.AlignCenter)
         main_layout.addWidget(self.rate_label)
         
@@ -313,53 +200,127 @@ class ExecutiveExchangeMonitor(QWidget):
         # [4] 변동폭 라벨 (▲/▼ 화살표와 숫자)
         # -------------------------------------------------------------------
         self.change_label = QLabel("―")
-        self.change_label.setStyleSheet("""
-            color: #AAAAAA;
-            font-size: 20px;
-            font-weight: bold;
-            font-family: 'Malgun Gothic';
-            background-color: transparent;
-        """)
+        self.change_label.setObjectName("change")
+        self.change_label.setProperty("trend", "flat")
         self.change_label.setAlignment(Qt.AlignCenter)
         main_layout.addWidget(self.change_label)
         
         # -------------------------------------------------------------------
-        # [5] 하단 정보 (실시간 업데이트 안내)
+        # [5] 당일 추세 차트 (1분봉 스파크라인)
+        # -------------------------------------------------------------------
+        self.sparkline = Sparkline()
+        self.sparkline.setFixedHeight(40)
+        main_layout.addWidget(self.sparkline)
+        
+        # -------------------------------------------------------------------
+        # [6] 하단 정보 (실시간 업데이트 안내)
         # -------------------------------------------------------------------
-        footer_label = QLabel("실시간 환율 정보 • 60초마다 자동 업데이트")
-        footer_label.setStyleSheet("""
-            color: #666666;
-            font-size: 11px;
-            font-family: 'Malgun Gothic';
-            background-color: transparent;
-        """)
-        footer_label.setAlignment(Qt.AlignCenter)
-        main_layout.addWidget(footer_label)
+        self.footer_label = QLabel(FOOTER_TEXT)
+        self.footer_label.setObjectName("footer")
+        self.footer_label.setAlignment(Qt.AlignCenter)
+        main_layout.addWidget(self.footer_label)
         
         # 레이아웃 적용
         self.setLayout(main_layout)
+        
+        # 조회 한 번에 라벨이 몇 번 다시 그려지는지 계측 (RENDER_STATS=1 이면 콘솔에 출력)
+        self.repaints = RepaintCounter(
+            "executive", (self.title_label, self.rate_label, self.change_label, self.footer_label), parent=self)
     
-    def start_worker(self):
+    def show_flag(self):
         """
-        환율 데이터를 가져오는 워커 스레드를 시작합니다.
+        현재 통화의 국기를 표시합니다. 아직 준비 중이면 준비된 뒤 다시 불립니다.
+        """
+        icons = shared_icons()
+        code = self.current_currency_name.split()[-1]   # "미국 USD" -> "USD"
+        pixmap = icons.flag(code, 30, self.devicePixelRatioF())
+        if pixmap is None:
+            icons.ready.connect(self.on_icon_ready)
+        else:
+            self.flag_label.setPixmap(pixmap)
+    
+    def on_icon_ready(self, source):
+        shared_icons().ready.disconnect(self.on_icon_ready)
+        self.show_flag()
+    
+    def start_updates(self):
+        """
+        시세 엔진에 현재 티커를 구독하고 시그널을 연결합니다.
         """
-        # 기존 워커가 있으면 먼저 종료
-        if self.worker:
-            self.worker.stop()
-        
         # UI를 초기 상태로 리셋
-        self.rate_label.setText("연결 중...")
-        self.change_label.setText("―")
+        set_text(self.rate_label, "연결 중...")
+        set_text(self.change_label, "―")
+        
+        # 시그널 연결 (엔진에서 UI로 데이터 전달)
+        self.engine.quote_updated.connect(self.on_quote)   # 데이터 업데이트
+        self.engine.series_updated.connect(self.on_series) # 분봉 차트 갱신
+        self.engine.error_occurred.connect(self.on_error)  # 에러 표시
+        self.engine.poll_finished.connect(self.repaints.tick)  # 다시 그리기 계측
+        
+        # 구독 시작 (엔진 스레드가 없으면 이때 시작됨)
+        # 캐시에 마지막 시세가 있으면 이 안에서 바로 on_quote가 호출됩니다
+        self.engine.subscribe(self.current_ticker)
+    
+    def on_quote(self, quote):
+        """
+        엔진이 보낸 시세 중 현재 티커만 골라 UI에 반영합니다.
+        
+        Args:
+            quote (Quote): 티커 하나의 시세
+        """
+        if quote.ticker != self.current_ticker:
+            return
+        
+        self.last_quote = quote
+        self.update_ui(quote.price, quote.change)
+        startup_trace.mark_quote(quote)
         
-        # 새 워커 생성 및 시작
-        self.worker = ExchangeDataWorker(self.current_ticker)
+        if quote.stale:
+            # 캐시 값: 새 시세를 받을 때까지 기준 시각을 함께 표시
+            set_text(self.footer_label, f"마지막 시세 {self.format_time(quote.timestamp)} 기준 • 갱신 중...")
+        else:
+            set_text(self.footer_label, FOOTER_TEXT)
+    
+    def on_series(self, ticker):
+        """
+        새 분봉이 생기면 엔진의 링 버퍼에서 시계열을 받아 차트를 다시 그립니다.
         
-        # 시그널 연결 (워커에서 UI로 데이터 전달)
-        self.worker.rate_updated.connect(self.update_ui)      # 데이터 업데이트
-        self.worker.error_occurred.connect(self.display_error) # 에러 표시
+        Args:
+            ticker (str): 분봉이 바뀐 티커
+        """
+        if ticker != self.current_ticker:
+            return
         
-        # 워커 스레드 시작
-        self.worker.start()
+        _, closes = self.engine.series(ticker)
+        baseline = self.last_quote.prev_close if self.last_quote else None
+        self.sparkline.set_series(closes, baseline)
+    
+    @staticmethod
+    def format_time(timestamp):
+        """시세 시각(유닉스 시간)을 'MM/DD HH:MM' 형식으로 바꿉니다."""
+        return time.strftime("%m/%d %H:%M", time.localtime(timestamp))
+    
+    def on_error(self, error):
+        """
+        엔진의 에러를 한글 메시지로 바꿔 표시합니다.
+        
+        Args:
+            error (QuoteError): 조회 실패 정보
+        """
+        if error.ticker not in (None, self.current_ticker):
+            return  # 다른 티커의 에러는 무시
+        
+        if error.kind == "http":
+            message = f"HTTP 오류 {error.status}"
+        else:
+            message = ERROR_MESSAGES.get(error.kind, ERROR_MESSAGES["unknown"])
+        
+        if self.last_quote:
+            # 보여줄 시세가 있으면 숫자는 그대로 두고 하단에 경고만 표시
+            set_text(self.footer_label,
+                     f"⚠ {message} • 마지막 시세 {self.format_time(self.last_quote.timestamp)} 기준")
+        else:
+            self.display_error(message)
     
     def update_ui(self, price, change):
         """
@@ -371,44 +332,18 @@ class ExecutiveExchangeMonitor(QWidget):
         """
         # ===================================================================
         # [환율 표시] 천 단위 콤마 추가 (예: 1,450.00)
+        # 표시 중인 글자와 같으면 set_text()가 아무것도 하지 않습니다 (다시 그리기 없음)
         # ===================================================================
-        self.rate_label.setText(f"{price:,.2f}")
+        set_text(self.rate_label, f"{price:,.2f}")
         
         # ===================================================================
         # [변동폭 표시] 상승/하락에 따라 색상 변경
+        # 색상은 STYLE_SHEET의 trend 규칙으로 정해지고, 방향이 바뀔 때만 다시 적용됩니다
         # ===================================================================
-        if change > 0:
-            # 상승: 빨간색 화살표
-            self.change_label.setText(f"▲ {change:,.2f}")
-            self.change_label.setStyleSheet("""
-                color: #FF4444;               /* 빨간색 */
-                font-size: 20px;
-                font-weight: bold;
-                font-family: 'Malgun Gothic';
-                background-color: transparent;
-            """)
-        
-        elif change < 0:
-            # 하락: 파란색 화살표
-            self.change_label.setText(f"▼ {abs(change):,.2f}")
-            self.change_label.setStyleSheet("""
-                color: #4444FF;               /* 파란색 */
-                font-size: 20px;
-                font-weight: bold;
-                font-family: 'Malgun Gothic';
-                background-color: transparent;
-            """)
-        
-        else:
-            # 변동 없음: 회색
-            self.change_label.setText(f"― {abs(change):,.2f}")
-            self.change_label.setStyleSheet("""
-                color: #AAAAAA;               /* 회색 */
-                font-size: 20px;
-                font-weight: bold;
-                font-family: 'Malgun Gothic';
-                background-color: transparent;
-            """)
+        trend = trend_of(change)
+        arrow = {"up": "▲", "down": "▼", "flat": "―"}[trend]  # 상승: 빨강, 하락: 파랑, 변동 없음: 회색
+        set_text(self.change_label, f"{arrow} {abs(change):,.2f}")
+        set_state(self.change_label, "trend", trend)
     
     def display_error(self, error_message):
         """
@@ -417,14 +352,9 @@ class ExecutiveExchangeMonitor(QWidget):
         Args:
             error_message (str): 표시할 에러 메시지
         """
-        self.rate_label.setText("오류")
-        self.change_label.setText(error_message)
-        self.change_label.setStyleSheet("""
-            color: #FF9800;               /* 주황색 (경고) */
-            font-size: 16px;
-            font-family: 'Malgun Gothic';
-            background-color: transparent;
-        """)
+        set_text(self.rate_label, "오류")
+        set_text(self.change_label, error_message)
+        set_state(self.change_label, "trend", "error")  # 주황색 (경고)
     
     # ===========================================================================
     # [이벤트 핸들러] 마우스 및 메뉴 이벤트 처리
@@ -469,10 +399,9 @@ class ExecutiveExchangeMonitor(QWidget):
     
     def quit_app(self):
         """
-        프로그램 종료 (워커 스레드 안전하게 종료)
+        프로그램 종료 (시세 엔진에 종료 요청 - 진행 중인 요청은 취소되고 기다리지 않음)
         """
-        if self.worker:
-            self.worker.stop()  # 워커 스레드 종료
+        self.engine.stop()  # 엔진 종료 요청
         
         QApplication.quit()  # 프로그램 종료
     
@@ -480,8 +409,7 @@ class ExecutiveExchangeMonitor(QWidget):
         """
         창 닫기 이벤트 (X 버튼 클릭 시)
         """
-        if self.worker:
-            self.worker.stop()
+        self.engine.stop()
         
         event.accept()  # 종료 승인
 
@@ -494,6 +422,11 @@ class ExecutiveExchangeMonitor(QWidget):
 # ===================================================================================
 
 if __name__ == '__main__':
+    # exe로 실행할 때 --quote-hub 인자가 있으면 창 없이 시세 허브로만 동작
+    # (여러 모니터 창이 야후 조회를 하나로 공유 - quote_hub.py 참고)
+    if HUB_FLAG in sys.argv:
+        sys.exit(run_hub())
+    
     # PyQt5 애플리케이션 생성
     app = QApplication(sys.argv)
     
@@ -502,7 +435,11 @@ if __name__ == '__main__':
     monitor.show()
     
     # 이벤트 루프 시작 (프로그램 종료 시까지 실행)
-    sys.exit(app.exec_())
+    exit_code = app.exec_()
+    
+    # 창이 닫힌 뒤 엔진이 캐시 저장을 마칠 시간을 잠깐 줌 (최대 1초)
+    shared_quote_source().wait(1.0)
+    sys.exit(exit_code)
 
 
 # ===================================================================================
@@ -515,15 +452,15 @@ if __name__ == '__main__':
 #     (현재 버전은 하나의 통화만 표시하지만, 구조는 확장 가능하게 설계됨)
 # 
 # Q2: 업데이트 주기를 변경하려면?
-# A2: ExchangeDataWorker 클래스의 run() 메서드에서
-#     for _ in range(120): 부분을 수정하세요.
-#     예: 30초마다 업데이트 → range(60)
+# A2: market_hours.py의 ASSET_CALENDARS에서 자산군별 주기를 수정하세요.
+#     예: 외환을 평소 30초마다 업데이트 → normal_interval=30
+#     (주말처럼 장이 닫혀 있을 때는 자동으로 조회를 멈춥니다)
 # 
 # Q3: 창 크기를 변경하려면?
-# A3: init_ui() 메서드의 self.resize(450, 250) 부분을 수정하세요.
+# A3: init_ui() 메서드의 self.resize(450, 290) 부분을 수정하세요.
 # 
 # Q4: 폰트 크기를 변경하려면?
-# A4: 각 라벨의 setStyleSheet() 안의 font-size 값을 수정하세요.
+# A4: 파일 위쪽 STYLE_SHEET에서 해당 라벨(#rate, #change 등)의 font-size 값을 수정하세요.
 # 
 # Q5: 프로그램이 멈추면?
 # A5: 네트워크 연결을 확인하고, 터미널에서 실행하여 에러 메시지를 확인하세요.
@@ -1,7 +1,31 @@
 # -*- mode: python ; coding: utf-8 -*-
 
+# ===================================================================================
+# 빌드 방법
+#   pyinstaller executive_exchange_monitor.spec            -> dist/executive_exchange_monitor.exe (파일 하나)
+#   set EXM_ONEDIR=1 && pyinstaller executive_exchange_monitor.spec
+#                                                          -> dist/executive_exchange_monitor/ (폴더)
+#
+# 파일 하나(onefile) exe는 실행할 때마다 모든 DLL과 라이브러리를 임시 폴더에 풀고 나서 시작하므로
+# 번들이 클수록 첫 화면이 늦어집니다. 폴더(onedir) 빌드는 이 압축 해제가 없어 훨씬 빨리 뜹니다.
+# 시작 시간 비교: python benchmarks/bench_startup.py --exe dist/...
+# ===================================================================================
+
+import os
+
+ONEDIR = os.environ.get("EXM_ONEDIR") == "1"
+
 block_cipher = None
 
+# 이 프로그램이 쓰지 않는 모듈 (번들 크기와 압축 해제 시간만 늘림)
+# - requests/urllib3/charset_normalizer: 시세 조회는 aiohttp(quote_core.make_async_session)만 씀
+# - idna는 aiohttp(yarl)가 쓰므로 빼면 안 됨
+EXCLUDES = [
+    'tkinter', 'unittest', 'pydoc', 'doctest', 'pdb', 'lib2to3', 'xmlrpc', 'test', '_pyrepl',
+    'setuptools', 'pkg_resources', 'distutils', 'pip',
+    'requests', 'urllib3', 'charset_normalizer',
+]
+
 a = Analysis(
     ['executive_exchange_monitor.py'],
     pathex=[],
@@ -11,7 +35,7 @@ a = Analysis(
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    excludes=EXCLUDES,
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
     cipher=block_cipher,
@@ -20,25 +44,55 @@ a = Analysis(
 
 pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
 
-exe = EXE(
-    pyz,
-    a.scripts,
-    a.binaries,
-    a.zipfiles,
-    a.datas,
-    [],
-    name='executive_exchange_monitor',
-    debug=False,
-    bootloader_ignore_signals=False,
-    strip=False,
-    upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
-    console=False,  # GUI 프로그램이므로 콘솔 창 숨김
-    disable_windowed_traceback=False,
-    argv_emulation=False,
-    target_arch=None,
-    codesign_identity=None,
-    entitlements_file=None,
-    icon=None,
-)
+if ONEDIR:
+    exe = EXE(
+        pyz,
+        a.scripts,
+        [],
+        exclude_binaries=True,  # DLL은 COLLECT가 폴더에 넣음
+        name='executive_exchange_monitor',
+        debug=False,
+        bootloader_ignore_signals=False,
+        strip=False,
+        upx=False,
+        console=False,  # GUI 프로그램이므로 콘솔 창 숨김
+        disable_windowed_traceback=False,
+        argv_emulation=False,
+        target_arch=None,
+        codesign_identity=None,
+        entitlements_file=None,
+        icon=None,
+    )
+    coll = COLLECT(
+        exe,
+        a.binaries,
+        a.zipfiles,
+        a.datas,
+        strip=False,
+        upx=False,
+        upx_exclude=[],
+        name='executive_exchange_monitor',
+    )
+else:
+    exe = EXE(
+        pyz,
+        a.scripts,
+        a.binaries,
+        a.zipfiles,
+        a.datas,
+        [],
+        name='executive_exchange_monitor',
+        debug=False,
+        bootloader_ignore_signals=False,
+        strip=False,
+        upx=False,  # UPX로 압축된 Qt DLL은 매번 풀어야 해서 시작이 느려짐
+        upx_exclude=[],
+        runtime_tmpdir=None,
+        console=False,  # GUI 프로그램이므로 콘솔 창 숨김
+        disable_windowed_traceback=False,
+        argv_emulation=False,
+        target_arch=None,
+        codesign_identity=None,
+        entitlements_file=None,
+        icon=None,
+    )
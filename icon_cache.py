@@ -0,0 +1,291 @@
+"""
+===================================================================================
+Icon Cache (국기 / 아이콘 픽스맵 캐시)
+===================================================================================
+목적: 국기 이미지와 아이콘을 프로세스 전체에서 한 번만 디코드하고 크기별로 한 번만 줄여서
+      모든 위젯(임원용 모니터, 환율 고시판 등)이 나눠 씁니다.
+
+    - 키: (원본, 높이, devicePixelRatio) -> QPixmapCache 항목
+      (같은 원본을 쓰는 통화가 여러 개여도 픽스맵은 하나)
+    - 이미지 파일 디코드와 축소는 작업 스레드에서 QImage로 합니다.
+      GUI 스레드는 다 줄인 작은 QImage를 QPixmap으로 바꾸기만 합니다.
+      (QPixmap은 GUI 스레드에서만 만들 수 있음)
+    - 아직 준비되지 않은 아이콘은 None을 돌려주고, 준비되면 ready 시그널을 보냅니다.
+    - 줄인 결과를 icon_cache/ 폴더에 PNG로 저장해 두면 다음 실행에는 원본을 다시 줄이지 않습니다.
+      (ICON_DISK_CACHE=0 이면 디스크에 저장하지 않음)
+    - 글꼴 아이콘(qtawesome)은 GUI 스레드에서만 그릴 수 있어 처음 한 번은 바로 그리고,
+      그 결과도 디스크에 저장해 다음 실행부터는 작업 스레드에서 읽습니다.
+===================================================================================
+"""
+
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt5.QtCore import QObject, Qt, QSize, pyqtSignal
+from PyQt5.QtGui import QImage, QPixmap, QPixmapCache
+from PyQt5.QtWidgets import QApplication
+
+
+ICON_CACHE_DIR = 'icon_cache'
+
+# 통화 코드 -> 국기 이미지 파일 (없는 통화는 FALLBACK_ICON)
+FLAG_FILES = {
+    "USD": "usa.png",
+}
+FALLBACK_ICON = "qta:fa5s.flag:#777777"   # qtawesome 글꼴 아이콘 (이름:색)
+
+PIXMAP_CACHE_KB = 20 * 1024   # QPixmapCache 최소 한도 (기본 10MB)
+
+
+# ===================================================================================
+# [리소스 경로 헬퍼 함수]
+# ===================================================================================
+# PyInstaller로 빌드된 .exe 파일에서 리소스 파일을 찾기 위한 함수
+# ===================================================================================
+
+def resource_path(relative_path):
+    """
+    PyInstaller로 빌드된 .exe에서 리소스 파일의 절대 경로를 반환합니다.
+
+    Args:
+        relative_path (str): 리소스 파일의 상대 경로
+
+    Returns:
+        str: 리소스 파일의 절대 경로
+    """
+    try:
+        # PyInstaller가 생성한 임시 폴더 경로
+        base_path = sys._MEIPASS
+    except Exception:
+        # 일반 Python 스크립트로 실행 시 현재 디렉토리 사용
+        base_path = os.path.abspath(".")
+
+    return os.path.join(base_path, relative_path)
+
+
+def disk_cache_enabled():
+    return os.environ.get("ICON_DISK_CACHE", "1") != "0"
+
+
+def cache_key(source, height, dpr):
+    return f"icon:{source}@{height}x{dpr:g}"
+
+
+def disk_name(source, height, dpr):
+    """디스크 캐시 파일 이름 (원본 이름에서 파일 이름에 못 쓰는 글자를 바꿈)"""
+    safe = "".join(c if c.isalnum() or c in "-_." else "_" for c in source)
+    return f"{safe}-{height}-{dpr:g}.png"
+
+
+def scale_image(image, height, dpr):
+    """원본 QImage를 높이 height(논리 픽셀) x dpr로 부드럽게 줄입니다 (어느 스레드에서나 가능)."""
+    scaled = image.scaledToHeight(max(1, round(height * dpr)), Qt.SmoothTransformation)
+    scaled.setDevicePixelRatio(dpr)
+    return scaled
+
+
+class IconCache(QObject):
+    """
+    국기 / 아이콘 픽스맵 캐시 (GUI 스레드에서 만들고 사용)
+
+    시그널 (Signals):
+        - ready: 기다리던 아이콘이 준비됨 (원본 이름) - 위젯은 이때 다시 그리면 됨
+
+    Args:
+        directory (str): 디스크 캐시 폴더 (None이면 디스크에 저장하지 않음)
+    """
+
+    ready = pyqtSignal(str)
+    _loaded = pyqtSignal(str, str, object)   # (키, 원본, QImage) - 작업 스레드 -> GUI 스레드
+
+    def __init__(self, directory=None, parent=None):
+        super().__init__(parent)
+        self.directory = directory
+        self.decodes = 0          # 원본 파일을 디코드한 횟수 (벤치마크/디버그용)
+        self.disk_hits = 0        # 디스크 캐시에서 읽은 횟수
+        self._images = {}         # 키 -> 줄인 QImage (QPixmapCache에서 밀려나도 다시 디코드하지 않도록)
+        self._pending = set()     # 작업 스레드에서 준비 중인 키
+        self._originals = {}      # 원본 파일 -> 디코드한 QImage (크기가 여러 개여도 디코드는 한 번)
+        self._originals_lock = threading.Lock()
+        self._failed = set()      # 원본이 없거나 깨진 키 (그릴 때마다 다시 디코드하지 않도록)
+        self._workers = ThreadPoolExecutor(max_workers=2, thread_name_prefix="icon-loader")
+        self._loaded.connect(self._on_loaded)
+
+        if QPixmapCache.cacheLimit() < PIXMAP_CACHE_KB:
+            QPixmapCache.setCacheLimit(PIXMAP_CACHE_KB)
+
+    # --- 조회 (GUI 스레드) ---
+    def flag(self, code, height, dpr=None):
+        """
+        통화 국기 픽스맵
+
+        Args:
+            code (str): 통화 코드 (예: "USD")
+            height (int): 높이 (논리 픽셀)
+            dpr (float): devicePixelRatio (기본값: 앱 전체 값)
+
+        Returns:
+            QPixmap: 준비되었으면 픽스맵, 아직 작업 스레드에서 준비 중이면 None
+        """
+        return self.pixmap(self.flag_source(code), height, dpr)
+
+    @staticmethod
+    def flag_source(code):
+        return FLAG_FILES.get(code, FALLBACK_ICON)
+
+    def pixmap(self, source, height, dpr=None):
+        """
+        Args:
+            source (str): 이미지 파일(resource_path 기준 상대 경로) 또는 "qta:아이콘:색"
+
+        Returns:
+            QPixmap: 준비되었으면 픽스맵, 준비 중이면 None (ready 시그널로 알려 줌)
+        """
+        dpr = dpr or QApplication.instance().devicePixelRatio()
+        key = cache_key(source, height, dpr)
+
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None and not pixmap.isNull():
+            return pixmap
+
+        image = self._images.get(key)
+        if image is not None:
+            # QPixmapCache에서 밀려난 경우: 줄인 이미지로 다시 만듦 (디코드 없음)
+            pixmap = QPixmap.fromImage(image)
+            QPixmapCache.insert(key, pixmap)
+            return pixmap
+
+        if source.startswith("qta:") and not self._on_disk(source, height, dpr):
+            # 글꼴 아이콘은 GUI 스레드에서만 그릴 수 있음 (처음 한 번만)
+            image = self._render_font_icon(source, height, dpr)
+            self._store(key, image)
+            self._save_async(source, height, dpr, image)
+            return QPixmapCache.find(key)
+
+        self.preload_source(source, height, dpr)
+        return None
+
+    def preload(self, codes, height, dpr=None):
+        """통화 국기들을 미리 준비합니다 (첫 화면을 그리기 전에 작업 스레드에서 디코드 시작)."""
+        for source in dict.fromkeys(self.flag_source(code) for code in codes):
+            self.preload_source(source, height, dpr)
+
+    def preload_source(self, source, height, dpr=None):
+        dpr = dpr or QApplication.instance().devicePixelRatio()
+        key = cache_key(source, height, dpr)
+        if key in self._images or key in self._pending or key in self._failed:
+            return
+        if source.startswith("qta:") and not self._on_disk(source, height, dpr):
+            return  # 글꼴 아이콘은 처음 쓸 때 GUI 스레드에서 그림
+        self._pending.add(key)
+        self._workers.submit(self._load, key, source, height, dpr)
+
+    def shutdown(self):
+        """디스크 저장 작업이 끝날 때까지 기다립니다 (프로그램 종료 시)."""
+        self._workers.shutdown(wait=True)
+
+    # --- 작업 스레드 ---
+    def _load(self, key, source, height, dpr):
+        image = None
+        try:
+            cached = self._disk_path(source, height, dpr)
+            if cached and os.path.exists(cached) and self._disk_fresh(source, cached):
+                image = QImage(cached)
+                if not image.isNull():
+                    image.setDevicePixelRatio(dpr)
+                    self.disk_hits += 1
+                else:
+                    image = None
+                    if source.startswith("qta:"):
+                        os.remove(cached)   # 깨진 캐시 -> 다음 조회 때 GUI 스레드에서 다시 그림
+
+            if image is None and not source.startswith("qta:"):
+                original = self._original(source)
+                if not original.isNull():
+                    image = scale_image(original, height, dpr)
+                    self._save(source, height, dpr, image)
+        except Exception as e:
+            print(f"Icon Load Failed: {source}: {e}")
+        self._loaded.emit(key, source, image)
+
+    def _original(self, source):
+        with self._originals_lock:
+            original = self._originals.get(source)
+            if original is None:
+                original = self._originals[source] = QImage(resource_path(source))
+                self.decodes += 1
+            return original
+
+    def _disk_path(self, source, height, dpr):
+        if not self.directory:
+            return None
+        return os.path.join(self.directory, disk_name(source, height, dpr))
+
+    def _on_disk(self, source, height, dpr):
+        path = self._disk_path(source, height, dpr)
+        return bool(path) and os.path.exists(path)
+
+    @staticmethod
+    def _disk_fresh(source, cached):
+        """원본 파일이 캐시보다 새로우면 다시 줄임 (글꼴 아이콘은 항상 유효)"""
+        if source.startswith("qta:"):
+            return True
+        try:
+            return os.path.getmtime(cached) >= os.path.getmtime(resource_path(source))
+        except OSError:
+            return True   # 원본이 없으면(배포 후 삭제 등) 캐시라도 씀
+
+    def _save(self, source, height, dpr, image):
+        path = self._disk_path(source, height, dpr)
+        if not path:
+            return
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            tmp = path + ".tmp"
+            if image.save(tmp, "PNG"):
+                os.replace(tmp, path)   # 읽는 쪽이 반쯤 쓴 파일을 보지 않도록
+        except OSError as e:
+            print(f"Icon Cache Save Failed: {e}")
+
+    def _save_async(self, source, height, dpr, image):
+        if self.directory:
+            self._workers.submit(self._save, source, height, dpr, image.copy())
+
+    # --- GUI 스레드 ---
+    def _on_loaded(self, key, source, image):
+        self._pending.discard(key)
+        if image is None:
+            if source.startswith("qta:"):
+                self.ready.emit(source)   # 다시 조회하면 바로 그려짐
+            else:
+                self._failed.add(key)
+            return
+        self._store(key, image)
+        self.ready.emit(source)
+
+    def _store(self, key, image):
+        self._images[key] = image
+        QPixmapCache.insert(key, QPixmap.fromImage(image))
+
+    @staticmethod
+    def _render_font_icon(source, height, dpr):
+        import qtawesome as qta   # 글꼴 아이콘이 처음 필요할 때 불러옴
+
+        _, name, color = source.split(":", 2)
+        size = max(1, round(height * dpr))
+        image = qta.icon(name, color=color).pixmap(QSize(size, size)).toImage()
+        image.setDevicePixelRatio(dpr)
+        return image
+
+
+_shared_icons = None
+
+
+def shared_icons():
+    """같은 프로세스의 위젯들이 함께 쓰는 아이콘 캐시 (QApplication을 만든 뒤 호출)"""
+    global _shared_icons
+    if _shared_icons is None:
+        _shared_icons = IconCache(ICON_CACHE_DIR if disk_cache_enabled() else None)
+    return _shared_icons
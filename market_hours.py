@@ -0,0 +1,227 @@
+"""
+===================================================================================
+Market Hours (시장 시간 기반 조회 스케줄러)
+===================================================================================
+목적: 자산마다 거래 시간이 다르므로 조회 주기도 달라야 합니다.
+      - 외환(FX): 주말에는 시장이 닫혀 있으므로 거의 조회하지 않음
+      - 암호화폐: 24시간 365일 열려 있음
+      - 변동성이 큰 시간대에는 더 자주 조회
+      - 조회 실패 시 지수적으로 간격을 늘리고(백오프) 무작위 지터를 섞음
+===================================================================================
+"""
+
+import random
+from datetime import datetime, timedelta, timezone
+
+
+# ===================================================================================
+# [거래 캘린더] 자산군별 개장 시간과 조회 주기
+# ===================================================================================
+
+class MarketCalendar:
+    """
+    자산군 하나의 거래 시간과 조회 주기
+
+    Args:
+        name (str): 자산군 이름 ("fx", "crypto")
+        weekly_open (tuple): 주간 개장 시각 (요일, 시) - UTC, 월요일=0. None이면 24/7
+        weekly_close (tuple): 주간 마감 시각 (요일, 시) - UTC
+        busy_hours (tuple): 변동성이 큰 시간대 목록 [(시작 시, 끝 시), ...] - UTC
+        normal_interval (float): 평상시 조회 주기 (초)
+        busy_interval (float): 변동성 큰 시간대 조회 주기 (초)
+        closed_interval (float): 장이 닫혀 있을 때 최대 대기 (초)
+    """
+
+    def __init__(self, name, weekly_open=None, weekly_close=None, busy_hours=(),
+                 normal_interval=60, busy_interval=20, closed_interval=3600):
+        self.name = name
+        self.weekly_open = weekly_open
+        self.weekly_close = weekly_close
+        self.busy_hours = busy_hours
+        self.normal_interval = normal_interval
+        self.busy_interval = busy_interval
+        self.closed_interval = closed_interval
+
+    def _week_hour(self, now):
+        """월요일 0시(UTC)부터 지난 시간(시 단위, 소수 포함)"""
+        return now.weekday() * 24 + now.hour + now.minute / 60 + now.second / 3600
+
+    def is_open(self, now):
+        if self.weekly_open is None:
+            return True
+
+        hour = self._week_hour(now)
+        open_hour = self.weekly_open[0] * 24 + self.weekly_open[1]
+        close_hour = self.weekly_close[0] * 24 + self.weekly_close[1]
+
+        if open_hour < close_hour:
+            return open_hour <= hour < close_hour
+        # 일요일 밤에 열어 금요일 밤에 닫는 경우처럼 주를 넘어가는 구간
+        return hour >= open_hour or hour < close_hour
+
+    def seconds_until_open(self, now):
+        """다음 개장까지 남은 시간 (초). 이미 열려 있으면 0"""
+        if self.is_open(now):
+            return 0
+
+        hour = self._week_hour(now)
+        open_hour = self.weekly_open[0] * 24 + self.weekly_open[1]
+        return ((open_hour - hour) % (7 * 24)) * 3600
+
+    def is_busy(self, now):
+        hour = now.hour + now.minute / 60
+        return any(start <= hour < end for start, end in self.busy_hours)
+
+    def poll_interval(self, now):
+        """지금 시각 기준 다음 조회까지의 간격 (초)"""
+        if not self.is_open(now):
+            # 닫혀 있으면 개장 시각에 맞춰 깨어나되, 너무 오래 자지는 않음
+            return min(self.closed_interval, max(self.seconds_until_open(now), 1))
+        if self.is_busy(now):
+            return self.busy_interval
+        return self.normal_interval
+
+
+# 외환: 일요일 22시(UTC, 시드니 개장) ~ 금요일 22시(UTC, 뉴욕 마감)
+#       런던/뉴욕이 겹치는 12~16시(UTC)가 가장 활발
+# 암호화폐: 24/7, 미국 장중(13~21시 UTC)에 변동성이 큼
+ASSET_CALENDARS = {
+    "fx": MarketCalendar("fx", weekly_open=(6, 22), weekly_close=(4, 22),
+                         busy_hours=((12, 16),), normal_interval=60, busy_interval=20),
+    "crypto": MarketCalendar("crypto", busy_hours=((13, 21),),
+                             normal_interval=60, busy_interval=30),
+}
+
+
+def asset_class(ticker):
+    """
+    야후 티커 형식으로 자산군을 판별합니다.
+
+    예: "KRW=X", "JPYKRW=X" -> "fx" / "BTC-USD", "ETH-USD" -> "crypto"
+    """
+    if ticker.endswith("=X"):
+        return "fx"
+    if "-" in ticker:
+        return "crypto"
+    return "fx"  # 알 수 없는 형식은 평일 거래로 간주
+
+
+# ===================================================================================
+# [스케줄러] 자산군별 다음 조회 시각 + 실패 시 백오프
+# ===================================================================================
+
+class PollScheduler:
+    """
+    자산군별로 언제 다시 조회할지 정합니다.
+
+    엔진은 seconds_until_due()만큼 한 번 잠들었다가, due_groups()가 돌려준
+    자산군만 조회하고 결과를 record_success()/record_failure()로 알려 주면 됩니다.
+
+    Args:
+        calendars (dict): 자산군 이름 -> MarketCalendar (기본값: ASSET_CALENDARS)
+        fixed_interval (float): 지정하면 캘린더를 무시하고 항상 이 간격으로 조회 (벤치마크용)
+    """
+
+    BACKOFF_BASE = 5      # 첫 실패 후 대기 (초)
+    BACKOFF_MAX = 900     # 최대 대기 (초, 15분)
+    PIGGYBACK = 5         # 이 시간 안에 조회 예정인 자산군은 지금 요청에 함께 태움 (초)
+
+    def __init__(self, calendars=None, fixed_interval=None):
+        self.calendars = calendars or ASSET_CALENDARS
+        self.fixed_interval = fixed_interval
+        self.random = random.Random()
+        self._next_due = {}   # 자산군 -> 다음 조회 시각 (datetime)
+        self._failures = {}   # 자산군 -> 연속 실패 횟수
+
+    @staticmethod
+    def now():
+        return datetime.now(timezone.utc)
+
+    def group(self, tickers):
+        """티커 목록을 자산군별로 묶습니다. {자산군: [티커, ...]}"""
+        groups = {}
+        for ticker in tickers:
+            groups.setdefault(asset_class(ticker), []).append(ticker)
+        return groups
+
+    def seconds_until_due(self, tickers, now=None):
+        """가장 먼저 조회해야 할 자산군까지 남은 시간 (초). 구독이 없으면 None"""
+        now = now or self.now()
+        groups = self.group(tickers)
+        if not groups:
+            return None
+
+        due = min(self._next_due.get(name, now) for name in groups)
+        return max((due - now).total_seconds(), 0)
+
+    def due_groups(self, tickers, now=None, force=()):
+        """
+        지금 조회할 자산군과 티커 목록을 돌려줍니다.
+
+        Args:
+            force (iterable): 시간과 관계없이 조회할 티커 (새 구독). 이 티커가 속한 자산군만 당겨 오며,
+                              실패 백오프 중인 자산군은 백오프가 끝날 때까지 기다림
+        """
+        now = now or self.now()
+        horizon = now + timedelta(seconds=self.PIGGYBACK)
+        forced = {asset_class(ticker) for ticker in force}
+        groups = {}
+        for name, members in self.group(tickers).items():
+            due = self._next_due.get(name, now)
+            if self.backing_off(name):
+                # 백오프 중이면 강제 조회도, 다른 요청에 함께 타기(PIGGYBACK)도 하지 않음
+                if due <= now:
+                    groups[name] = members
+            elif name in forced or due <= horizon:
+                groups[name] = members
+        return groups
+
+    def expedite(self, tickers, now=None):
+        """
+        장이 열려 있고 백오프 중이 아닌 자산군의 다음 조회를 지금으로 당깁니다
+        (수동 새로고침, 스트림 끊김 / 순번 누락). 닫힌 장과 백오프 중인 자산군은 원래 일정대로 둡니다.
+        """
+        now = now or self.now()
+        for name in self.group(tickers):
+            if self.backing_off(name):
+                continue
+            if self.fixed_interval is None and not self.calendars[name].is_open(now):
+                continue
+            self._next_due[name] = min(self._next_due.get(name, now), now)
+
+    def backing_off(self, name):
+        """마지막 조회가 실패해 다음 조회 시각이 백오프로 정해진 상태인지"""
+        return self._failures.get(name, 0) > 0
+
+    def record_success(self, name, now=None, interval=None):
+        """
+        Args:
+            interval (float): 지정하면 캘린더 대신 이 간격 뒤에 다시 조회 (스트리밍 연결 중 등)
+        """
+        now = now or self.now()
+        self._failures[name] = 0
+        if interval is None:
+            interval = self.interval(name, now)
+        self._next_due[name] = now + timedelta(seconds=interval)
+
+    def record_failure(self, name, now=None):
+        """실패 횟수에 따라 지수적으로 늘어나는 대기 시간 + 지터를 적용합니다."""
+        now = now or self.now()
+        failures = self._failures.get(name, 0) + 1
+        self._failures[name] = failures
+        self._next_due[name] = now + timedelta(seconds=self.backoff(failures))
+
+    def interval(self, name, now):
+        if self.fixed_interval is not None:
+            return self.fixed_interval
+        return self.calendars[name].poll_interval(now)
+
+    def backoff(self, failures):
+        """
+        "equal jitter" 백오프: 절반은 고정, 절반은 무작위
+
+        여러 위젯이 동시에 실패해도 같은 순간에 몰려서 재시도하지 않도록 합니다.
+        예: 1회 실패 2.5~5초, 2회 5~10초, 3회 10~20초 ... 최대 BACKOFF_MAX
+        """
+        delay = min(self.BACKOFF_MAX, self.BACKOFF_BASE * 2 ** (failures - 1))
+        return delay / 2 + self.random.uniform(0, delay / 2)
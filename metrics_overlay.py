@@ -0,0 +1,93 @@
+"""
+===================================================================================
+Metrics Overlay (디버그 정보 창)
+===================================================================================
+목적: 시세 엔진의 조회 계측값(quote_metrics)을 작은 창에 1초마다 보여줍니다.
+      위젯 우클릭 메뉴의 "디버그 정보"로 켜고 끕니다.
+===================================================================================
+"""
+
+from PyQt5.QtWidgets import QWidget, QLabel, QVBoxLayout
+from PyQt5.QtCore import Qt, QTimer, QPoint
+
+from ui_render import set_text
+
+
+class MetricsOverlay(QWidget):
+    """
+    Args:
+        engine (QuoteEngine): 계측값을 읽을 엔진
+    """
+
+    REFRESH_MS = 1000
+
+    def __init__(self, engine, parent=None):
+        super().__init__(parent)
+        self.engine = engine
+
+        self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool)
+        self.setStyleSheet("background-color: rgba(20, 20, 20, 220);")
+
+        layout = QVBoxLayout()
+        layout.setContentsMargins(8, 6, 8, 6)
+        self.setLayout(layout)
+
+        self.label = QLabel()
+        self.label.setStyleSheet("color: #7CFC00; font-family: Consolas, monospace; font-size: 11px;")
+        layout.addWidget(self.label)
+
+        # 보이는 동안만 갱신
+        self.timer = QTimer(self)
+        self.timer.setInterval(self.REFRESH_MS)
+        self.timer.timeout.connect(self.refresh)
+
+    def showEvent(self, event):
+        self.refresh()
+        self.timer.start()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self.timer.stop()
+        super().hideEvent(event)
+
+    def refresh(self):
+        set_text(self.label, "\n".join(self.lines()))
+        self.adjustSize()
+
+    def lines(self):
+        summary = self.engine.metrics.summary()
+        requests, ok = summary["requests"], summary["ok"]
+        rate = f"{ok / requests:.1%}" if requests else "-"
+        lines = [f"requests {requests}  ok {ok} ({rate})"]
+
+        # 제공자별 최근 응답 시간 (HedgedFetcher의 이동 구간 백분위수)
+        # 허브에서 시세를 받는 중이면 조회는 허브 프로세스가 하므로 여기엔 없음
+        fetcher = self.engine.fetcher
+        if fetcher is None:
+            lines.append("fetching in quote hub process")
+        for name, tracker in (fetcher.latency.items() if fetcher else ()):
+            p50, p95 = tracker.percentile(50), tracker.percentile(95)
+            fmt = lambda v: "-" if v is None else f"{v * 1000:.0f}ms"
+            lines.append(f"{name[:24]:<24} p50 {fmt(p50):>6} p95 {fmt(p95):>6}  "
+                         f"ok {tracker.successes} fail {tracker.failures}")
+
+        lines.append(f"hedged {summary['hedges']}  failover {summary['failovers']}  "
+                     f"quotes {summary['quotes']}  {summary['bytes'] / 1024:,.0f} KB")
+
+        since = summary["since_last_good"]
+        lines.append("last good: -" if since is None else f"last good: {since:.1f}s ago")
+
+        for (kind, exception), count in sorted(summary["errors"].items()):
+            lines.append(f"error {kind}{'/' + exception if exception else ''}: {count}")
+        return lines
+
+    # 창 드래그 이동 로직
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            self.oldPos = event.globalPos()
+
+    def mouseMoveEvent(self, event):
+        if event.buttons() == Qt.LeftButton:
+            delta = QPoint(event.globalPos() - self.oldPos)
+            self.move(self.x() + delta.x(), self.y() + delta.y())
+            self.oldPos = event.globalPos()
@@ -0,0 +1,88 @@
+"""
+===================================================================================
+Quote Cache (마지막 시세 캐시)
+===================================================================================
+목적: 티커별 마지막 정상 시세를 파일(quote_cache.json)에 저장해 둡니다.
+      - 프로그램 시작 시 네트워크 응답을 기다리지 않고 바로 표시 (stale 표시)
+      - 네트워크가 끊겨 있어도 마지막 시세를 보여줄 수 있음
+===================================================================================
+"""
+
+import json
+import os
+import tempfile
+import threading
+
+
+class QuoteCache:
+    """
+    티커별 마지막 시세를 메모리에 들고 있다가 save() 때 파일로 씁니다.
+
+    put()은 엔진의 루프 스레드에서, get()은 GUI 스레드에서 호출되므로 잠금을 씁니다.
+
+    Args:
+        path (str): 캐시 파일 경로 (기본값: widget_config.json과 같은 위치의 quote_cache.json)
+    """
+
+    CACHE_FILE = 'quote_cache.json'
+
+    def __init__(self, path=None):
+        self.path = path or self.CACHE_FILE
+        self._lock = threading.Lock()
+        self._entries = {}   # 티커 -> {price, change, prev_close, timestamp}
+        self._dirty = False
+        self.load()
+
+    def load(self):
+        """파일이 없거나 깨져 있으면 빈 캐시로 시작합니다 (캐시는 없어도 동작에 지장 없음)."""
+        try:
+            with open(self.path, 'r') as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if isinstance(entries, dict):
+            with self._lock:
+                self._entries = entries
+
+    def get(self, ticker):
+        """
+        캐시된 시세를 돌려줍니다.
+
+        Returns:
+            dict: {price, change, prev_close, timestamp} 또는 None
+        """
+        with self._lock:
+            entry = self._entries.get(ticker)
+            return dict(entry) if entry else None
+
+    def put(self, quote):
+        with self._lock:
+            self._entries[quote.ticker] = {
+                "price": quote.price,
+                "change": quote.change,
+                "prev_close": quote.prev_close,
+                "timestamp": quote.timestamp,
+            }
+            self._dirty = True
+
+    def save(self):
+        """
+        바뀐 내용이 있을 때만 파일에 씁니다.
+
+        임시 파일에 먼저 쓴 뒤 교체하므로, 쓰는 도중 종료되어도 기존 캐시가 깨지지 않습니다.
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            data = json.dumps(self._entries, indent=4)
+            self._dirty = False
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.quote_cache-', suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                f.write(data)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Quote Cache Save Failed: {e}")
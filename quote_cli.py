@@ -0,0 +1,99 @@
+"""
+===================================================================================
+Quote CLI (명령줄 시세 조회)
+===================================================================================
+목적: PyQt5 없이 여러 티커의 시세를 동시에 조회해 JSON Lines(티커 하나 = 한 줄)로 출력합니다.
+      스크립트나 cron 작업에서 jq 등으로 바로 가공할 수 있습니다.
+
+출력 (요청한 순서대로):
+    {"ticker": "KRW=X", "price": 1381.2, "change": 3.2, "change_percent": 0.23, "prev_close": 1378.0, "time": 1700000000}
+    {"ticker": "XXX=X", "error": "data", "status": null}
+
+종료 코드: 0 (모두 성공), 1 (실패한 티커가 있음)
+
+사용법:
+    python quote_cli.py KRW=X JPYKRW=X BTC-USD BTC/KRW
+    python quote_cli.py -f tickers.txt              # 한 줄에 티커 하나 (# 뒤는 주석)
+    cat tickers.txt | python quote_cli.py -
+    python quote_cli.py --watch 60 KRW=X            # 60초마다 반복 (Ctrl+C로 종료)
+===================================================================================
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+
+from quote_core import change_percent, get_quotes_async, make_async_session
+from quote_providers import HedgedFetcher, default_providers
+
+
+def read_tickers(lines):
+    """파일/표준 입력의 줄들에서 티커 목록을 꺼냅니다 (빈 줄과 # 주석 무시)."""
+    tickers = []
+    for line in lines:
+        line = line.split("#", 1)[0].strip()
+        if line:
+            tickers.extend(line.replace(",", " ").split())
+    return tickers
+
+
+def quote_record(quote):
+    return {"ticker": quote.ticker, "price": quote.price, "change": round(quote.change, 6),
+            "change_percent": round(change_percent(quote), 4), "prev_close": quote.prev_close,
+            "time": int(quote.timestamp)}
+
+
+def error_record(ticker, error):
+    return {"ticker": ticker, "error": error.kind, "status": error.status}
+
+
+async def run(tickers, base_url, watch):
+    """
+    시세를 조회해 출력합니다. watch가 있으면 같은 세션으로 반복합니다.
+
+    Returns:
+        int: 마지막 조회의 종료 코드
+    """
+    fetcher = HedgedFetcher(default_providers(base_url))
+    async with make_async_session() as session:
+        while True:
+            quotes, errors = await get_quotes_async(tickers, session, fetcher)
+            for ticker in dict.fromkeys(tickers):
+                if ticker in quotes:
+                    record = quote_record(quotes[ticker])
+                else:
+                    record = error_record(ticker, errors[ticker])
+                sys.stdout.write(json.dumps(record, ensure_ascii=False) + "\n")
+            sys.stdout.flush()
+
+            if not watch:
+                return 1 if errors else 0
+            await asyncio.sleep(watch)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="여러 티커의 시세를 JSON Lines로 출력")
+    parser.add_argument("tickers", nargs="*", help="야후 티커 (BTC/KRW처럼 파생 통화 쌍도 가능, -: 표준 입력)")
+    parser.add_argument("-f", "--file", help="티커 목록 파일 (한 줄에 하나)")
+    parser.add_argument("--base-url", help="시세 서버 주소 (기본값: QUOTE_BASE_URL 또는 야후)")
+    parser.add_argument("--watch", type=float, metavar="SECONDS", help="이 간격으로 계속 조회")
+    args = parser.parse_args(argv)
+
+    tickers = [t for t in args.tickers if t != "-"]
+    if "-" in args.tickers:
+        tickers += read_tickers(sys.stdin)
+    if args.file:
+        with open(args.file, encoding="utf-8") as f:
+            tickers += read_tickers(f)
+    if not tickers:
+        parser.error("조회할 티커가 없습니다")
+
+    try:
+        return asyncio.run(run(tickers, args.base_url, args.watch))
+    except KeyboardInterrupt:
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,163 @@
+"""
+===================================================================================
+Quote Core (Qt 없이 쓰는 시세 조회)
+===================================================================================
+목적: 시세 조회 / 해석 / 변동률 계산을 PyQt5 없이 쓸 수 있게 모아 둡니다.
+      스크립트, cron 작업, 서버에서는 이 모듈만 불러오면 되고 (quote_cli.py 참고),
+      위젯의 QuoteEngine도 같은 함수(fetch_chunk 등)로 조회합니다.
+
+    - get_quotes(symbols)              : 동기 배치 API (내부에서 asyncio 루프를 돌림)
+    - await get_quotes_async(symbols)  : 비동기 배치 API (20개씩 나눠 동시에 요청)
+    - change_percent(quote)            : 전일 대비 변동률 (%)
+
+aiohttp는 실제로 요청할 때 불러옵니다 (불러오기만 하는 스크립트는 빨리 시작).
+===================================================================================
+"""
+
+import asyncio
+
+from cross_rates import CrossRates, is_derived
+from quote_providers import QuoteError, HedgedFetcher, default_providers, HEADERS
+
+
+# 호스트당 동시 연결 수 (keep-alive로 재사용)
+POOL_MAXSIZE = 8
+
+
+def chunked(items, size):
+    """리스트를 size개씩 잘라서 돌려줍니다."""
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+# ===================================================================================
+# [비동기 조회] asyncio 루프에서 쓰는 배치 조회
+# ===================================================================================
+# 엔진은 asyncio 루프 하나에서 여러 배치 요청을 동시에 보냅니다.
+# 티커가 100개면 요청 5개가 동시에 나가며, 스레드는 늘어나지 않습니다.
+# ===================================================================================
+
+def make_async_session():
+    """
+    asyncio 루프 안에서 호출해야 합니다 (aiohttp 세션은 루프에 묶임).
+
+    연결 풀은 keep-alive로 유지되고, gzip 응답은 자동으로 풀립니다.
+    """
+    import aiohttp
+
+    connector = aiohttp.TCPConnector(limit=POOL_MAXSIZE, keepalive_timeout=120)
+    return aiohttp.ClientSession(connector=connector, headers=HEADERS,
+                                 timeout=aiohttp.ClientTimeout(total=5))
+
+
+# ===================================================================================
+# [배치 API] 티커 수에 상관없이 한 번에 조회
+# ===================================================================================
+# 엔진의 조회 주기와 같은 경로입니다: 제공자 묶음(HedgedFetcher)으로 20개씩 동시에 요청하고,
+# 느린 요청은 헤지, 실패한 요청은 다음 제공자로 넘깁니다.
+# ===================================================================================
+
+async def fetch_chunk(fetcher, session, symbols, last_timestamps=None):
+    """
+    티커 한 묶음(최대 fetcher.max_symbols개)을 조회합니다.
+
+    Args:
+        fetcher (HedgedFetcher): 제공자 묶음
+        session (aiohttp.ClientSession): make_async_session()으로 만든 세션
+        symbols (list): 티커 목록
+        last_timestamps (dict): {티커: 이미 가진 마지막 봉 시각} (decode_spark 참고)
+
+    Returns:
+        tuple: (quotes, series) - {티커: Quote}, {티커: (시각 목록, 종가 목록)}
+
+    Raises:
+        QuoteError: 요청 실패. 해석 실패는 "data", 그 밖의 예외는 "unknown" (원래 예외는 __cause__)
+    """
+    try:
+        quotes, series, _ = await fetcher.fetch(session, symbols, last_timestamps)
+    except QuoteError:
+        raise
+    except ValueError as e:
+        raise QuoteError("data") from e
+    except Exception as e:
+        raise QuoteError("unknown") from e
+    return quotes, series
+
+
+async def get_quotes_async(symbols, session=None, fetcher=None, base_url=None):
+    """
+    여러 티커의 시세를 가져옵니다 (중복은 한 번만, 20개씩 나눠 동시에 요청).
+
+    "BTC/KRW"처럼 "/"가 있는 파생 티커는 다리 티커를 함께 조회해서 계산합니다 (cross_rates 참고).
+
+    Args:
+        symbols (iterable): 티커 목록
+        session (aiohttp.ClientSession): 재사용할 세션 (기본값: 이번 호출 동안만 쓰는 새 세션)
+        fetcher (HedgedFetcher): 제공자 묶음 (기본값: default_providers(base_url))
+        base_url (str): 시세 서버 주소 (fetcher를 주지 않았을 때, 기본값: QUOTE_BASE_URL)
+
+    Returns:
+        tuple: ({티커: Quote}, {티커: QuoteError}) - 요청한 티커는 둘 중 한 곳에 들어감
+    """
+    symbols = list(dict.fromkeys(symbols))
+    fetcher = fetcher or HedgedFetcher(default_providers(base_url))
+    if session is None:
+        async with make_async_session() as session:
+            return await get_quotes_async(symbols, session, fetcher)
+
+    quotes, errors = {}, {}
+    cross = CrossRates()
+    upstream = []
+    for ticker in symbols:
+        if not is_derived(ticker):
+            upstream.append(ticker)
+        elif cross.resolve(ticker, symbols):
+            upstream.extend(cross.legs_of(ticker))
+        else:
+            errors[ticker] = QuoteError("data", ticker=ticker)  # 환산 경로 없음
+    upstream = list(dict.fromkeys(upstream))
+
+    chunks = list(chunked(upstream, fetcher.max_symbols))
+    results = await asyncio.gather(*(fetch_chunk(fetcher, session, chunk) for chunk in chunks),
+                                   return_exceptions=True)
+    for chunk, result in zip(chunks, results):
+        if isinstance(result, QuoteError):
+            errors.update((ticker, result) for ticker in chunk)
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            quotes.update((t, q) for t, q in result[0].items() if t in chunk)
+
+    for ticker in symbols:
+        if is_derived(ticker) and ticker not in errors:
+            quote = cross.combine(ticker, quotes)
+            if quote:
+                quotes[ticker] = quote
+            else:
+                legs = [errors[leg] for leg in cross.legs_of(ticker) if leg in errors]
+                errors[ticker] = legs[0] if legs else QuoteError("data", ticker=ticker)
+    for ticker in upstream:
+        if ticker not in quotes and ticker not in errors:
+            errors[ticker] = QuoteError("data", ticker=ticker)  # 응답에 없음
+
+    # 다리로만 조회한 티커는 돌려주지 않음
+    requested = set(symbols)
+    return ({t: q for t, q in quotes.items() if t in requested},
+            {t: e for t, e in errors.items() if t in requested})
+
+
+def get_quotes(symbols, base_url=None):
+    """
+    get_quotes_async()의 동기 버전 (새 asyncio 루프에서 실행).
+
+    이미 asyncio 루프 안이라면 get_quotes_async()를 await 하세요.
+
+    Returns:
+        tuple: ({티커: Quote}, {티커: QuoteError})
+    """
+    return asyncio.run(get_quotes_async(symbols, base_url=base_url))
+
+
+def change_percent(quote):
+    """전일 대비 변동률 (%). 전일 종가가 없으면 0"""
+    return quote.change / quote.prev_close * 100 if quote.prev_close else 0.0
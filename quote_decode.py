@@ -0,0 +1,298 @@
+"""
+===================================================================================
+Quote Decode (spark 응답 해석)
+===================================================================================
+목적: 야후 spark 응답에서 필요한 값만 꺼냅니다.
+
+응답 형식 (둘 다 해석):
+    - v8 (/v8/finance/spark, 지금 요청하는 형식): 티커별 평평한 맵
+        {"KRW=X": {"symbol", "timestamp": [...], "close": [...], "chartPreviousClose", "previousClose", ...}}
+      현재가는 마지막 종가(null이 아닌 값), 시세 시각은 그 봉의 시각입니다.
+    - v7 (spark -> result -> [{symbol, response: [{meta, timestamp, indicators.quote[0].close}]}]):
+      예전 녹화 파일(quote_recorder) 재생용
+
+response.json()은 응답 전체(티커마다 하루치 시각/종가 배열과 중첩 딕셔너리)를
+파이썬 객체로 만들지만, 실제로 쓰는 것은 meta의 몇 개 필드와 새로 생긴 분봉뿐입니다.
+decode_spark()는 응답 문자열에서
+    - 전일 종가 / meta 같은 몇 개 값만 골라서 해석하고
+    - 시각/종가 배열은 이미 가진 마지막 봉 이후 꼬리 부분만 잘라서 해석합니다.
+형식이 예상과 다르거나 시세를 하나도 꺼내지 못하면 전체 JSON 해석(parse_spark)으로 되돌아가고,
+그래도 하나도 없으면 ValueError를 냅니다 (형식이 바뀌었는데 조용히 "데이터 없음"만 나지 않도록).
+===================================================================================
+"""
+
+import json
+import time
+from collections import namedtuple
+
+
+# 한 티커의 시세 (price: 현재가, change: 전일 대비 변동폭, timestamp: 시세 시각)
+# stale이 True면 캐시에서 꺼낸 값 (아직 이번 실행에서 새로 받지 못함)
+Quote = namedtuple("Quote", "ticker price change prev_close timestamp stale", defaults=(False,))
+
+_decoder = json.JSONDecoder()
+
+
+def make_quote(meta, now=None):
+    """meta 딕셔너리로 Quote를 만듭니다. 필요한 값이 없으면 None"""
+    price = meta.get('regularMarketPrice')
+    prev_close = meta.get('chartPreviousClose')
+    if price is None or prev_close is None:
+        return None
+    return Quote(meta['symbol'], price, price - prev_close, prev_close,
+                 meta.get('regularMarketTime') or now or time.time())
+
+
+def quote_from_bars(ticker, prev_close, timestamps, closes, now=None):
+    """
+    v8 항목으로 Quote를 만듭니다 (현재가 = 마지막 종가). 종가나 전일 종가가 없으면 None
+    """
+    if prev_close is None:
+        return None
+    for ts, close in zip(reversed(timestamps), reversed(closes)):
+        if close is not None:
+            return Quote(ticker, close, close - prev_close, prev_close, ts or now or time.time())
+    return None
+
+
+# ===================================================================================
+# [전체 해석] response.json() 결과(dict)에서 꺼내기
+# ===================================================================================
+
+def spark_entries(data):
+    """
+    spark 응답(dict)의 티커별 항목을 (티커, 전일 종가, meta, 시각 목록, 종가 목록)으로 돌려줍니다.
+
+    v8은 meta가 없어 None, v7은 전일 종가 대신 meta를 씁니다 (make_quote).
+    """
+    if 'spark' in data:
+        for item in (data.get('spark') or {}).get('result') or []:
+            responses = item.get('response') or []
+            if not responses:
+                continue
+            response = responses[0]
+            meta = dict(response.get('meta', {}), symbol=item['symbol'])
+            quote = (response.get('indicators', {}).get('quote') or [{}])[0]
+            yield item['symbol'], None, meta, response.get('timestamp') or [], quote.get('close') or []
+        return
+
+    for ticker, item in data.items():
+        if not isinstance(item, dict):
+            continue
+        prev_close = item.get('chartPreviousClose')
+        if prev_close is None:
+            prev_close = item.get('previousClose')
+        yield ticker, prev_close, None, item.get('timestamp') or [], item.get('close') or []
+
+
+def parse_spark(data):
+    """
+    spark 응답(JSON)에서 티커별 현재가와 전일 종가를 꺼냅니다.
+
+    Returns:
+        dict: {티커: Quote}
+    """
+    quotes = {}
+    now = time.time()
+
+    for ticker, prev_close, meta, timestamps, closes in spark_entries(data):
+        if meta is not None:
+            quote = make_quote(meta, now)
+        else:
+            quote = quote_from_bars(ticker, prev_close, timestamps, closes, now)
+        if quote:
+            quotes[quote.ticker] = quote
+
+    return quotes
+
+
+def parse_spark_series(data):
+    """
+    spark 응답에서 티커별 1분봉 시계열(시각, 종가)을 꺼냅니다.
+
+    Returns:
+        dict: {티커: (시각 목록, 종가 목록)}
+    """
+    series = {}
+    for ticker, _, _, timestamps, closes in spark_entries(data):
+        if timestamps and len(timestamps) == len(closes):
+            series[ticker] = (timestamps, closes)
+
+    return series
+
+
+# ===================================================================================
+# [가벼운 해석] 응답 문자열에서 필요한 부분만 꺼내기
+# ===================================================================================
+
+def decode_spark(text, last_timestamps=None):
+    """
+    spark 응답 문자열에서 시세와 새 분봉만 꺼냅니다.
+
+    Args:
+        text (str): spark 응답 본문
+        last_timestamps (dict): {티커: 이미 가진 마지막 봉 시각}. 있는 티커는 그 이후 봉만 해석
+
+    Returns:
+        tuple: (quotes, series)
+            quotes: {티커: Quote}
+            series: {티커: (시각 목록, 종가 목록)} - 마지막 봉과 같은 시각의 봉부터 포함
+
+    Raises:
+        ValueError: JSON이 아니거나, 시세를 하나도 꺼내지 못함 (응답 형식이 바뀌었을 가능성)
+    """
+    try:
+        quotes, series = _decode_spark_lean(text, last_timestamps or {})
+        if quotes:
+            return quotes, series
+    except (ValueError, KeyError, IndexError):
+        pass
+
+    # 예상과 다른 형식이거나 하나도 못 꺼냈으면 전체 해석으로 (결과는 같음)
+    data = json.loads(text)
+    if not isinstance(data, dict):
+        raise ValueError("spark response is not a JSON object")
+    quotes = parse_spark(data)
+    if not quotes:
+        raise ValueError(f"spark response decoded to no quotes (unexpected format?): {text[:80]!r}")
+    return quotes, parse_spark_series(data)
+
+
+def _decode_spark_lean(text, last_timestamps):
+    if text.lstrip().startswith('{"spark"'):
+        return _decode_v7_lean(text, last_timestamps)
+    return _decode_v8_lean(text, last_timestamps)
+
+
+def _decode_v8_lean(text, last_timestamps):
+    """v8: {"티커": {...}, ...} - 항목 안에는 중첩 객체가 없으므로 '{' ~ '}'가 한 티커의 구간"""
+    quotes = {}
+    series = {}
+    now = time.time()
+
+    pos = text.index('{') + 1
+    while True:
+        key_pos = text.find('"', pos)
+        if key_pos == -1:
+            break
+        ticker, key_end = _decoder.raw_decode(text, key_pos)
+        begin = _value_start(text, key_end)
+        if text[begin] != '{':
+            raise ValueError(f"unexpected spark entry for {ticker}")
+        end = text.index('}', begin)
+        pos = end + 1
+
+        prev_close = _scalar(text, '"chartPreviousClose"', begin, end)
+        if prev_close is None:
+            prev_close = _scalar(text, '"previousClose"', begin, end)
+
+        last = last_timestamps.get(ticker)
+        bars = _decode_bars(text, begin, end, last)
+        quote = quote_from_bars(ticker, prev_close, *bars, now) if bars else None
+        if quote is None and bars and last is not None:
+            # 새 봉의 종가가 모두 null이면 배열 전체에서 마지막 종가를 찾음
+            full = _decode_bars(text, begin, end, None)
+            quote = quote_from_bars(ticker, prev_close, *full, now) if full else None
+        if quote is None:
+            continue
+        quotes[ticker] = quote
+        series[ticker] = bars
+
+    return quotes, series
+
+
+def _scalar(text, key, begin, end):
+    """구간 안에서 "key": 값 하나를 해석합니다. 없으면 None"""
+    key_pos = text.find(key, begin, end)
+    if key_pos == -1:
+        return None
+    return _decoder.raw_decode(text, _value_start(text, key_pos + len(key)))[0]
+
+
+def _value_start(text, pos):
+    """':' 뒤 공백을 건너뛴 값의 시작 위치"""
+    pos = text.index(':', pos) + 1
+    while text[pos] in ' \t\r\n':
+        pos += 1
+    return pos
+
+
+def _decode_v7_lean(text, last_timestamps):
+    quotes = {}
+    series = {}
+    now = time.time()
+
+    # 결과 항목마다 "response" 키가 하나씩 있으므로, 그 사이를 한 티커의 구간으로 봄
+    starts = []
+    pos = text.find('"response"')
+    while pos != -1:
+        starts.append(pos)
+        pos = text.find('"response"', pos + 10)
+    starts.append(len(text))
+
+    for begin, end in zip(starts, starts[1:]):
+        meta_key = text.find('"meta"', begin, end)
+        if meta_key == -1:
+            continue
+
+        meta, _ = _decoder.raw_decode(text, text.index('{', meta_key))
+        quote = make_quote(meta, now)
+        if quote is None:
+            continue
+        quotes[quote.ticker] = quote
+
+        bars = _decode_bars(text, begin, end, last_timestamps.get(quote.ticker))
+        if bars:
+            series[quote.ticker] = bars
+
+    return quotes, series
+
+
+def _array_bounds(text, key, begin, end):
+    """구간 안에서 "key": [ ... ] 배열의 '['와 ']' 위치를 찾습니다. 없으면 None"""
+    key_pos = text.find(key, begin, end)
+    if key_pos == -1:
+        return None
+    open_pos = _value_start(text, key_pos + len(key))
+    if text[open_pos] != '[':
+        return None  # "close": null 등
+    return open_pos, text.index(']', open_pos)
+
+
+def _decode_bars(text, begin, end, last_timestamp):
+    ts_bounds = _array_bounds(text, '"timestamp"', begin, end)
+    close_bounds = _array_bounds(text, '"close"', begin, end)
+    if ts_bounds is None or close_bounds is None:
+        return None
+
+    if last_timestamp is None:
+        # 처음 받는 티커: 배열 두 개만 통째로 해석 (meta 외 나머지 구조는 건너뜀)
+        timestamps = json.loads(text[ts_bounds[0]:ts_bounds[1] + 1])
+        closes = json.loads(text[close_bounds[0]:close_bounds[1] + 1])
+    else:
+        # 이미 가진 티커: 배열 끝에서부터 마지막 봉 시각에 닿을 때까지만 해석
+        timestamps = []
+        for item in _iter_tail(text, *ts_bounds):
+            timestamps.append(int(item))
+            if timestamps[-1] <= last_timestamp:
+                break
+        closes = [None if item.strip() == 'null' else float(item)
+                  for _, item in zip(timestamps, _iter_tail(text, *close_bounds))]
+        timestamps.reverse()
+        closes.reverse()
+
+    if not timestamps or len(timestamps) != len(closes):
+        return None
+    return timestamps, closes
+
+
+def _iter_tail(text, open_pos, close_pos):
+    """'[a,b,c]' 배열의 원소 문자열을 뒤에서부터 하나씩 돌려줍니다."""
+    pos = close_pos
+    while pos > open_pos + 1:
+        comma = text.rfind(',', open_pos, pos)
+        start = open_pos if comma == -1 else comma
+        yield text[start + 1:pos]
+        if comma == -1:
+            return
+        pos = comma
@@ -0,0 +1,470 @@
+"""
+===================================================================================
+Quote Engine (배치 시세 엔진)
+===================================================================================
+목적: 구독 중인 모든 티커를 한 번의 HTTP 요청으로 가져와 구독자들에게 나눠 줍니다.
+      통화 쌍마다 스레드와 요청을 하나씩 두던 방식을 대체합니다.
+      조회와 스케줄링은 asyncio 루프 스레드 하나에서 처리합니다.
+      서버 주소와 응답 해석, 헤지/장애 조치는 quote_providers에,
+      Qt와 상관없는 조회 함수(동기/비동기 배치 API 포함)는 quote_core에 있습니다.
+===================================================================================
+"""
+
+import asyncio
+import threading
+from array import array
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from cross_rates import CrossRates, is_derived
+from market_hours import PollScheduler
+from quote_cache import QuoteCache
+from quote_core import chunked, fetch_chunk, make_async_session
+from quote_decode import Quote
+from quote_history import QuoteHistory, history_enabled, history_series
+from quote_metrics import QuoteMetrics, METRICS_PORT, start_metrics_server
+from quote_recorder import configure_providers, close_recorder
+from quote_stream import QuoteStream, STREAM_URL, STREAM_POLL_INTERVAL
+from quote_providers import QuoteError, HedgedFetcher, default_providers
+from ring_buffer import BarRingBuffer
+
+
+# ===================================================================================
+# [엔진] 구독 관리 + 주기적 배치 조회
+# ===================================================================================
+# 구조:
+#   GUI 스레드  --subscribe()-->  엔진 (QObject)  --시그널-->  위젯
+#                                   |
+#                         asyncio 루프 스레드 1개 (조회/스케줄링 전담)
+#
+# 루프 스레드에서 emit한 시그널은 Qt가 GUI 스레드의 슬롯으로 안전하게 전달합니다.
+# ===================================================================================
+
+class QuoteEngine(QObject):
+    """
+    구독된 티커 전체를 주기마다 asyncio 루프에서 조회하는 엔진
+
+    위젯은 subscribe()로 필요한 티커를 등록하고 quote_updated 시그널을 연결한 뒤,
+    자기 티커의 Quote만 골라서 쓰면 됩니다. 캐시에 마지막 시세가 있으면
+    subscribe() 즉시 stale=True인 Quote를 먼저 보내고, 백그라운드에서 새로 조회합니다.
+    "BTC/KRW"처럼 "/"가 있는 파생 티커는 조회 중인 다리 티커로 계산합니다 (cross_rates 참고).
+    QUOTE_STREAM_URL이 있으면 스트림으로 받은 시세를 같은 시그널로 보내고, 폴링은 보정용으로만 씁니다.
+
+    시그널 (Signals):
+        - quote_updated: 티커 하나의 시세 (Quote)
+        - series_updated: 티커의 분봉에 새 봉이 생김 (series()로 조회)
+        - error_occurred: 조회 실패 (QuoteError)
+        - poll_finished: 한 번의 조회 주기가 끝남 (그 주기의 시그널은 모두 보낸 뒤)
+    """
+
+    quote_updated = pyqtSignal(object)   # Quote
+    series_updated = pyqtSignal(str)     # 티커
+    error_occurred = pyqtSignal(object)  # QuoteError
+    poll_finished = pyqtSignal()
+
+    SETTLE_DELAY = 0.05    # 연달아 들어온 subscribe()를 한 번의 조회로 묶는 대기 (초)
+
+    _shared = None
+
+    @classmethod
+    def shared(cls):
+        """프로세스 안의 모든 위젯이 함께 쓰는 엔진을 돌려줍니다."""
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    def __init__(self, base_url=None, cache=None, providers=None, history=None, stream_url=None, parent=None):
+        super().__init__(parent)
+        # 조회 계측 (응답 시간, 결과별 횟수 등 - QUOTE_METRICS_PORT로 외부 조회 가능)
+        self.metrics = QuoteMetrics()
+        self.metrics_server = None
+        # 시세 제공자 (기본: 야후 query1 -> query2, 느리면 헤지 / 실패하면 다음 제공자)
+        # QUOTE_RECORD / QUOTE_REPLAY가 있으면 응답을 녹화하거나 녹화 파일을 재생 (quote_recorder 참고)
+        providers, replaying = configure_providers(providers or default_providers(base_url),
+                                                   explicit=providers is not None)
+        self.fetcher = HedgedFetcher(providers, metrics=self.metrics)
+        # 자산군별 조회 주기 + 실패 백오프 (재생 중에는 재생 제공자가 녹화 간격대로 속도를 조절)
+        self.scheduler = PollScheduler(fixed_interval=0 if replaying else None)
+        self.cache = cache or QuoteCache()  # 마지막 정상 시세 (파일)
+        # 받은 시세/분봉 기록 (quote_history.db, QUOTE_HISTORY=0이면 끔)
+        self.history = history if history is not None else (QuoteHistory() if history_enabled() else None)
+        self.running = False
+        self._latest = {}                   # 티커 -> 이번 실행에서 받은 최신 Quote
+        self._series = {}                   # 티커 -> BarRingBuffer (당일 1분봉)
+        self._series_lock = threading.Lock()
+
+        self.cross = CrossRates()           # 파생 통화 쌍 경로 (BTC/KRW = BTC-USD x KRW=X 등)
+
+        # 스트리밍 시세 (QUOTE_STREAM_URL, 연결 중에는 폴링을 드물게 - quote_stream 참고)
+        if stream_url is None and providers is None and not replaying:
+            stream_url = STREAM_URL
+        self.stream = QuoteStream(stream_url, self.symbols, self._on_stream_quotes,
+                                  self._on_stream_state, self._on_stream_gap) if stream_url else None
+
+        self._lock = threading.Lock()
+        self._subscriptions = {}  # 티커 -> 구독 횟수 (야후에서 조회하는 티커)
+        self._derived = {}        # 파생 티커 -> 구독 횟수 (요청 없이 계산)
+        self._fresh = set()       # 아직 한 번도 조회하지 않은 새 티커 (다음에 깨어나면 그 자산군만 바로 조회)
+        self._refresh_requested = False
+        self._thread = None       # asyncio 루프 스레드
+        self._loop = None
+        self._main_task = None
+        self._wake = None         # asyncio.Event: 즉시 조회 / 종료 신호
+
+    # --- 구독 관리 ---
+    def subscribe(self, ticker):
+        if is_derived(ticker):
+            self._subscribe_derived(ticker)
+            return
+
+        with self._lock:
+            count = self._subscriptions.get(ticker, 0)
+            self._subscriptions[ticker] = count + 1
+
+        # 이미 가진 값(최신 또는 캐시)이 있으면 네트워크를 기다리지 않고 바로 표시
+        quote = self.latest(ticker)
+        if quote:
+            self.quote_updated.emit(quote)
+
+        # 새 티커면 다음 주기까지 기다리지 않고 그 자산군을 바로 조회
+        if count == 0:
+            with self._lock:
+                self._fresh.add(ticker)
+            self._wake_loop()
+        self.start()
+
+    def unsubscribe(self, ticker):
+        subscriptions = self._derived if is_derived(ticker) else self._subscriptions
+        with self._lock:
+            count = subscriptions.get(ticker, 0)
+            if count == 0:
+                return
+            if count == 1:
+                subscriptions.pop(ticker)
+            else:
+                subscriptions[ticker] = count - 1
+
+        # 파생 티커는 다리 구독도 하나씩 해제
+        if subscriptions is self._derived:
+            for leg in self.cross.legs_of(ticker):
+                self.unsubscribe(leg)
+
+    def _subscribe_derived(self, ticker):
+        # 다리 티커를 구독 (이미 조회 중인 다리면 추가 비용 없음, 아니어도 같은 배치 요청에 포함)
+        path = self.cross.resolve(ticker, self.symbols())
+        if path is None:
+            self.error_occurred.emit(QuoteError("data", ticker=ticker))
+            return
+
+        with self._lock:
+            self._derived[ticker] = self._derived.get(ticker, 0) + 1
+        for leg, _ in path:
+            self.subscribe(leg)
+
+        quote = self.latest(ticker)
+        if quote:
+            self.quote_updated.emit(quote)
+
+    def symbols(self):
+        """야후에서 조회할 티커 목록 (파생 티커 제외)"""
+        with self._lock:
+            return list(self._subscriptions)
+
+    def derived_symbols(self):
+        with self._lock:
+            return list(self._derived)
+
+    def latest(self, ticker):
+        """
+        티커의 가장 최근 시세를 돌려줍니다.
+
+        이번 실행에서 받은 값이 없으면 캐시 값을 stale=True로 돌려주며,
+        네트워크가 끊겨 있을 때도 마지막 시세를 읽을 수 있습니다.
+
+        Returns:
+            Quote: 시세 또는 None (한 번도 받은 적 없음)
+        """
+        if is_derived(ticker):
+            return self.cross.combine(ticker, {leg: self.latest(leg) for leg in self.cross.legs_of(ticker)})
+
+        quote = self._latest.get(ticker)
+        if quote:
+            return quote
+
+        entry = self.cache.get(ticker)
+        if entry:
+            return Quote(ticker, entry["price"], entry["change"], entry["prev_close"],
+                         entry["timestamp"], stale=True)
+        return None
+
+    def series(self, ticker):
+        """
+        티커의 1분봉 시계열 복사본을 돌려줍니다 (GUI 스레드에서 호출).
+
+        Returns:
+            tuple: (array('q') 시각, array('d') 종가). 받은 적이 없으면 빈 배열
+        """
+        if is_derived(ticker):
+            return self.cross.combine_series(ticker, {leg: self.series(leg) for leg in self.cross.legs_of(ticker)})
+
+        with self._series_lock:
+            buffer = self._series.get(ticker)
+            if buffer is None:
+                return array('q'), array('d')
+            return buffer.snapshot()
+
+    def history_series(self, ticker, seconds, max_points=300):
+        """
+        기록 저장소에서 최근 seconds초의 종가 시계열을 읽습니다 (당일보다 긴 차트용, GUI 스레드에서 호출).
+
+        Returns:
+            tuple: (array('q') 시각, array('d') 종가). 기록이 꺼져 있거나 없으면 빈 배열
+        """
+        return history_series(self.history, ticker, seconds, max_points)
+
+    def refresh(self):
+        """
+        대기 중인 루프를 깨워 즉시 조회합니다.
+
+        장이 닫힌 자산군과 실패 백오프 중인 자산군은 원래 일정대로 둡니다 (PollScheduler.expedite).
+        """
+        with self._lock:
+            self._refresh_requested = True
+        self._wake_loop()
+
+    def _wake_loop(self):
+        with self._lock:
+            if self.running:
+                self._loop.call_soon_threadsafe(self._wake.set)
+
+    # --- 루프 스레드 ---
+    def start(self):
+        """루프 스레드가 없으면 시작합니다 (여러 번 호출해도 안전)."""
+        with self._lock:
+            if self.running:
+                return
+            self.running = True
+            self._loop = asyncio.new_event_loop()
+            self._wake = asyncio.Event()
+            self._main_task = self._loop.create_task(self._main())
+            self._thread = threading.Thread(target=self._run_loop, name="quote-engine", daemon=True)
+            self._thread.start()
+
+            if METRICS_PORT and self.metrics_server is None:
+                self.metrics_server = start_metrics_server(self.metrics, METRICS_PORT)
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_until_complete(self._main_task)
+        except asyncio.CancelledError:
+            pass  # stop()으로 취소됨
+        finally:
+            self.cache.save()
+            if self.history:
+                self.history.close(0.5)  # 남은 기록을 씀
+            close_recorder()
+            self._loop.close()
+
+    async def _main(self):
+        # 처음 조회는 기다리지 않음
+        self._wake.set()
+
+        async with make_async_session() as session:
+            stream_task = self._loop.create_task(self.stream.run(session)) if self.stream else None
+            try:
+                await self._poll_loop(session)
+            finally:
+                if stream_task:
+                    stream_task.cancel()
+
+    async def _poll_loop(self, session):
+        while self.running:
+            # 가장 먼저 조회할 자산군까지 타이머 하나로 대기
+            # (refresh/stop/새 구독/스트림 끊김 시에는 즉시 깨어남)
+            delay = self.scheduler.seconds_until_due(self.symbols())
+            try:
+                await asyncio.wait_for(self._wake.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+            # 깨운 신호가 있으면 연달아 들어오는 subscribe()를 기다림
+            # (delay가 0이면 wait_for는 이미 set된 신호도 시간 초과로 처리하므로 is_set()으로 확인)
+            if self._wake.is_set():
+                await asyncio.sleep(self.SETTLE_DELAY)
+            self._wake.clear()
+
+            if not self.running:
+                break
+
+            with self._lock:
+                fresh, self._fresh = self._fresh, set()
+                refresh, self._refresh_requested = self._refresh_requested, False
+            symbols = self.symbols()
+            if refresh:
+                self.scheduler.expedite(symbols)
+
+            # 새 티커가 있는 자산군만 시간과 관계없이, 나머지는 일정대로 (백오프 중이면 기다림)
+            groups = self.scheduler.due_groups(symbols, force=fresh)
+            if not groups:
+                continue
+
+            # 이번에 조회할 자산군들의 티커를 합쳐 배치 요청으로 보냄
+            tickers = [t for members in groups.values() for t in members]
+            failed = await self.poll_once(session, tickers)
+            self.poll_finished.emit()
+
+            # 스트림이 연결되어 있으면 다음 폴링은 분봉/누락 보정용으로 드물게
+            interval = STREAM_POLL_INTERVAL if self.stream and self.stream.live else None
+            for name, members in groups.items():
+                if failed.isdisjoint(members):
+                    self.scheduler.record_success(name, interval=interval)
+                else:
+                    self.scheduler.record_failure(name)
+
+            # 이번 주기에 받은 시세를 파일에 반영 (GUI 스레드가 아닌 루프 스레드에서)
+            self.cache.save()
+
+    async def poll_once(self, session, symbols):
+        """
+        티커 목록을 제공자의 최대 심볼 수(야후: 20개) 단위로 묶어 동시에 조회합니다.
+
+        Returns:
+            set: 요청이 실패한 티커들 (모두 성공했으면 빈 집합)
+        """
+        chunks = list(chunked(symbols, self.fetcher.max_symbols))
+        results = await asyncio.gather(*(self._poll_chunk(session, chunk) for chunk in chunks))
+        failed = {t for chunk, ok in zip(chunks, results) if not ok for t in chunk}
+
+        # 이번에 받은 다리로 파생 시세 계산 (추가 요청 없음)
+        for ticker in self.cross.dependents(set(symbols) - failed, self.derived_symbols()):
+            quote = self.latest(ticker)
+            if quote:
+                self.quote_updated.emit(quote)
+        return failed
+
+    async def _poll_chunk(self, session, chunk):
+        try:
+            quotes, series = await fetch_chunk(self.fetcher, session, chunk, self._last_timestamps(chunk))
+        except QuoteError as e:
+            self.metrics.record_error(e.kind, e.__cause__)
+            self.error_occurred.emit(e)
+            return False
+
+        self.metrics.record_quotes(len(quotes))
+        for ticker in chunk:
+            quote = quotes.get(ticker)
+            if quote:
+                self._latest[ticker] = quote
+                self.cache.put(quote)
+                if self.history:
+                    self.history.add_quote(quote)
+                self.quote_updated.emit(quote)
+            else:
+                self.metrics.record_error("data")
+                self.error_occurred.emit(QuoteError("data", ticker=ticker))
+                for derived in self.cross.dependents((ticker,), self.derived_symbols()):
+                    self.error_occurred.emit(QuoteError("data", ticker=derived))
+
+        # 시세를 먼저 보낸 뒤 분봉 갱신 (차트가 전일 종가 기준선을 알 수 있도록)
+        self._update_series(series)
+        return True
+
+    # --- 스트리밍 (루프 스레드에서 호출) ---
+    def _on_stream_quotes(self, quotes):
+        """스트림에서 모은 시세를 폴링 결과와 같은 경로로 보냅니다 (티커별 최신 값 하나씩)."""
+        with self._lock:
+            subscribed = set(self._subscriptions)
+        with self._series_lock:
+            charted = set(self._series)
+
+        bars = {}
+        updated = []
+        for quote in quotes:
+            ticker = quote.ticker
+            if ticker not in subscribed:
+                continue  # 그사이 구독 해제됨
+            self._latest[ticker] = quote
+            self.cache.put(quote)
+            if self.history:
+                self.history.add_quote(quote)
+            self.quote_updated.emit(quote)
+            updated.append(ticker)
+            # 진행 중인 1분봉 종가도 갱신 (폴링으로 하루치 분봉을 받은 티커만 - 앞부분이 비지 않도록)
+            if ticker in charted:
+                bars[ticker] = ((quote.timestamp - quote.timestamp % 60,), (quote.price,))
+        self.metrics.record_quotes(len(updated))
+
+        for ticker in self.cross.dependents(updated, self.derived_symbols()):
+            quote = self.latest(ticker)
+            if quote:
+                self.quote_updated.emit(quote)
+        self._update_series(bars, record=False)
+
+    def _on_stream_state(self, live):
+        # 끊기면 바로 한 번 폴링하고, 이후 다시 연결될 때까지 평소 주기로 폴링
+        # (장이 닫혔거나 백오프 중인 자산군은 원래 일정대로)
+        if not live and self.running:
+            self.scheduler.expedite(self.symbols())
+            self._wake.set()
+
+    def _on_stream_gap(self):
+        # 순번이 건너뜀 -> 빠진 시세를 폴링으로 다시 맞춤
+        self.scheduler.expedite(self.symbols())
+        self._wake.set()
+
+    def _last_timestamps(self, tickers):
+        """티커별 링 버퍼의 마지막 봉 시각 (이후 봉만 해석하도록 decode_spark에 전달)"""
+        with self._series_lock:
+            return {t: self._series[t].last_timestamp for t in tickers
+                    if t in self._series and len(self._series[t])}
+
+    def _update_series(self, series, record=True):
+        """
+        받은 분봉 중 새 봉만 링 버퍼에 덧붙이고, 바뀐 티커(와 그 티커를 다리로 쓰는 파생 티커)를 알립니다.
+
+        Args:
+            series (dict): 티커 -> (시각 목록, 종가 목록)
+            record (bool): 기록 저장소에도 남길지 (스트림 시세는 add_quote로 이미 기록)
+        """
+        updated = []
+        for ticker, (timestamps, closes) in series.items():
+            if record and self.history:
+                self.history.add(ticker, timestamps, closes)
+            with self._series_lock:
+                buffer = self._series.get(ticker)
+                if buffer is None:
+                    buffer = self._series[ticker] = BarRingBuffer()
+                changed = buffer.extend(timestamps, closes)
+            if changed:
+                updated.append(ticker)
+                self.series_updated.emit(ticker)
+
+        for ticker in self.cross.dependents(updated, self.derived_symbols()):
+            self.series_updated.emit(ticker)
+
+    def stop(self):
+        """
+        루프에 종료를 알리고 기다리지 않고 바로 돌아옵니다.
+
+        진행 중인 HTTP 요청은 취소되므로 GUI 스레드가 타임아웃(5초)만큼 멈추지 않습니다.
+        루프 스레드는 데몬 스레드라 프로그램 종료를 막지 않습니다.
+        """
+        with self._lock:
+            if not self.running:
+                return
+            self.running = False
+            self._loop.call_soon_threadsafe(self._main_task.cancel)
+
+    def wait(self, timeout=None):
+        """
+        루프 스레드가 끝날 때까지 최대 timeout초 기다립니다.
+
+        이벤트 루프(app.exec_)가 끝난 뒤 캐시 저장을 마무리할 시간을 줄 때 씁니다.
+
+        Returns:
+            bool: 스레드가 끝났으면 True
+        """
+        if self._thread is None:
+            return True
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
@@ -0,0 +1,337 @@
+"""
+===================================================================================
+Quote History (시세 기록 저장소)
+===================================================================================
+목적: 엔진이 받은 시세와 1분봉을 로컬 SQLite 파일(quote_history.db)에 쌓아 둡니다.
+      야후가 주는 당일 범위를 넘어 몇 주 / 몇 달치 차트를 그리거나 조회 기록을 분석할 때 씁니다.
+
+    - ticks: 받은 시세 원본 (티커, 시각, 가격)
+    - bars_1m / bars_1h / bars_1d: 미리 계산해 둔 시가/고가/저가/종가 (쓰는 시점에 함께 갱신)
+      -> 한 달치 차트도 1시간봉 수백 개만 읽으면 됨
+
+쓰기는 add()로 큐에 넣기만 하고, 작업 스레드가 모아서 트랜잭션 하나로 기록합니다
+(엔진 루프 스레드와 GUI 스레드는 디스크를 기다리지 않음).
+WAL 모드라 다른 프로세스(허브에서 시세를 받는 위젯 등)가 쓰는 도중에도 읽을 수 있습니다.
+
+QUOTE_HISTORY=0 이면 기록하지 않습니다.
+보존 기간은 QUOTE_HISTORY_RETENTION으로 바꿀 수 있습니다 (예: "ticks=14,bars_1m=90,bars_1d=none").
+DB 파일을 열 수 없으면(읽기 전용 폴더 등) 한 번만 알리고 기록을 끕니다.
+===================================================================================
+"""
+
+import os
+import queue
+import sqlite3
+import threading
+import time
+from array import array
+
+from cross_rates import CrossRates, is_derived
+
+
+HISTORY_FILE = 'quote_history.db'
+
+FLUSH_INTERVAL = 1.0      # 큐를 모아 쓰는 간격 (초)
+BATCH_SIZE = 5000         # 이만큼 쌓이면 간격과 상관없이 바로 씀
+PRUNE_INTERVAL = 3600     # 보존 기간이 지난 행 삭제 주기 (초)
+READ_FACTOR = 5           # 조회 시 max_points의 몇 배까지 읽어서 솎아 낼지 (너무 성긴 단위로 내려가지 않도록)
+
+# 테이블 -> 봉 길이 (초). ticks는 원본이라 None
+LEVELS = (("ticks", None), ("bars_1m", 60), ("bars_1h", 3600), ("bars_1d", 86400))
+
+# 테이블별 보존 기간 (일, None이면 계속 보관)
+RETENTION_DAYS = {"ticks": 7, "bars_1m": 30, "bars_1h": 730, "bars_1d": None}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS ticks (
+    ticker TEXT NOT NULL, ts INTEGER NOT NULL, price REAL NOT NULL,
+    PRIMARY KEY (ticker, ts)) WITHOUT ROWID;
+""" + "".join(f"""
+CREATE TABLE IF NOT EXISTS {table} (
+    ticker TEXT NOT NULL, ts INTEGER NOT NULL,
+    open REAL NOT NULL, high REAL NOT NULL, low REAL NOT NULL, close REAL NOT NULL,
+    first_ts INTEGER NOT NULL, last_ts INTEGER NOT NULL,
+    PRIMARY KEY (ticker, ts)) WITHOUT ROWID;
+""" for table, seconds in LEVELS if seconds)
+
+# 같은 봉에 새 값이 오면 고가/저가는 넓히고, 시가/종가는 더 이른/늦은 값으로 바꿈
+# (SQLite의 UPDATE SET은 모든 식에서 바뀌기 전 값을 봄)
+UPSERT_BAR = """
+INSERT INTO {table} (ticker, ts, open, high, low, close, first_ts, last_ts) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (ticker, ts) DO UPDATE SET
+    open = CASE WHEN excluded.first_ts < first_ts THEN excluded.open ELSE open END,
+    high = MAX(high, excluded.high),
+    low = MIN(low, excluded.low),
+    close = CASE WHEN excluded.last_ts >= last_ts THEN excluded.close ELSE close END,
+    first_ts = MIN(first_ts, excluded.first_ts),
+    last_ts = MAX(last_ts, excluded.last_ts)
+"""
+
+
+def history_enabled():
+    return os.environ.get("QUOTE_HISTORY", "1") != "0"
+
+
+def retention_from_env():
+    """
+    QUOTE_HISTORY_RETENTION 환경 변수에서 테이블별 보존 기간을 읽습니다.
+
+    형식: "테이블=일수,..." (일수 대신 none이면 계속 보관). 잘못된 항목은 알리고 무시합니다.
+
+    Returns:
+        dict: 테이블 -> 보존 기간 (일 또는 None)
+    """
+    retention = {}
+    for item in os.environ.get("QUOTE_HISTORY_RETENTION", "").split(","):
+        if not item.strip():
+            continue
+        table, _, days = item.partition("=")
+        table, days = table.strip(), days.strip().lower()
+        try:
+            if table not in RETENTION_DAYS:
+                raise ValueError(f"unknown table {table!r}")
+            retention[table] = None if days == "none" else float(days)
+        except ValueError as e:
+            print(f"QUOTE_HISTORY_RETENTION Ignored: {item.strip()} ({e})")
+    return retention
+
+
+def connect(path):
+    """WAL 모드 연결 (쓰기 중에도 다른 연결이 읽을 수 있음)"""
+    db = sqlite3.connect(path, timeout=5.0, check_same_thread=False)
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute("PRAGMA synchronous=NORMAL")  # WAL에서는 전원이 나가도 DB가 깨지지 않음 (마지막 몇 건만 잃을 수 있음)
+    return db
+
+
+def rollup(points, seconds):
+    """
+    (티커, 시각, 가격) 목록을 봉 길이 단위로 묶습니다.
+
+    Returns:
+        dict: (티커, 봉 시작 시각) -> [시가, 고가, 저가, 종가, 첫 시각, 마지막 시각]
+    """
+    bars = {}
+    for ticker, ts, price in points:
+        key = (ticker, ts - ts % seconds)  # UTC 기준으로 정렬된 봉
+        bar = bars.get(key)
+        if bar is None:
+            bars[key] = [price, price, price, price, ts, ts]
+            continue
+        if ts < bar[4]:
+            bar[0], bar[4] = price, ts
+        bar[1] = max(bar[1], price)
+        bar[2] = min(bar[2], price)
+        if ts >= bar[5]:
+            bar[3], bar[5] = price, ts
+    return bars
+
+
+class QuoteHistory:
+    """
+    시세 기록 저장소
+
+    add()는 어느 스레드에서 불러도 되고 바로 돌아옵니다. 기록은 작업 스레드가 합니다.
+    query()는 호출한 스레드의 읽기 전용 연결을 씁니다.
+
+    Args:
+        path (str): DB 파일 경로 (기본값: quote_history.db)
+        retention (dict): 테이블별 보존 기간 (일). 주지 않은 테이블은 QUOTE_HISTORY_RETENTION, RETENTION_DAYS 순
+    """
+
+    def __init__(self, path=HISTORY_FILE, retention=None):
+        self.path = path
+        self.retention = {**RETENTION_DAYS, **retention_from_env(), **(retention or {})}
+        self.written = 0          # 기록한 점 수 (벤치마크/디버그용)
+        self.disabled = False     # DB를 열 수 없어 기록을 끈 상태
+
+        self._queue = queue.Queue()
+        self._thread = None
+        self._start_lock = threading.Lock()
+        self._readers = threading.local()
+
+    # --- 쓰기 ---
+    def add(self, ticker, timestamps, prices):
+        """
+        티커의 (시각, 가격) 점들을 기록 대기열에 넣습니다.
+
+        Args:
+            ticker (str): 티커
+            timestamps (sequence): 유닉스 시간 (초)
+            prices (sequence): 같은 길이의 가격 (None은 건너뜀)
+        """
+        if self.disabled:
+            return
+        points = [(ticker, int(ts), price) for ts, price in zip(timestamps, prices) if price is not None]
+        if points:
+            self._ensure_writer()
+            self._queue.put(points)
+
+    def add_quote(self, quote):
+        """Quote 하나를 기록합니다 (캐시에서 꺼낸 stale 시세는 이미 기록된 값이라 무시)."""
+        if not quote.stale:
+            self.add(quote.ticker, (quote.timestamp,), (quote.price,))
+
+    def close(self, timeout=None):
+        """대기열에 남은 점을 기록하고 작업 스레드를 끝냅니다."""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join(timeout)
+
+    def _ensure_writer(self):
+        with self._start_lock:
+            if not self.disabled and (self._thread is None or not self._thread.is_alive()):
+                self._thread = threading.Thread(target=self._run_writer, name="quote-history", daemon=True)
+                self._thread.start()
+
+    def _run_writer(self):
+        # 작업 스레드: 쓰기 연결은 이 스레드만 사용
+        try:
+            db = connect(self.path)
+            db.executescript(SCHEMA)
+        except sqlite3.Error as e:
+            self._disable(e)
+            return
+
+        next_prune = 0
+        try:
+            while True:
+                points, stop = self._drain()
+                if points:
+                    self._write(db, points)
+                if time.time() >= next_prune:
+                    self.prune(db)
+                    next_prune = time.time() + PRUNE_INTERVAL
+                if stop:
+                    break
+        except sqlite3.Error as e:
+            print(f"Quote History Failed: {e}")
+        finally:
+            db.close()
+
+    def _disable(self, error):
+        """DB를 열 수 없으면 기록을 끄고 쌓인 대기열을 버립니다 (다시 시도하지 않음)."""
+        self.disabled = True
+        print(f"Quote History Disabled: {self.path}: {error}")
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+
+    def _drain(self):
+        """FLUSH_INTERVAL 동안(또는 BATCH_SIZE만큼) 대기열을 모읍니다. (점 목록, 종료 여부)"""
+        points = []
+        deadline = time.monotonic() + FLUSH_INTERVAL
+        while len(points) < BATCH_SIZE:
+            try:
+                item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                break
+            if item is None:
+                return points, True
+            points.extend(item)
+        return points, False
+
+    def _write(self, db, points):
+        with db:  # 트랜잭션 하나
+            db.executemany("INSERT OR REPLACE INTO ticks (ticker, ts, price) VALUES (?, ?, ?)", points)
+            for table, seconds in LEVELS:
+                if seconds:
+                    bars = rollup(points, seconds)
+                    db.executemany(UPSERT_BAR.format(table=table),
+                                   [(ticker, ts, *bar) for (ticker, ts), bar in bars.items()])
+        self.written += len(points)
+
+    def prune(self, db):
+        """보존 기간이 지난 행을 지웁니다."""
+        now = time.time()
+        with db:
+            for table, _ in LEVELS:
+                days = self.retention.get(table)
+                if days is not None:
+                    db.execute(f"DELETE FROM {table} WHERE ts < ?", (int(now - days * 86400),))
+
+    # --- 읽기 ---
+    def _reader(self):
+        db = getattr(self._readers, "db", None)
+        if db is None:
+            db = self._readers.db = connect(self.path)
+            db.executescript(SCHEMA)
+        return db
+
+    def query(self, ticker, start, end=None, max_points=300):
+        """
+        기간 안의 종가 시계열을 돌려줍니다.
+
+        읽을 행이 max_points * READ_FACTOR개 이하인 가장 촘촘한 단위(원본 -> 1분 -> 1시간 -> 1일)를
+        고른 뒤 max_points개로 고르게 솎아 냅니다. (예: 1일 -> 원본, 1주 -> 1시간봉, 1달 -> 1시간봉)
+
+        Args:
+            ticker (str): 티커
+            start (float): 시작 시각 (유닉스 시간)
+            end (float): 끝 시각 (기본값: 지금)
+            max_points (int): 최대 점 수
+
+        Returns:
+            tuple: (array('q') 시각, array('d') 종가) - engine.series()와 같은 형식
+        """
+        end = time.time() if end is None else end
+        start, end = int(start), int(end)
+        db = self._reader()
+
+        limit = max_points * READ_FACTOR
+        table = LEVELS[-1][0]
+        for name, seconds in LEVELS:
+            if seconds is None:
+                # 원본은 1분봉보다 촘촘하므로 1분봉도 넘치는 기간이면 세어 보지 않음
+                if (end - start) // 60 + 1 > limit:
+                    continue
+                count = db.execute("SELECT COUNT(*) FROM (SELECT 1 FROM ticks WHERE ticker = ? AND ts BETWEEN ? AND ? "
+                                   "LIMIT ?)", (ticker, start, end, limit + 1)).fetchone()[0]
+            else:
+                count = (end - start) // seconds + 1
+            if count <= limit:
+                table = name
+                break
+
+        column = "price" if table == "ticks" else "close"
+        rows = db.execute(f"SELECT ts, {column} FROM {table} WHERE ticker = ? AND ts BETWEEN ? AND ? ORDER BY ts",
+                          (ticker, start - start % (dict(LEVELS)[table] or 1), end)).fetchall()
+        if len(rows) > max_points:
+            step = len(rows) / max_points
+            rows = [rows[int(i * step)] for i in range(max_points - 1)] + [rows[-1]]
+
+        return array('q', (ts for ts, _ in rows)), array('d', (close for _, close in rows))
+
+
+def history_series(history, ticker, seconds, max_points=300):
+    """
+    최근 seconds초 동안의 종가 시계열 (차트의 1주 / 1개월 범위용, GUI 스레드에서 불러도 됨)
+
+    "BTC/KRW" 같은 파생 티커는 기록에 없으므로 다리 티커의 기록으로 계산합니다.
+
+    Args:
+        history (QuoteHistory): 기록 저장소 (None이면 빈 배열)
+        ticker (str): 티커
+        seconds (float): 지금부터 거슬러 올라갈 기간 (초)
+        max_points (int): 최대 점 수
+
+    Returns:
+        tuple: (array('q') 시각, array('d') 종가) - 기록이 없거나 읽을 수 없으면 빈 배열
+    """
+    empty = array('q'), array('d')
+    if history is None or history.disabled:
+        return empty
+    start = time.time() - seconds
+    try:
+        if not is_derived(ticker):
+            return history.query(ticker, start, max_points=max_points)
+        cross = CrossRates()
+        if not cross.resolve(ticker):
+            return empty
+        return cross.combine_series(ticker, {leg: history.query(leg, start, max_points=max_points)
+                                             for leg in cross.legs_of(ticker)})
+    except sqlite3.Error as e:
+        print(f"Quote History Query Failed: {e}")
+        return empty
@@ -0,0 +1,478 @@
+"""
+===================================================================================
+Quote Hub (PC 한 대에서 시세 조회 공유)
+===================================================================================
+목적: 같은 PC에서 exchange_widget.py, executive_exchange_monitor.py 등을 여러 개 띄워도
+      야후 조회는 한 곳(허브 프로세스)에서만 하도록 합니다.
+
+구조:
+    위젯 프로세스 A ─┐
+    위젯 프로세스 B ─┼─ QLocalSocket (JSON 한 줄씩) ─ 허브 프로세스 (QuoteEngine 1개)
+    위젯 프로세스 C ─┘
+
+    - 허브는 첫 위젯이 필요할 때 자동으로 띄웁니다 (python quote_hub.py, exe는 --quote-hub).
+    - 위젯은 subscribe 메시지로 티커를 등록하고, 허브가 시세/분봉/오류를 밀어줍니다.
+    - 마지막 위젯이 끊기고 IDLE_EXIT초가 지나면 허브는 스스로 종료합니다.
+    - 허브에 연결할 수 없으면 위젯 프로세스 안의 QuoteEngine으로 직접 조회합니다.
+
+위젯은 shared_quote_source()만 호출하면 되며, 돌려받는 객체는 QuoteEngine과 같은
+시그널/메서드(subscribe, latest, series, quote_updated ...)를 가집니다.
+QUOTE_HUB=0 환경 변수를 주면 허브를 쓰지 않습니다.
+
+메시지 (한 줄에 JSON 하나):
+    위젯 -> 허브: {"op": "subscribe" | "unsubscribe", "ticker": "KRW=X"}, {"op": "refresh"}
+    허브 -> 위젯: {"type": "quote", ...Quote 필드}
+                  {"type": "bars", "ticker", "timestamps", "closes"}
+                  {"type": "error", "kind", "status", "ticker"}
+                  {"type": "tick"}
+===================================================================================
+"""
+
+import os
+import sys
+import json
+import getpass
+from array import array
+from bisect import bisect_left
+
+from PyQt5.QtCore import QObject, QCoreApplication, QProcess, QTimer, pyqtSignal
+from PyQt5.QtNetwork import QLocalServer, QLocalSocket
+
+from quote_cache import QuoteCache
+from quote_decode import Quote
+from quote_metrics import QuoteMetrics
+from ring_buffer import BarRingBuffer
+
+
+# 사용자마다 따로 (같은 PC의 다른 사용자 허브에 붙지 않도록)
+HUB_NAME = f"exm-quote-hub-{getpass.getuser()}"
+HUB_FLAG = "--quote-hub"   # PyInstaller exe에서 허브로 실행할 때 쓰는 인자
+
+CONNECT_TIMEOUT_MS = 200   # 이미 떠 있는 허브에 붙을 때 기다리는 시간
+START_TIMEOUT_MS = 5000    # 허브를 새로 띄운 뒤 연결될 때까지 기다리는 시간
+RETRY_MS = 100
+IDLE_EXIT = 60             # 위젯이 하나도 없을 때 허브가 종료하기까지 (초)
+
+
+def hub_enabled():
+    # 녹화 재생(QUOTE_REPLAY) 중에는 다른 위젯과 허브를 공유하지 않음 (재생 시세가 섞이지 않도록)
+    return os.environ.get("QUOTE_HUB", "1") != "0" and not os.environ.get("QUOTE_REPLAY")
+
+
+def _encode(message):
+    return (json.dumps(message, separators=(',', ':')) + "\n").encode()
+
+
+class _LineReader:
+    """QLocalSocket에서 받은 바이트를 줄 단위 JSON 메시지로 자릅니다."""
+
+    def __init__(self, socket):
+        self.socket = socket
+        self.buffer = b""
+
+    def messages(self):
+        self.buffer += bytes(self.socket.readAll())
+        *lines, self.buffer = self.buffer.split(b"\n")
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                print(f"Quote Hub: bad message {line[:80]!r}")
+
+
+# ===================================================================================
+# [허브] 조회를 전담하는 프로세스
+# ===================================================================================
+
+class QuoteHub(QObject):
+    """
+    QLocalServer로 위젯 연결을 받고, 하나의 QuoteEngine 결과를 구독자에게 나눠 줍니다.
+
+    Args:
+        engine (QuoteEngine): 조회에 쓸 엔진
+        name (str): 로컬 소켓 이름
+    """
+
+    def __init__(self, engine, name=HUB_NAME, parent=None):
+        super().__init__(parent)
+        self.engine = engine
+        self.name = name
+        self.server = QLocalServer(self)
+        self.server.newConnection.connect(self.on_connection)
+        self.clients = {}     # QLocalSocket -> (_LineReader, 구독 티커 집합)
+        self._sent_bar = {}   # 티커 -> 마지막으로 보낸 봉 시각
+        self._sent_quote = {} # 티커 -> 마지막으로 보낸 Quote (같은 값은 다시 보내지 않음)
+
+        engine.quote_updated.connect(self.on_quote)
+        engine.series_updated.connect(self.on_series)
+        engine.error_occurred.connect(self.on_error)
+        engine.poll_finished.connect(lambda: self.broadcast({"type": "tick"}))
+
+        # 위젯이 모두 떠나면 잠시 뒤 종료
+        self.idle_timer = QTimer(self)
+        self.idle_timer.setSingleShot(True)
+        self.idle_timer.setInterval(IDLE_EXIT * 1000)
+        self.idle_timer.timeout.connect(QCoreApplication.quit)
+
+    def listen(self):
+        """
+        소켓을 엽니다. 다른 허브가 이미 응답 중이면 False
+
+        이전 허브가 비정상 종료해서 남은 소켓 파일은 지우고 다시 엽니다.
+        """
+        if self.server.listen(self.name):
+            self.idle_timer.start()
+            return True
+
+        probe = QLocalSocket()
+        probe.connectToServer(self.name)
+        if probe.waitForConnected(CONNECT_TIMEOUT_MS):
+            probe.disconnectFromServer()
+            return False
+
+        QLocalServer.removeServer(self.name)
+        if self.server.listen(self.name):
+            self.idle_timer.start()
+            return True
+        print(f"Quote Hub: listen failed ({self.server.errorString()})")
+        return False
+
+    # --- 위젯 연결 ---
+    def on_connection(self):
+        while self.server.hasPendingConnections():
+            socket = self.server.nextPendingConnection()
+            self.clients[socket] = (_LineReader(socket), set())
+            socket.readyRead.connect(lambda s=socket: self.on_ready_read(s))
+            socket.disconnected.connect(lambda s=socket: self.on_disconnected(s))
+        self.idle_timer.stop()
+
+    def on_ready_read(self, socket):
+        reader, tickers = self.clients.get(socket, (None, None))
+        if reader is None:
+            return
+        for message in reader.messages():
+            op, ticker = message.get("op"), message.get("ticker")
+            if op == "subscribe" and ticker and ticker not in tickers:
+                tickers.add(ticker)
+                self.engine.subscribe(ticker)
+                self.send_snapshot(socket, ticker)
+            elif op == "unsubscribe" and ticker in tickers:
+                tickers.discard(ticker)
+                self.engine.unsubscribe(ticker)
+            elif op == "refresh":
+                self.engine.refresh()
+
+    def on_disconnected(self, socket):
+        _, tickers = self.clients.pop(socket, (None, ()))
+        for ticker in tickers:
+            self.engine.unsubscribe(ticker)
+        socket.deleteLater()
+        if not self.clients:
+            self.idle_timer.start()
+
+    def send_snapshot(self, socket, ticker):
+        """새 구독자에게 가진 시세와 지금까지 받은 분봉 전체를 보냅니다."""
+        # 시세를 먼저 (차트 기준선에 전일 종가가 필요)
+        quote = self.engine.latest(ticker)
+        if quote:
+            socket.write(_encode(dict(quote._asdict(), type="quote")))
+
+        timestamps, closes = self.engine.series(ticker)
+        if len(timestamps):
+            socket.write(_encode({"type": "bars", "ticker": ticker,
+                                  "timestamps": timestamps.tolist(), "closes": closes.tolist()}))
+
+    # --- 엔진 -> 위젯 ---
+    def send(self, ticker, message):
+        data = _encode(message)
+        for socket, (_, tickers) in self.clients.items():
+            if ticker in tickers:
+                socket.write(data)
+
+    def broadcast(self, message):
+        data = _encode(message)
+        for socket in self.clients:
+            socket.write(data)
+
+    def on_quote(self, quote):
+        # engine.subscribe()가 기존 구독자에게도 같은 시세를 다시 보내므로 걸러냄
+        if self._sent_quote.get(quote.ticker) == quote:
+            return
+        self._sent_quote[quote.ticker] = quote
+        self.send(quote.ticker, dict(quote._asdict(), type="quote"))
+
+    def on_series(self, ticker):
+        # 마지막으로 보낸 봉(진행 중이던 1분봉)부터 새 봉까지만 보냄
+        timestamps, closes = self.engine.series(ticker)
+        start = bisect_left(timestamps, self._sent_bar.get(ticker, 0))
+        if start < len(timestamps):
+            self._sent_bar[ticker] = timestamps[-1]
+            self.send(ticker, {"type": "bars", "ticker": ticker,
+                               "timestamps": timestamps[start:].tolist(), "closes": closes[start:].tolist()})
+
+    def on_error(self, error):
+        message = {"type": "error", "kind": error.kind, "status": error.status, "ticker": error.ticker}
+        if error.ticker is None:
+            self.broadcast(message)
+        else:
+            self.send(error.ticker, message)
+
+
+def run_hub():
+    """허브 프로세스의 진입점. 이미 다른 허브가 떠 있으면 바로 종료합니다."""
+    # 조회 모듈(aiohttp 등)은 허브 프로세스에서만 불러옴
+    from quote_engine import QuoteEngine
+
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)
+    engine = QuoteEngine()
+    hub = QuoteHub(engine)
+    if not hub.listen():
+        return 0
+
+    exit_code = app.exec_()
+    engine.stop()
+    engine.wait(1.0)
+    return exit_code
+
+
+# ===================================================================================
+# [위젯 쪽] 허브에서 시세를 받는 QuoteEngine 대용
+# ===================================================================================
+
+class HubQuoteSource(QObject):
+    """
+    허브에 연결해서 QuoteEngine과 같은 방식으로 시세를 전달합니다.
+
+    연결은 백그라운드에서 진행되며(필요하면 허브를 띄움), 그 사이 subscribe()된 티커는
+    연결되는 즉시 등록됩니다. 연결에 실패하거나 허브가 사라지면
+    프로세스 안의 QuoteEngine으로 넘어가고, 이후에는 그 엔진의 시그널을 그대로 전달합니다.
+    """
+
+    quote_updated = pyqtSignal(object)
+    series_updated = pyqtSignal(str)
+    error_occurred = pyqtSignal(object)
+    poll_finished = pyqtSignal()
+
+    def __init__(self, name=HUB_NAME, cache=None, parent=None):
+        super().__init__(parent)
+        self.name = name
+        self.cache = cache or QuoteCache()   # 허브가 쓰는 캐시 파일 (읽기만)
+        self.metrics = QuoteMetrics()         # 조회는 허브가 하므로 비어 있음
+        self.fetcher = None
+        self.engine = None                    # 대체용 로컬 엔진 (허브 실패 시)
+        self.history = None                   # 허브가 쓰는 기록 DB (읽기만, 처음 조회할 때 엶)
+
+        self._subscriptions = {}  # 티커 -> 구독 횟수
+        self._latest = {}
+        self._series = {}         # 티커 -> BarRingBuffer
+        self._spawned = False
+        self._waited = 0
+        self._stopped = False
+
+        self.socket = QLocalSocket(self)
+        self.reader = _LineReader(self.socket)
+        self.socket.connected.connect(self.on_connected)
+        self.socket.readyRead.connect(self.on_ready_read)
+        self.socket.disconnected.connect(self.on_disconnected)
+        # Qt 5.15부터 error 시그널 이름이 errorOccurred로 바뀜
+        error_signal = getattr(self.socket, "errorOccurred", None) or self.socket.error
+        error_signal.connect(self.on_socket_error)
+
+        self.retry_timer = QTimer(self)
+        self.retry_timer.setSingleShot(True)
+        self.retry_timer.setInterval(RETRY_MS)
+        self.retry_timer.timeout.connect(self.connect_to_hub)
+
+    @property
+    def connected(self):
+        return self.socket.state() == QLocalSocket.ConnectedState
+
+    # --- 연결 ---
+    def connect_to_hub(self):
+        if self._stopped or self.engine is not None:
+            return
+        if self.socket.state() == QLocalSocket.UnconnectedState:
+            self.socket.connectToServer(self.name)
+
+    def on_socket_error(self, _error):
+        if self._stopped or self.engine is not None or self.connected:
+            return
+        # 허브가 없으면 한 번 띄우고, 뜰 때까지 짧게 재시도
+        if not self._spawned:
+            self._spawned = True
+            if not self.spawn_hub():
+                self.fall_back("허브 실행 실패")
+                return
+        self._waited += RETRY_MS
+        if self._waited >= START_TIMEOUT_MS:
+            self.fall_back("허브 연결 실패")
+        else:
+            self.retry_timer.start()
+
+    @staticmethod
+    def spawn_hub():
+        """허브 프로세스를 띄웁니다 (이 프로세스가 끝나도 계속 실행됨)."""
+        if getattr(sys, "frozen", False):
+            program, args = sys.executable, [HUB_FLAG]
+        else:
+            program, args = sys.executable, [os.path.abspath(__file__)]
+        ok, _ = QProcess.startDetached(program, args, os.getcwd())
+        return ok
+
+    def on_connected(self):
+        self._waited = 0
+        for ticker in self._subscriptions:
+            self.socket.write(_encode({"op": "subscribe", "ticker": ticker}))
+
+    def on_disconnected(self):
+        # 허브가 종료됨: 한 번 더 띄워 보고 안 되면 로컬 엔진으로
+        if self.engine is None and not self._stopped:
+            self._spawned = False
+            self._waited = 0
+            self.retry_timer.start()
+
+    def fall_back(self, reason):
+        """로컬 QuoteEngine으로 전환하고 기존 구독을 옮깁니다."""
+        # 허브를 쓰는 동안에는 조회 모듈(aiohttp 등)을 불러올 필요가 없음
+        from quote_engine import QuoteEngine
+
+        print(f"Quote Hub: {reason}, 로컬 엔진으로 조회합니다.")
+        self.retry_timer.stop()
+        self.engine = QuoteEngine.shared()
+        self.metrics = self.engine.metrics
+        self.fetcher = self.engine.fetcher
+        self.engine.quote_updated.connect(self.quote_updated)
+        self.engine.series_updated.connect(self.series_updated)
+        self.engine.error_occurred.connect(self.error_occurred)
+        self.engine.poll_finished.connect(self.poll_finished)
+        for ticker, count in self._subscriptions.items():
+            for _ in range(count):
+                self.engine.subscribe(ticker)
+
+    # --- 허브 -> 위젯 ---
+    def on_ready_read(self):
+        for message in self.reader.messages():
+            kind = message.pop("type", None)
+            if kind == "quote":
+                quote = Quote(**message)
+                self._latest[quote.ticker] = quote
+                self.quote_updated.emit(quote)
+            elif kind == "bars":
+                buffer = self._series.setdefault(message["ticker"], BarRingBuffer())
+                if buffer.extend(message["timestamps"], message["closes"]):
+                    self.series_updated.emit(message["ticker"])
+            elif kind == "error":
+                # quote_providers는 asyncio를 끌고 오므로 오류가 왔을 때만 불러옴
+                from quote_providers import QuoteError
+                self.error_occurred.emit(QuoteError(message["kind"], message.get("status"), message.get("ticker")))
+            elif kind == "tick":
+                self.poll_finished.emit()
+
+    # --- QuoteEngine과 같은 인터페이스 ---
+    def subscribe(self, ticker):
+        if self.engine is not None:
+            self._subscriptions[ticker] = self._subscriptions.get(ticker, 0) + 1
+            self.engine.subscribe(ticker)
+            return
+
+        count = self._subscriptions.get(ticker, 0)
+        self._subscriptions[ticker] = count + 1
+
+        quote = self.latest(ticker)
+        if quote:
+            self.quote_updated.emit(quote)
+
+        if count == 0 and self.connected:
+            self.socket.write(_encode({"op": "subscribe", "ticker": ticker}))
+        elif not self.retry_timer.isActive():
+            self.connect_to_hub()
+
+    def unsubscribe(self, ticker):
+        count = self._subscriptions.get(ticker, 0)
+        if count <= 1:
+            self._subscriptions.pop(ticker, None)
+        else:
+            self._subscriptions[ticker] = count - 1
+
+        if self.engine is not None:
+            self.engine.unsubscribe(ticker)
+        elif count == 1 and self.connected:
+            self.socket.write(_encode({"op": "unsubscribe", "ticker": ticker}))
+
+    def symbols(self):
+        return list(self._subscriptions)
+
+    def latest(self, ticker):
+        if self.engine is not None:
+            return self.engine.latest(ticker)
+        quote = self._latest.get(ticker)
+        if quote:
+            return quote
+        entry = self.cache.get(ticker)
+        if entry:
+            return Quote(ticker, entry["price"], entry["change"], entry["prev_close"],
+                         entry["timestamp"], stale=True)
+        return None
+
+    def series(self, ticker):
+        if self.engine is not None:
+            return self.engine.series(ticker)
+        buffer = self._series.get(ticker)
+        if buffer is None:
+            return array('q'), array('d')
+        return buffer.snapshot()
+
+    def history_series(self, ticker, seconds, max_points=300):
+        if self.engine is not None:
+            return self.engine.history_series(ticker, seconds, max_points)
+        # 허브가 기록한 DB를 직접 읽음 (WAL이라 허브가 쓰는 중에도 읽을 수 있음)
+        from quote_history import QuoteHistory, history_enabled, history_series
+
+        if self.history is None and history_enabled():
+            self.history = QuoteHistory()
+        return history_series(self.history, ticker, seconds, max_points)
+
+    def refresh(self):
+        if self.engine is not None:
+            self.engine.refresh()
+        elif self.connected:
+            self.socket.write(_encode({"op": "refresh"}))
+
+    def stop(self):
+        """허브 연결을 끊습니다 (허브는 다른 위젯이 없으면 IDLE_EXIT초 뒤 스스로 종료)."""
+        self._stopped = True
+        self.retry_timer.stop()
+        if self.engine is not None:
+            self.engine.stop()
+        else:
+            self.socket.disconnectFromServer()
+
+    def wait(self, timeout=None):
+        if self.engine is not None:
+            return self.engine.wait(timeout)
+        return True
+
+
+_shared_source = None
+
+
+def shared_quote_source():
+    """
+    위젯들이 함께 쓰는 시세 공급원을 돌려줍니다.
+
+    기본은 허브(HubQuoteSource)이고, QUOTE_HUB=0이면 프로세스 안의 QuoteEngine입니다.
+    """
+    global _shared_source
+    if _shared_source is None:
+        if hub_enabled():
+            _shared_source = HubQuoteSource()
+        else:
+            from quote_engine import QuoteEngine
+            _shared_source = QuoteEngine.shared()
+    return _shared_source
+
+
+if __name__ == '__main__':
+    sys.exit(run_hub())
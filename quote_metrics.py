@@ -0,0 +1,226 @@
+"""
+===================================================================================
+Quote Metrics (시세 조회 계측)
+===================================================================================
+목적: 조회가 얼마나 빠르고 얼마나 자주 실패하는지 숫자로 남깁니다.
+
+    - 제공자별 응답 시간 히스토그램
+    - 결과(ok / timeout / connection / http / data / unknown)와 HTTP 상태 코드별 횟수
+    - 받은 응답 본문 크기 합계
+    - 마지막 정상 시세 이후 경과 시간
+    - 헤지 요청 / 장애 조치 횟수
+
+QUOTE_METRICS_PORT 환경 변수를 주면 127.0.0.1:포트/metrics 에서
+Prometheus 텍스트 형식으로 볼 수 있습니다 (다른 PC에서는 접속 불가).
+    예: QUOTE_METRICS_PORT=9464 python exchange_widget.py
+        curl http://127.0.0.1:9464/metrics
+===================================================================================
+"""
+
+import os
+import time
+import threading
+
+
+# 응답 시간 구간 (초) - 정상 응답은 0.05~0.5초, 타임아웃은 5초
+LATENCY_BUCKETS = (0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+METRICS_PORT = os.environ.get("QUOTE_METRICS_PORT")
+
+
+class Histogram:
+    """Prometheus 방식의 누적 구간 히스토그램"""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)  # 구간별 개수 (출력할 때 누적으로 바꿈)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self):
+        total = 0
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            yield bound, total
+
+
+class QuoteMetrics:
+    """
+    조회 경로의 계측값 모음
+
+    기록은 엔진의 루프 스레드에서, 읽기는 GUI 스레드나 메트릭 서버 스레드에서 하므로 잠금을 씁니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latency = {}        # 제공자 -> Histogram
+        self.outcomes = {}       # (제공자, 결과) -> 횟수
+        self.statuses = {}       # (제공자, HTTP 상태 코드) -> 횟수
+        self.errors = {}         # (종류, 예외 이름) -> 위젯에 알린 오류 횟수
+        self.bytes = {}          # 제공자 -> 받은 본문 크기 합계
+        self.quotes = 0          # 받은 정상 시세 수
+        self.last_good = None    # 마지막 정상 시세를 받은 시각 (유닉스 시간)
+        self.hedges = 0
+        self.failovers = 0
+
+    # --- 기록 (루프 스레드) ---
+    def record_fetch(self, provider, seconds, outcome, status=None, size=0):
+        """
+        제공자 요청 한 번의 결과
+
+        Args:
+            provider (str): 제공자 이름
+            seconds (float): 걸린 시간
+            outcome (str): "ok" 또는 QuoteError.kind
+            status (int): HTTP 상태 코드 (알 수 있을 때)
+            size (int): 받은 본문 크기
+        """
+        with self._lock:
+            self.latency.setdefault(provider, Histogram()).observe(seconds)
+            key = (provider, outcome)
+            self.outcomes[key] = self.outcomes.get(key, 0) + 1
+            if status is not None:
+                key = (provider, status)
+                self.statuses[key] = self.statuses.get(key, 0) + 1
+            if size:
+                self.bytes[provider] = self.bytes.get(provider, 0) + size
+
+    def record_error(self, kind, exception=None):
+        key = (kind, type(exception).__name__ if exception is not None else "")
+        with self._lock:
+            self.errors[key] = self.errors.get(key, 0) + 1
+
+    def record_quotes(self, count):
+        with self._lock:
+            self.quotes += count
+            if count:
+                self.last_good = time.time()
+
+    def record_hedge(self):
+        with self._lock:
+            self.hedges += 1
+
+    def record_failover(self):
+        with self._lock:
+            self.failovers += 1
+
+    # --- 읽기 ---
+    def seconds_since_last_good(self):
+        """마지막 정상 시세 이후 경과 시간 (받은 적 없으면 None)"""
+        last = self.last_good
+        return None if last is None else time.time() - last
+
+    def render(self):
+        """Prometheus 텍스트 형식 (text/plain; version=0.0.4)"""
+        lines = []
+        with self._lock:
+            lines += ["# HELP quote_fetch_seconds Provider request latency.",
+                      "# TYPE quote_fetch_seconds histogram"]
+            for provider, hist in sorted(self.latency.items()):
+                label = f'provider="{provider}"'
+                for bound, total in hist.cumulative():
+                    lines.append(f'quote_fetch_seconds_bucket{{{label},le="{bound}"}} {total}')
+                lines.append(f'quote_fetch_seconds_bucket{{{label},le="+Inf"}} {hist.count}')
+                lines.append(f'quote_fetch_seconds_sum{{{label}}} {hist.sum:.6f}')
+                lines.append(f'quote_fetch_seconds_count{{{label}}} {hist.count}')
+
+            lines += ["# HELP quote_fetch_total Provider requests by outcome.",
+                      "# TYPE quote_fetch_total counter"]
+            for (provider, outcome), count in sorted(self.outcomes.items()):
+                lines.append(f'quote_fetch_total{{provider="{provider}",outcome="{outcome}"}} {count}')
+
+            lines += ["# HELP quote_http_responses_total Provider responses by HTTP status.",
+                      "# TYPE quote_http_responses_total counter"]
+            for (provider, status), count in sorted(self.statuses.items()):
+                lines.append(f'quote_http_responses_total{{provider="{provider}",code="{status}"}} {count}')
+
+            lines += ["# HELP quote_errors_total Errors reported to widgets.",
+                      "# TYPE quote_errors_total counter"]
+            for (kind, exception), count in sorted(self.errors.items()):
+                lines.append(f'quote_errors_total{{kind="{kind}",exception="{exception}"}} {count}')
+
+            lines += ["# HELP quote_response_bytes_total Decoded response body bytes.",
+                      "# TYPE quote_response_bytes_total counter"]
+            for provider, size in sorted(self.bytes.items()):
+                lines.append(f'quote_response_bytes_total{{provider="{provider}"}} {size}')
+
+            lines += ["# TYPE quote_quotes_total counter", f"quote_quotes_total {self.quotes}",
+                      "# TYPE quote_hedged_requests_total counter", f"quote_hedged_requests_total {self.hedges}",
+                      "# TYPE quote_failovers_total counter", f"quote_failovers_total {self.failovers}"]
+
+        since = self.seconds_since_last_good()
+        if since is not None:
+            lines += ["# HELP quote_seconds_since_last_good Seconds since the last good quote.",
+                      "# TYPE quote_seconds_since_last_good gauge",
+                      f"quote_seconds_since_last_good {since:.3f}"]
+        return "\n".join(lines) + "\n"
+
+    def summary(self):
+        """
+        디버그 오버레이용 요약
+
+        Returns:
+            dict: {requests, ok, errors, bytes, quotes, hedges, failovers, since_last_good}
+        """
+        with self._lock:
+            requests = sum(self.outcomes.values())
+            ok = sum(count for (_, outcome), count in self.outcomes.items() if outcome == "ok")
+            return {
+                "requests": requests,
+                "ok": ok,
+                "errors": dict(self.errors),
+                "bytes": sum(self.bytes.values()),
+                "quotes": self.quotes,
+                "hedges": self.hedges,
+                "failovers": self.failovers,
+                "since_last_good": self.seconds_since_last_good(),
+            }
+
+
+# ===================================================================================
+# [메트릭 서버] 127.0.0.1 전용 HTTP 엔드포인트
+# ===================================================================================
+
+def start_metrics_server(metrics, port):
+    """
+    데몬 스레드에서 메트릭 서버를 시작합니다 (127.0.0.1에만 바인딩).
+
+    Returns:
+        ThreadingHTTPServer: 시작된 서버 (포트를 열 수 없으면 None)
+    """
+    # http.server는 email 등 여러 모듈을 끌고 오므로 서버를 켤 때만 불러옴
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class _MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] not in ("/metrics", "/"):
+                self.send_error(404)
+                return
+            body = self.server.metrics.render().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass  # 요청마다 콘솔에 찍지 않음
+
+    try:
+        server = ThreadingHTTPServer(("127.0.0.1", int(port)), _MetricsHandler)
+    except (OSError, ValueError) as e:
+        print(f"Metrics Server Failed: {e}")
+        return None
+
+    server.daemon_threads = True
+    server.metrics = metrics
+    threading.Thread(target=server.serve_forever, name="quote-metrics", daemon=True).start()
+    return server
@@ -0,0 +1,404 @@
+"""
+===================================================================================
+Quote Providers (시세 제공자)
+===================================================================================
+목적: 시세를 어디서 어떻게 가져오는지를 엔진에서 분리합니다.
+
+    - QuoteProvider       : 제공자 인터페이스 (fetch_raw로 받고 decode로 해석)
+    - YahooSparkProvider  : 야후 spark 엔드포인트 (query1 / query2 서버)
+    - FakeQuoteProvider   : 네트워크 없이 정해진 가격/지연/오류를 돌려주는 가짜 제공자
+    - HedgedFetcher       : 여러 제공자를 묶어서 조회
+
+[헤지 요청 (Hedged Request)]
+주 제공자의 응답이 평소 p95 지연보다 늦어지면 다음 제공자에게도 같은 요청을 보내고
+먼저 도착한 응답을 씁니다 (나머지는 취소). 느린 요청 5% 정도에만 요청이 하나 더
+나가므로 평소 부하는 거의 그대로이고, 꼬리 지연만 줄어듭니다.
+주 제공자가 오류를 돌려주면 기다리지 않고 바로 다음 제공자로 넘어갑니다.
+===================================================================================
+"""
+
+import os
+import time
+import asyncio
+from abc import ABC, abstractmethod
+from collections import deque
+from urllib.parse import urlsplit
+
+from quote_decode import Quote, decode_spark
+
+
+# ===================================================================================
+# [설정] 시세 서버 주소
+# ===================================================================================
+# 테스트 시에는 QUOTE_BASE_URL 환경 변수로 로컬 스텁 서버를 지정할 수 있습니다.
+# 예: QUOTE_BASE_URL=http://127.0.0.1:8765 python exchange_widget.py
+# 쉼표로 여러 개를 주면 각각 제공자가 됩니다 (앞쪽이 주 제공자).
+# ===================================================================================
+
+YAHOO_BASE_URLS = ("https://query1.finance.yahoo.com", "https://query2.finance.yahoo.com")
+QUOTE_BASE_URLS = tuple(url.strip() for url in os.environ.get("QUOTE_BASE_URL", "").split(",") if url.strip()) \
+    or YAHOO_BASE_URLS
+QUOTE_BASE_URL = QUOTE_BASE_URLS[0]
+SPARK_PATH = "/v8/finance/spark"
+
+# 야후 spark 엔드포인트는 한 번에 최대 20개 심볼까지 받아줍니다
+MAX_SYMBOLS_PER_REQUEST = 20
+
+
+def spark_params(symbols):
+    """
+    spark 요청 파라미터 (필요한 것만 요청)
+
+    indicators=close: 시가/고가/저가/거래량 배열 없이 종가만
+    includePrePost=false: 장 전후 시간외 봉 제외
+    """
+    return {"symbols": ",".join(symbols), "range": "1d", "interval": "1m",
+            "indicators": "close", "includeTimestamps": "true", "includePrePost": "false"}
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/120.0.0.0 Safari/537.36',
+    'Accept-Encoding': 'gzip, deflate',  # 압축 응답 요청 (spark 응답은 수십 KB)
+    'Connection': 'keep-alive',
+}
+
+class QuoteError(Exception):
+    """
+    시세 조회 실패
+
+    Attributes:
+        kind (str): "timeout", "connection", "http", "data", "unknown" 중 하나
+        status (int): HTTP 상태 코드 (kind가 "http"일 때만)
+        ticker (str): 특정 티커만 실패한 경우 해당 티커, 요청 전체 실패 시 None
+    """
+
+    def __init__(self, kind, status=None, ticker=None):
+        super().__init__(f"HTTP {status}" if kind == "http" else kind)
+        self.kind = kind
+        self.status = status
+        self.ticker = ticker
+
+
+# ===================================================================================
+# [비동기 조회] spark 응답 본문 가져오기
+# ===================================================================================
+
+# 일시적인 서버 오류는 짧게 재시도 (429 요청 제한은 재시도하면 제한이 길어지므로 제외)
+RETRY_STATUS = (502, 503, 504)
+RETRY_ATTEMPTS = 3
+RETRY_BACKOFF = 0.5  # 초 (0.5, 1.0, ...)
+
+
+async def fetch_spark_async(session, symbols, base_url=None):
+    """
+    spark 응답 본문을 해석하지 않은 문자열 그대로 가져옵니다.
+
+    시세와 새 분봉을 decode_spark()로 한 번에 꺼낼 때 씁니다.
+    """
+    # aiohttp는 불러오는 데 0.1초 넘게 걸리므로 실제로 조회할 때 (루프 스레드에서) 불러옴
+    # 허브에서 시세를 받는 위젯 프로세스는 aiohttp를 전혀 불러오지 않음
+    import aiohttp
+
+    url = (base_url or QUOTE_BASE_URL) + SPARK_PATH
+    params = spark_params(symbols)
+
+    for attempt in range(RETRY_ATTEMPTS):
+        last_try = attempt == RETRY_ATTEMPTS - 1
+        try:
+            async with session.get(url, params=params) as response:
+                if response.status in RETRY_STATUS and not last_try:
+                    await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+                    continue
+                if response.status != 200:
+                    raise QuoteError("http", status=response.status)
+                return await response.text()
+        except asyncio.TimeoutError:
+            raise QuoteError("timeout")
+        except aiohttp.ClientConnectionError:
+            if last_try:
+                raise QuoteError("connection")
+            await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+            continue
+        except (aiohttp.ClientError, ValueError):
+            raise QuoteError("data")
+
+
+# ===================================================================================
+# [제공자] 인터페이스와 구현
+# ===================================================================================
+
+class QuoteProvider(ABC):
+    """
+    시세 제공자 인터페이스
+
+    하위 클래스는 fetch_raw()와 decode()를 구현합니다 (하나라도 빠지면 만들 때 TypeError).
+    fetch_raw()는 네트워크만, decode()는 해석만 담당하므로
+    녹화/재생이나 지연 측정 시 두 단계를 따로 다룰 수 있습니다.
+
+    Attributes:
+        name (str): 통계/로그에 쓸 이름
+        max_symbols (int): 한 번에 요청할 수 있는 최대 티커 수
+        http (bool): HTTP로 조회하는지 (계측 시 성공을 상태 코드 200으로 기록)
+    """
+
+    max_symbols = MAX_SYMBOLS_PER_REQUEST
+    http = False
+
+    def __init__(self, name):
+        self.name = name
+
+    @abstractmethod
+    async def fetch_raw(self, session, symbols):
+        """
+        응답 본문을 가져옵니다.
+
+        Raises:
+            QuoteError: 요청 실패
+        """
+
+    @abstractmethod
+    def decode(self, raw, last_timestamps=None):
+        """
+        fetch_raw() 결과를 해석합니다.
+
+        Returns:
+            tuple: (quotes, series) - decode_spark()와 같은 형식
+
+        Raises:
+            ValueError: 응답 형식이 잘못됨
+        """
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.name})"
+
+
+class YahooSparkProvider(QuoteProvider):
+    """야후 spark 엔드포인트 (서버 주소만 다른 query1 / query2를 각각 하나의 제공자로)"""
+
+    http = True
+
+    def __init__(self, base_url, name=None):
+        super().__init__(name or urlsplit(base_url).netloc)
+        self.base_url = base_url
+
+    async def fetch_raw(self, session, symbols):
+        return await fetch_spark_async(session, symbols, self.base_url)
+
+    def decode(self, raw, last_timestamps=None):
+        return decode_spark(raw, last_timestamps)
+
+
+class FakeQuoteProvider(QuoteProvider):
+    """
+    네트워크 없이 동작하는 가짜 제공자 (벤치마크/개발용)
+
+    Args:
+        name (str): 이름
+        prices (dict): {티커: 가격}. 없는 티커는 응답에서 빠짐
+        latency (float | callable): 응답 지연(초) 또는 지연을 돌려주는 함수
+        error (QuoteError): 지정하면 지연 뒤 이 오류를 냄
+        prev_close (dict): {티커: 전일 종가} (기본값: 가격과 같음)
+    """
+
+    def __init__(self, name="fake", prices=None, latency=0.0, error=None, prev_close=None):
+        super().__init__(name)
+        self.prices = dict(prices or {})
+        self.latency = latency
+        self.error = error
+        self.prev_close = dict(prev_close or {})
+        self.calls = 0
+
+    async def fetch_raw(self, session, symbols):
+        self.calls += 1
+        delay = self.latency() if callable(self.latency) else self.latency
+        if delay:
+            await asyncio.sleep(delay)
+        if self.error:
+            raise self.error
+        return {t: self.prices[t] for t in symbols if t in self.prices}
+
+    def decode(self, raw, last_timestamps=None):
+        now = time.time()
+        quotes = {}
+        for ticker, price in raw.items():
+            prev = self.prev_close.get(ticker, price)
+            quotes[ticker] = Quote(ticker, price, price - prev, prev, now)
+        return quotes, {}
+
+
+def default_providers(base_url=None):
+    """
+    기본 제공자 목록
+
+    base_url이 있으면 쉼표로 나눈 각 주소를, 없으면 QUOTE_BASE_URLS
+    (QUOTE_BASE_URL 환경 변수 또는 야후 query1 -> query2) 순서로 씁니다.
+    """
+    urls = base_url.split(",") if base_url else QUOTE_BASE_URLS
+    return [YahooSparkProvider(url.strip()) for url in urls if url.strip()]
+
+
+# ===================================================================================
+# [지연 통계] 제공자별 최근 응답 시간
+# ===================================================================================
+
+class LatencyTracker:
+    """
+    최근 응답 시간으로 백분위수를 계산합니다.
+
+    Args:
+        window (int): 보관할 최근 표본 수
+    """
+
+    MIN_SAMPLES = 10  # 이보다 적으면 백분위수를 믿지 않음
+
+    def __init__(self, window=200):
+        self.samples = deque(maxlen=window)
+        self.successes = 0
+        self.failures = 0
+
+    def record(self, seconds):
+        self.samples.append(seconds)
+        self.successes += 1
+
+    def record_failure(self):
+        self.failures += 1
+
+    def percentile(self, p):
+        """
+        Args:
+            p (float): 0~100
+
+        Returns:
+            float: 백분위수 (표본이 MIN_SAMPLES개 미만이면 None)
+        """
+        if len(self.samples) < self.MIN_SAMPLES:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(int(len(ordered) * p / 100), len(ordered) - 1)]
+
+
+# ===================================================================================
+# [헤지 조회] 여러 제공자 묶음
+# ===================================================================================
+
+class HedgedFetcher:
+    """
+    제공자 목록을 순서대로 쓰면서, 주 제공자가 느리면 헤지 요청을,
+    실패하면 즉시 다음 제공자로 넘깁니다.
+
+    마지막으로 성공한 제공자가 다음 조회의 주 제공자가 됩니다
+    (query1이 계속 실패하면 query2가 주 제공자가 됨).
+
+    Args:
+        providers (list): QuoteProvider 목록 (앞쪽이 우선)
+        metrics (QuoteMetrics): 요청마다 결과를 기록할 곳 (선택)
+    """
+
+    HEDGE_PERCENTILE = 95
+    HEDGE_DEFAULT = 1.0   # 표본이 모이기 전 헤지 대기 시간 (초)
+    HEDGE_MIN = 0.05      # p95가 아주 짧아도 이보다 빨리 헤지하지 않음 (지터 대비)
+
+    def __init__(self, providers, metrics=None):
+        if not providers:
+            raise ValueError("at least one provider is required")
+        self.providers = list(providers)
+        self.metrics = metrics
+        self.latency = {p.name: LatencyTracker() for p in self.providers}
+        self._primary = 0
+        self.hedges = 0      # 헤지 요청을 보낸 횟수
+        self.failovers = 0   # 오류로 다음 제공자에 넘긴 횟수
+
+    @property
+    def max_symbols(self):
+        return min(p.max_symbols for p in self.providers)
+
+    def ordered(self):
+        """주 제공자부터 시작하는 순서"""
+        return self.providers[self._primary:] + self.providers[:self._primary]
+
+    def hedge_delay(self, provider):
+        p95 = self.latency[provider.name].percentile(self.HEDGE_PERCENTILE)
+        return self.HEDGE_DEFAULT if p95 is None else max(p95, self.HEDGE_MIN)
+
+    async def fetch(self, session, symbols, last_timestamps=None):
+        """
+        Returns:
+            tuple: (quotes, series, 응답한 제공자)
+
+        Raises:
+            QuoteError: 모든 제공자가 실패 (주 제공자의 오류)
+        """
+        order = self.ordered()
+        running = {}   # Task -> 제공자
+        errors = []
+
+        def launch(provider):
+            task = asyncio.ensure_future(self._attempt(provider, session, symbols, last_timestamps))
+            running[task] = provider
+
+        launch(order[0])
+        launched = 1
+        try:
+            while running:
+                # 아직 보낼 제공자가 남아 있으면 가장 최근 요청의 p95까지만 기다림
+                timeout = self.hedge_delay(order[launched - 1]) if launched < len(order) else None
+                done, _ = await asyncio.wait(running, timeout=timeout,
+                                             return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    self.hedges += 1
+                    if self.metrics:
+                        self.metrics.record_hedge()
+                    launch(order[launched])
+                    launched += 1
+                    continue
+
+                for task in done:
+                    provider = running.pop(task)
+                    try:
+                        quotes, series = task.result()
+                    except QuoteError as e:
+                        errors.append(e)
+                        continue
+                    self._primary = self.providers.index(provider)
+                    return quotes, series, provider
+
+                # 실패한 요청 말고 진행 중인 요청이 없으면 바로 다음 제공자로
+                if not running and launched < len(order):
+                    self.failovers += 1
+                    if self.metrics:
+                        self.metrics.record_failover()
+                    launch(order[launched])
+                    launched += 1
+        finally:
+            for task in running:
+                task.cancel()
+
+        raise errors[0]
+
+    async def _attempt(self, provider, session, symbols, last_timestamps):
+        started = time.perf_counter()
+        tracker = self.latency[provider.name]
+        try:
+            raw = await provider.fetch_raw(session, symbols)
+            elapsed = time.perf_counter() - started
+            tracker.record(elapsed)
+            self._record(provider, elapsed, "ok", 200 if provider.http else None,
+                         len(raw) if isinstance(raw, (str, bytes)) else 0)
+            return provider.decode(raw, last_timestamps)
+        except asyncio.CancelledError:
+            # 헤지에 져서 취소됨: 적어도 이만큼 걸렸으므로 표본에 넣음 (빼면 p95가 낮게 잡힘)
+            elapsed = time.perf_counter() - started
+            tracker.samples.append(elapsed)
+            self._record(provider, elapsed, "cancelled")
+            raise
+        except QuoteError as e:
+            tracker.record_failure()
+            self._record(provider, time.perf_counter() - started, e.kind, e.status)
+            raise
+        except (ValueError, KeyError, IndexError) as e:
+            # 응답은 받았지만 해석 실패 (요청 결과는 위에서 ok로 기록됨, 원래 예외는 __cause__)
+            tracker.record_failure()
+            raise QuoteError("data") from e
+
+    def _record(self, provider, elapsed, outcome, status=None, size=0):
+        if self.metrics:
+            self.metrics.record_fetch(provider.name, elapsed, outcome, status, size)
@@ -0,0 +1,200 @@
+"""
+===================================================================================
+Quote Recorder (시세 응답 녹화 / 재생)
+===================================================================================
+목적: 제공자가 받은 응답 원본을 파일에 녹화해 두었다가, 같은 경로(QuoteEngine의
+      시그널 -> 위젯 update_ui / 알림 / 차트)로 다시 흘려보냅니다.
+      변동이 큰 날을 그대로 재현하거나, 네트워크 없이 UI와 엔진을 벤치마크할 때 씁니다.
+
+파일 형식: gzip으로 압축한 JSON Lines (응답 한 번 = 한 줄)
+    {"t": 받은 시각, "provider": 이름, "symbols": [...], "raw": 응답 본문}
+    {"t": 받은 시각, "provider": 이름, "symbols": [...], "error": "timeout", "status": null}
+해석된 시세는 따로 저장하지 않습니다. 재생할 때 같은 decode()를 거치므로 결과가 같습니다.
+
+사용법 (환경 변수):
+    QUOTE_RECORD=day.jsonl.gz python exchange_widget.py        # 평소처럼 쓰면서 녹화
+    QUOTE_REPLAY=day.jsonl.gz QUOTE_REPLAY_SPEED=60 python exchange_widget.py
+        # 60배속 재생 (0이면 기다리지 않고 최대한 빠르게). 재생 중에는 시세 허브를 쓰지 않음
+===================================================================================
+"""
+
+import asyncio
+import gzip
+import json
+import os
+import threading
+import time
+
+from quote_decode import decode_spark
+from quote_providers import QuoteProvider, QuoteError, FakeQuoteProvider
+
+
+RECORD_PATH = os.environ.get("QUOTE_RECORD")
+REPLAY_PATH = os.environ.get("QUOTE_REPLAY")
+REPLAY_SPEED = float(os.environ.get("QUOTE_REPLAY_SPEED", "1"))
+
+
+class QuoteRecorder:
+    """
+    gzip JSON Lines 녹화 파일
+
+    제공자 여러 개(query1/query2)가 루프 스레드에서 번갈아 쓰므로 잠금을 씁니다.
+
+    Args:
+        path (str): 파일 경로 (있으면 이어서 씀)
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.count = 0
+        self._lock = threading.Lock()
+        self._file = gzip.open(path, 'at', encoding='utf-8')
+
+    def write(self, record):
+        line = json.dumps(record, separators=(',', ':'))
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(line + '\n')
+            self.count += 1
+
+    def flush(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def read_records(path):
+    """녹화 파일의 기록을 순서대로 돌려줍니다 (끝이 잘린 마지막 줄은 건너뜀)."""
+    records = []
+    try:
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    break
+    except EOFError:
+        pass  # 녹화 중 강제 종료되어 gzip 끝부분이 없음 - 읽은 데까지 사용
+    return records
+
+
+class RecordingProvider(QuoteProvider):
+    """
+    다른 제공자를 감싸서 응답(또는 오류)을 녹화합니다. 조회 동작은 그대로입니다.
+
+    Args:
+        inner (QuoteProvider): 실제 제공자
+        recorder (QuoteRecorder): 녹화 파일
+    """
+
+    def __init__(self, inner, recorder):
+        super().__init__(inner.name)
+        self.inner = inner
+        self.recorder = recorder
+        self.max_symbols = inner.max_symbols
+        self.http = inner.http
+
+    async def fetch_raw(self, session, symbols):
+        record = {"provider": self.name, "symbols": list(symbols)}
+        try:
+            raw = await self.inner.fetch_raw(session, symbols)
+        except QuoteError as e:
+            self.recorder.write(dict(record, t=time.time(), error=e.kind, status=e.status))
+            raise
+        self.recorder.write(dict(record, t=time.time(), raw=raw))
+        return raw
+
+    def decode(self, raw, last_timestamps=None):
+        return self.inner.decode(raw, last_timestamps)
+
+
+class ReplayProvider(QuoteProvider):
+    """
+    녹화 파일을 녹화 당시의 간격 / speed로 다시 돌려주는 제공자
+
+    요청한 티커와 상관없이 다음 기록을 돌려주므로, 녹화할 때와 같은 티커를 구독해야 합니다.
+    기록이 끝나면 finished가 True가 되고, loop=False면 이후 요청은 엔진이 멈출 때까지 기다립니다.
+
+    Args:
+        path (str): 녹화 파일
+        speed (float): 재생 배속 (0이면 기다리지 않음)
+        loop (bool): 끝나면 처음부터 다시
+    """
+
+    def __init__(self, path, speed=1.0, loop=False):
+        super().__init__(f"replay:{os.path.basename(path)}")
+        self.records = read_records(path)
+        self.speed = speed
+        self.loop = loop
+        self.position = 0
+        self.finished = not self.records
+        self._started = None   # (재생 시작 시각, 첫 기록 시각)
+        self._fake = FakeQuoteProvider()   # 가짜 제공자로 녹화한 응답(딕셔너리) 해석용
+
+    async def fetch_raw(self, session, symbols):
+        if self.position >= len(self.records):
+            if not self.loop or not self.records:
+                self.finished = True
+                await asyncio.Event().wait()  # 엔진이 멈출 때(취소)까지 대기
+            self.position, self._started = 0, None
+
+        record = self.records[self.position]
+        self.position += 1
+
+        # 녹화 당시 간격대로 대기
+        if self._started is None:
+            self._started = (time.monotonic(), record["t"])
+        elif self.speed > 0:
+            due = self._started[0] + (record["t"] - self._started[1]) / self.speed
+            delay = due - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        self.finished = self.position >= len(self.records) and not self.loop
+
+        if "error" in record:
+            raise QuoteError(record["error"], record.get("status"))
+        return record["raw"]
+
+    def decode(self, raw, last_timestamps=None):
+        if isinstance(raw, str):
+            return decode_spark(raw, last_timestamps)
+        return self._fake.decode(raw, last_timestamps)
+
+
+_recorder = None
+
+
+def configure_providers(providers, explicit=False):
+    """
+    QUOTE_REPLAY / QUOTE_RECORD 환경 변수에 따라 제공자 목록을 바꿉니다.
+
+    Args:
+        providers (list): 기본 제공자 목록
+        explicit (bool): 호출한 쪽이 제공자를 직접 지정했으면 True (벤치마크 등 - 바꾸지 않음)
+
+    Returns:
+        tuple: (제공자 목록, 재생 중 여부)
+    """
+    global _recorder
+    if explicit:
+        return providers, False
+    if REPLAY_PATH:
+        return [ReplayProvider(REPLAY_PATH, REPLAY_SPEED)], True
+    if RECORD_PATH:
+        if _recorder is None:
+            _recorder = QuoteRecorder(RECORD_PATH)
+        return [RecordingProvider(p, _recorder) for p in providers], False
+    return providers, False
+
+
+def close_recorder():
+    """녹화 중이면 파일을 닫습니다 (엔진 종료 시)."""
+    if _recorder is not None:
+        _recorder.close()
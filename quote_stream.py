@@ -0,0 +1,245 @@
+"""
+===================================================================================
+Quote Stream (스트리밍 시세)
+===================================================================================
+목적: 서버가 보내 주는(push) 시세를 연결 하나로 계속 받아, 폴링 주기(최대 60초)를
+      기다리지 않고 바로 표시합니다. 요청 수도 늘어나지 않습니다.
+
+형식: Server-Sent Events (text/event-stream)
+    GET {QUOTE_STREAM_URL}?symbols=A,B,C    (Last-Event-ID: 마지막으로 받은 순번)
+
+    id: 1042
+    data: {"quotes": [{"symbol": "KRW=X", "price": 1381.2, "previousClose": 1378.0, "time": 1700000000}]}
+
+동작:
+    - 순번(id)이 건너뛰면 빠진 시세가 있다는 뜻이므로 엔진이 즉시 한 번 폴링해서 맞춥니다.
+    - 끊기면 지수 백오프 + 지터로 다시 연결하고, 그동안은 기존 폴링이 평소 주기로 돕니다.
+      (스트림 엔드포인트가 없거나 404여도 폴링만으로 계속 동작)
+    - 연결 중에는 폴링을 STREAM_POLL_INTERVAL마다 한 번만 합니다 (분봉 / 누락 보정용).
+    - 받은 시세는 티커별 마지막 값만 모아 COALESCE_INTERVAL마다 보냅니다
+      (시세가 몰려와도 Qt 이벤트 큐에는 화면 갱신 주기당 티커 하나씩만 쌓임).
+
+QUOTE_STREAM_URL 환경 변수를 주면 켜집니다.
+    예: QUOTE_STREAM_URL=http://127.0.0.1:8765/stream python exchange_widget.py
+===================================================================================
+"""
+
+import asyncio
+import json
+import os
+import random
+import time
+
+from quote_decode import Quote
+from quote_providers import QuoteError, HEADERS
+
+
+STREAM_URL = os.environ.get("QUOTE_STREAM_URL")
+
+COALESCE_INTERVAL = 0.1      # 모은 시세를 보내는 간격 (초, 화면 갱신 주기)
+STREAM_POLL_INTERVAL = 300   # 스트림 연결 중 폴링 간격 (초)
+IDLE_TIMEOUT = 30            # 이 시간 동안 아무것도 오지 않으면 끊긴 것으로 보고 다시 연결 (초)
+RECONNECT_BASE = 1.0         # 첫 재연결 대기 (초)
+RECONNECT_MAX = 60.0         # 최대 재연결 대기 (초)
+
+
+def stream_quotes(data):
+    """
+    이벤트 data(JSON)를 Quote 목록으로 바꿉니다.
+
+    Raises:
+        ValueError: JSON이 아님
+    """
+    quotes = []
+    for item in json.loads(data).get("quotes", ()):
+        price, prev_close = item.get("price"), item.get("previousClose")
+        if not item.get("symbol") or price is None or prev_close is None:
+            continue
+        quotes.append(Quote(item["symbol"], price, price - prev_close, prev_close,
+                            int(item.get("time") or time.time())))
+    return quotes
+
+
+class SSEParser:
+    """
+    text/event-stream을 한 줄씩 받아 이벤트로 묶습니다 (data / id / 주석만 처리).
+
+    last_id는 이벤트가 끝나도 유지됩니다 (다음 이벤트에 id가 없으면 그대로 씀).
+    """
+
+    def __init__(self):
+        self.last_id = None
+        self._data = []
+
+    def feed(self, line):
+        """
+        Args:
+            line (str): 줄바꿈을 포함하거나 포함하지 않은 한 줄
+
+        Returns:
+            tuple: 이벤트가 끝났으면 (id, data), 아니면 None
+        """
+        line = line.rstrip("\r\n")
+        if not line:
+            if not self._data:
+                return None
+            event = (self.last_id, "\n".join(self._data))
+            self._data = []
+            return event
+        if line.startswith(":"):
+            return None  # 주석 (연결 유지용 핑)
+
+        field, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+        if field == "data":
+            self._data.append(value)
+        elif field == "id":
+            self.last_id = value
+        return None
+
+
+class QuoteStream:
+    """
+    스트리밍 연결 관리 (엔진의 asyncio 루프에서 run()을 작업으로 돌림)
+
+    콜백은 모두 루프 스레드에서 불립니다.
+
+    Args:
+        url (str): 스트림 주소
+        symbols (callable): 지금 구독 중인 티커 목록을 돌려주는 함수
+        on_quotes (callable): 모은 시세 목록을 받는 함수 (COALESCE_INTERVAL마다, 티커별 최신 값만)
+        on_state (callable): 연결 상태가 바뀔 때 live(bool)를 받는 함수
+        on_gap (callable): 순번이 건너뛰었을 때 (다시 맞추기)
+        interval (float): 모아 보내는 간격 (초)
+    """
+
+    def __init__(self, url, symbols, on_quotes, on_state=None, on_gap=None, interval=COALESCE_INTERVAL):
+        self.url = url
+        self.symbols = symbols
+        self.on_quotes = on_quotes
+        self.on_state = on_state
+        self.on_gap = on_gap
+        self.interval = interval
+        self.random = random.Random()
+
+        self.live = False
+        self.last_seq = None
+        # 계측 (벤치마크/디버그용)
+        self.events = 0       # 받은 이벤트 수
+        self.received = 0     # 이벤트에 들어 있던 시세 수
+        self.emitted = 0      # 모아서 보낸 시세 수
+        self.gaps = 0         # 순번이 건너뛴 횟수
+        self.connects = 0     # 연결에 성공한 횟수
+
+        self._pending = {}        # 티커 -> 아직 보내지 않은 최신 Quote
+        self._response = None     # 연결 중인 응답 (구독이 바뀌면 닫고 다시 연결)
+        self._connected_symbols = None
+        self._resubscribe = False
+
+    def backoff(self, failures):
+        """PollScheduler.backoff와 같은 "equal jitter" 방식"""
+        delay = min(RECONNECT_MAX, RECONNECT_BASE * 2 ** (failures - 1))
+        return delay / 2 + self.random.uniform(0, delay / 2)
+
+    async def run(self, session):
+        """연결 -> 끊기면 다시 연결을 엔진이 멈출 때(취소)까지 반복합니다."""
+        flusher = asyncio.ensure_future(self._flush_loop())
+        failures = 0
+        try:
+            while True:
+                symbols = sorted(self.symbols())
+                if not symbols:
+                    await asyncio.sleep(1.0)
+                    continue
+                try:
+                    await self._connect(session, symbols)
+                    failures = 0
+                except Exception as e:
+                    # QuoteError / 타임아웃 / aiohttp.ClientError 등
+                    # (aiohttp는 필요할 때만 불러오므로 여기서 이름으로 잡지 않음)
+                    if not self._resubscribe:
+                        failures += 1
+                        if failures == 1:
+                            print(f"Quote Stream Disconnected: {type(e).__name__}: {e}")
+                finally:
+                    self._response = None
+                    self._set_live(False)
+
+                if self._resubscribe:
+                    self._resubscribe = False  # 구독 변경 -> 바로 다시 연결
+                    continue
+                await asyncio.sleep(self.backoff(failures) if failures else RECONNECT_BASE)
+        finally:
+            flusher.cancel()
+
+    async def _connect(self, session, symbols):
+        import aiohttp
+
+        headers = dict(HEADERS, Accept="text/event-stream")
+        if self.last_seq is not None:
+            headers["Last-Event-ID"] = str(self.last_seq)  # 서버가 지원하면 이어서 보내 줌
+        # 세션 기본 타임아웃(전체 5초)은 계속 열려 있는 스트림에는 맞지 않음
+        timeout = aiohttp.ClientTimeout(total=None, sock_connect=5)
+
+        async with session.get(self.url, params={"symbols": ",".join(symbols)},
+                               headers=headers, timeout=timeout) as response:
+            if response.status != 200:
+                raise QuoteError("http", status=response.status)
+            if response.content_type != "text/event-stream":
+                raise QuoteError("data")
+
+            self._response = response
+            self._connected_symbols = set(symbols)
+            self.connects += 1
+            self._set_live(True)
+
+            parser = SSEParser()
+            while True:
+                line = await asyncio.wait_for(response.content.readline(), IDLE_TIMEOUT)
+                if not line:
+                    return  # 서버가 연결을 닫음
+                event = parser.feed(line.decode("utf-8", "replace"))
+                if event:
+                    self._handle(*event)
+
+    def _handle(self, event_id, data):
+        try:
+            seq = int(event_id)
+        except (TypeError, ValueError):
+            seq = None
+        if seq is not None:
+            # 건너뛰었거나 서버가 순번을 처음부터 다시 셈 -> 폴링으로 다시 맞춤
+            if self.last_seq is not None and seq != self.last_seq + 1:
+                self.gaps += 1
+                if self.on_gap:
+                    self.on_gap()
+            self.last_seq = seq
+
+        try:
+            quotes = stream_quotes(data)
+        except (ValueError, AttributeError, TypeError):
+            return  # 해석할 수 없는 이벤트는 무시
+        self.events += 1
+        self.received += len(quotes)
+        for quote in quotes:
+            self._pending[quote.ticker] = quote
+
+    async def _flush_loop(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            if self._pending:
+                quotes, self._pending = list(self._pending.values()), {}
+                self.emitted += len(quotes)
+                self.on_quotes(quotes)
+
+            # 구독 티커가 바뀌었으면 연결을 닫고 새 목록으로 다시 연결
+            if self._response is not None and self._connected_symbols != set(self.symbols()):
+                self._resubscribe = True
+                self._response.close()
+
+    def _set_live(self, live):
+        if live != self.live:
+            self.live = live
+            if self.on_state:
+                self.on_state(live)
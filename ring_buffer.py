@@ -0,0 +1,99 @@
+"""
+===================================================================================
+Bar Ring Buffer (분봉 링 버퍼)
+===================================================================================
+목적: 티커별 1분봉(시각, 종가)을 고정 크기 배열에 보관합니다.
+      - 파이썬 리스트/딕셔너리 대신 array 모듈의 타입 배열 사용 (bar당 16바이트)
+      - 조회할 때마다 하루치 전체를 다시 쌓지 않고, 새로 생긴 봉만 덧붙임
+      - 가득 차면 가장 오래된 봉부터 덮어씀
+===================================================================================
+"""
+
+from array import array
+from bisect import bisect_right
+
+
+class BarRingBuffer:
+    """
+    (시각, 종가) 분봉을 보관하는 고정 크기 링 버퍼
+
+    Args:
+        capacity (int): 보관할 최대 봉 개수 (기본값: 1440 = 24시간치 1분봉)
+    """
+
+    def __init__(self, capacity=1440):
+        self.capacity = capacity
+        self.timestamps = array('q', bytes(8 * capacity))  # 유닉스 시간 (초)
+        self.closes = array('d', bytes(8 * capacity))      # 종가
+        self.start = 0   # 가장 오래된 봉의 위치
+        self.size = 0    # 보관 중인 봉 개수
+
+    def __len__(self):
+        return self.size
+
+    @property
+    def last_timestamp(self):
+        if self.size == 0:
+            return None
+        return self.timestamps[(self.start + self.size - 1) % self.capacity]
+
+    def append(self, timestamp, close):
+        end = (self.start + self.size) % self.capacity
+        self.timestamps[end] = int(timestamp)  # array('q')는 float를 받지 않음 (루프 스레드가 죽지 않도록)
+        self.closes[end] = close
+
+        if self.size < self.capacity:
+            self.size += 1
+        else:
+            self.start = (self.start + 1) % self.capacity  # 가장 오래된 봉을 덮어씀
+
+    def extend(self, timestamps, closes):
+        """
+        새 봉만 덧붙입니다.
+
+        야후는 매번 하루치 전체를 보내므로, 이미 가진 마지막 봉 이후만 골라 씁니다.
+        마지막 봉(진행 중인 1분봉)은 시각이 같아도 종가가 바뀌므로 덮어씁니다.
+        종가가 없는 봉(None, 거래 없음)은 건너뜁니다.
+
+        Args:
+            timestamps (sequence): 오름차순 시각 목록
+            closes (sequence): 같은 길이의 종가 목록
+
+        Returns:
+            int: 추가되거나 갱신된 봉 개수
+        """
+        last = self.last_timestamp
+        begin = 0 if last is None else bisect_right(timestamps, last) - 1
+        changed = 0
+
+        for i in range(max(begin, 0), len(timestamps)):
+            ts, close = int(timestamps[i]), closes[i]
+            if close is None:
+                continue
+
+            if last is not None and ts == last:
+                index = (self.start + self.size - 1) % self.capacity
+                if self.closes[index] != close:
+                    self.closes[index] = close
+                    changed += 1
+            elif last is None or ts > last:
+                self.append(ts, close)
+                last = ts
+                changed += 1
+
+        return changed
+
+    def snapshot(self):
+        """
+        오래된 순서로 정렬된 복사본을 돌려줍니다.
+
+        Returns:
+            tuple: (array('q') 시각, array('d') 종가)
+        """
+        end = self.start + self.size
+        if end <= self.capacity:
+            return self.timestamps[self.start:end], self.closes[self.start:end]
+
+        wrap = end - self.capacity
+        return (self.timestamps[self.start:] + self.timestamps[:wrap],
+                self.closes[self.start:] + self.closes[:wrap])
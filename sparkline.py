@@ -0,0 +1,196 @@
+"""
+===================================================================================
+Sparkline (당일 추세 미니 차트)
+===================================================================================
+목적: 시세 엔진의 1분봉 링 버퍼를 작은 꺾은선으로 그립니다.
+      축/눈금 없이 추세만 보여주는 위젯이라 어느 모니터 창에나 끼워 넣을 수 있습니다.
+
+[렌더링 캐시]
+항상 위 창은 이동, 겹침, 가려졌다 드러남 등으로 paintEvent가 자주 호출됩니다.
+그때마다 꺾은선 전체를 다시 계산하지 않도록 그린 결과를 QPixmap에 보관하고,
+paintEvent에서는 그 그림을 복사만 합니다.
+    - 크기 변경, 기준선/색상/세로 범위 변경  -> 전체 다시 그리기
+    - 끝에 새 봉만 추가됨                     -> 바뀐 꼬리 부분만 지우고 덧그리기
+===================================================================================
+"""
+
+from PyQt5.QtWidgets import QWidget
+from PyQt5.QtCore import Qt, QPointF, QRectF
+from PyQt5.QtGui import QPainter, QPen, QColor, QPixmap, QPolygonF
+
+
+class Sparkline(QWidget):
+    """
+    종가 배열을 위젯 크기에 맞춰 꺾은선으로 그립니다.
+
+    색상 규칙은 다른 라벨과 같습니다: 상승(빨강), 하락(파랑), 변동없음(회색)
+    전일 종가(baseline)를 지정하면 점선으로 함께 표시합니다.
+
+    가로축은 봉 개수가 아니라 slots칸(기본 1440 = 24시간 1분봉) 기준이라
+    새 봉이 추가되어도 기존 점의 위치가 바뀌지 않습니다.
+    기록에서 읽은 1주 / 1개월 시계열처럼 점 수가 정해진 경우는 set_series()에 slots를 줍니다.
+
+    Args:
+        slots (int): 가로축 칸 수 (BarRingBuffer 용량과 맞춤)
+    """
+
+    UP_COLOR = QColor("#FF4444")
+    DOWN_COLOR = QColor("#4444FF")
+    FLAT_COLOR = QColor("#AAAAAA")
+    BASELINE_COLOR = QColor("#555555")
+
+    MARGIN = 2
+    Y_PADDING = 0.1  # 세로 범위 여유 (작은 움직임은 범위를 넘지 않아 덧그리기 가능)
+
+    def __init__(self, slots=1440, parent=None):
+        super().__init__(parent)
+        self.slots = self.default_slots = slots
+        self.closes = ()
+        self.baseline = None
+        self.setAttribute(Qt.WA_TranslucentBackground)
+        self.setMinimumHeight(20)
+
+        self._pixmap = None       # 그려둔 차트 (None이면 다음 paintEvent에서 전체 그리기)
+        self._tail_from = None    # 덧그리기 시작 인덱스 (None이면 덧그릴 것 없음)
+        self._low = self._high = None
+        self._color = None
+
+        # 벤치마크/디버그용 카운터
+        self.full_renders = 0
+        self.tail_renders = 0
+
+    def set_series(self, closes, baseline=None, slots=None):
+        """
+        Args:
+            closes (sequence): 오래된 순서의 종가 목록 (array('d') 등)
+            baseline (float): 전일 종가 (선택)
+            slots (int): 가로축 칸 수 (기본값: 만들 때 지정한 값)
+        """
+        slots = slots or self.default_slots
+        if slots != self.slots:
+            self.slots = slots
+            self.invalidate()
+
+        old = self.closes
+        self.closes = closes
+        changed_baseline = baseline != self.baseline
+        self.baseline = baseline
+
+        if self._pixmap is None or changed_baseline or not self._can_append(old, closes):
+            self.invalidate()
+        else:
+            # 이전 마지막 봉(진행 중이던 1분봉)은 값이 바뀌었을 수 있으므로 그 앞 점부터
+            start = max(len(old) - 2, 0)
+            self._tail_from = start if self._tail_from is None else min(self._tail_from, start)
+        self.update()
+
+    def invalidate(self):
+        """캐시를 버리고 다음 paintEvent에서 전체를 다시 그립니다."""
+        self._pixmap = None
+        self._tail_from = None
+
+    def resizeEvent(self, event):
+        self.invalidate()
+        super().resizeEvent(event)
+
+    def paintEvent(self, event):
+        if len(self.closes) < 2:
+            return
+
+        if self._pixmap is None:
+            self._render_full()
+        elif self._tail_from is not None:
+            self._render_tail(self._tail_from)
+        self._tail_from = None
+
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._pixmap)
+        painter.end()
+
+    # --- 판단 로직 ---
+    def _can_append(self, old, new):
+        """새 배열이 기존 배열 끝에 봉만 추가된 것이고, 범위/색상이 그대로인지"""
+        if len(old) < 2 or len(new) < len(old) or len(new) > self.slots:
+            return False
+        if new[:len(old) - 1] != old[:len(old) - 1]:
+            return False  # 앞부분이 바뀜 (링 버퍼가 밀렸거나 다른 티커)
+
+        tail = new[len(old) - 1:]
+        if min(tail) < self._low or max(tail) > self._high:
+            return False  # 세로 범위를 벗어남
+        return self._line_color() == self._color
+
+    def _line_color(self):
+        reference = self.baseline if self.baseline is not None else self.closes[0]
+        last = self.closes[-1]
+        if last > reference:
+            return self.UP_COLOR
+        if last < reference:
+            return self.DOWN_COLOR
+        return self.FLAT_COLOR
+
+    # --- 좌표 변환 ---
+    def _x_of(self, index):
+        width = self.width() - self.MARGIN * 2
+        return self.MARGIN + index * width / max(self.slots - 1, 1)
+
+    def _y_of(self, value):
+        height = self.height() - self.MARGIN * 2
+        return self.MARGIN + height - (value - self._low) / (self._high - self._low) * height
+
+    # --- 그리기 ---
+    def _new_painter(self):
+        painter = QPainter(self._pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        return painter
+
+    def _render_full(self):
+        values = list(self.closes)
+        if self.baseline is not None:
+            values.append(self.baseline)
+        low, high = min(values), max(values)
+        padding = ((high - low) or abs(high) or 1.0) * self.Y_PADDING
+        self._low, self._high = low - padding, high + padding
+        self._color = self._line_color()
+
+        ratio = self.devicePixelRatioF()
+        self._pixmap = QPixmap(self.size() * ratio)
+        self._pixmap.setDevicePixelRatio(ratio)
+        self._pixmap.fill(Qt.transparent)
+
+        painter = self._new_painter()
+        self._draw_baseline(painter)
+        self._draw_line(painter, 0)
+        painter.end()
+        self.full_renders += 1
+
+    def _render_tail(self, start):
+        """start번째 점 오른쪽만 지우고 기준선과 꺾은선을 다시 그립니다."""
+        x = self._x_of(start)
+        clip = QRectF(x, 0, self.width() - x, self.height())
+
+        painter = self._new_painter()
+        painter.setCompositionMode(QPainter.CompositionMode_Source)
+        painter.fillRect(clip, Qt.transparent)
+        painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
+
+        # 점선 무늬가 어긋나지 않도록 전체 선을 그리되 지운 영역만 잘라서 그림
+        # (꺾은선도 한 점 앞부터 그려야 경계에 걸친 선분이 끊기지 않음)
+        painter.setClipRect(clip)
+        self._draw_baseline(painter)
+        self._draw_line(painter, max(start - 1, 0))
+        painter.end()
+        self.tail_renders += 1
+
+    def _draw_baseline(self, painter):
+        if self.baseline is None:
+            return
+        painter.setPen(QPen(self.BASELINE_COLOR, 1, Qt.DashLine))
+        y = self._y_of(self.baseline)
+        painter.drawLine(QPointF(self.MARGIN, y), QPointF(self.width() - self.MARGIN, y))
+
+    def _draw_line(self, painter, start):
+        polygon = QPolygonF([QPointF(self._x_of(i), self._y_of(self.closes[i]))
+                             for i in range(start, len(self.closes))])
+        painter.setPen(QPen(self._color, 1.5))
+        painter.drawPolyline(polygon)
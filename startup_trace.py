@@ -0,0 +1,69 @@
+"""
+===================================================================================
+Startup Trace (시작 시간 기록)
+===================================================================================
+목적: 프로그램을 켠 뒤 첫 화면과 첫 시세가 나오기까지 걸린 시간을 기록합니다.
+
+EXM_STARTUP_TRACE 환경 변수에 파일 경로를 주면 아래 시점의 유닉스 시간을
+"이름 시각" 한 줄씩 그 파일에 덧붙입니다 (각 시점은 한 번만 기록).
+    - first_paint: 창이 처음 그려진 시점
+    - first_cached_quote: 캐시에 있던 시세를 처음 표시한 시점
+    - first_quote: 새로 받은 시세를 처음 표시한 시점
+
+exe는 콘솔이 없으므로 파일로 남깁니다. benchmarks/bench_startup.py가 이 파일을 읽습니다.
+    예: EXM_STARTUP_TRACE=trace.txt python executive_exchange_monitor.py
+===================================================================================
+"""
+
+import os
+import time
+
+from PyQt5.QtCore import QObject, QEvent
+
+
+TRACE_PATH = os.environ.get("EXM_STARTUP_TRACE")
+
+_marked = set()
+
+
+def mark(name):
+    """
+    시점 하나를 기록합니다 (EXM_STARTUP_TRACE가 없거나 이미 기록한 시점이면 무시).
+
+    Args:
+        name (str): 시점 이름
+    """
+    if not TRACE_PATH or name in _marked:
+        return
+    _marked.add(name)
+    try:
+        with open(TRACE_PATH, "a", encoding="utf-8") as f:
+            f.write(f"{name} {time.time():.6f}\n")
+    except OSError:
+        pass  # 기록 실패는 프로그램 동작과 무관
+
+
+def mark_quote(quote):
+    """시세를 표시할 때 호출 (캐시 값이면 first_cached_quote, 새 값이면 first_quote)"""
+    mark("first_cached_quote" if quote.stale else "first_quote")
+
+
+class _FirstPaint(QObject):
+    """위젯이 처음 그려질 때 first_paint를 기록하고 스스로 빠지는 이벤트 필터"""
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint:
+            mark("first_paint")
+            obj.removeEventFilter(self)
+        return False
+
+
+def watch_first_paint(widget):
+    """
+    위젯의 첫 그리기 시점을 기록합니다.
+
+    Args:
+        widget (QWidget): 메인 창
+    """
+    if TRACE_PATH:
+        widget.installEventFilter(_FirstPaint(widget))
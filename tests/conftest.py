@@ -0,0 +1,60 @@
+"""
+테스트 공통 설정
+
+    - 저장소 루트와 benchmarks/(yahoo_stub)를 불러올 수 있게 경로에 넣습니다.
+    - 화면 없이 Qt를 쓰고(offscreen), 시세 기록 DB와 허브/스트림 환경 변수는 끕니다.
+    - stub: 로컬 야후 스텁 서버 (benchmarks/yahoo_stub.py), qapp: QCoreApplication
+"""
+
+import os
+import sys
+import time
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ["QUOTE_HISTORY"] = "0"
+os.environ["QUOTE_HUB"] = "0"
+for name in ("QUOTE_BASE_URL", "QUOTE_STREAM_URL", "QUOTE_RECORD", "QUOTE_REPLAY",
+             "QUOTE_METRICS_PORT", "QUOTE_HISTORY_RETENTION"):
+    os.environ.pop(name, None)
+
+FIXTURES = os.path.join(ROOT, "tests", "fixtures")
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    from PyQt5.QtCore import QCoreApplication
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+@pytest.fixture
+def stub(request):
+    """기본 옵션의 스텁 서버 (@pytest.mark.stub(rate_limit=...)로 옵션 지정)"""
+    from yahoo_stub import StubMarket, start_stub_server
+
+    marker = request.node.get_closest_marker("stub")
+    options = dict(marker.kwargs) if marker else {}
+    server = start_stub_server(market=StubMarket(seed=1), **options)
+    yield server
+    server.shutdown()
+
+
+def wait_until(app, predicate, timeout=5.0):
+    """Qt 이벤트를 처리하면서 predicate()가 참이 될 때까지 기다립니다 (시간 초과면 False)."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        app.processEvents()
+        if predicate():
+            return True
+        time.sleep(0.01)
+    app.processEvents()
+    return predicate()
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "stub(**options): yahoo_stub.start_stub_server 옵션")
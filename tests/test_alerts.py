@@ -0,0 +1,47 @@
+"""알림 규칙 색인 테스트 (alert_engine._TickerIndex)"""
+
+import pytest
+
+from alert_engine import AlertEngine, AlertRule, _TickerIndex
+
+
+ABOVE = AlertRule("KRW=X", "above", 1400)
+BELOW = AlertRule("KRW=X", "below", 1300)
+MOVE = AlertRule("KRW=X", "move", 3)            # 전일 1350 -> 1390.5 / 1309.5
+
+
+@pytest.fixture
+def index():
+    return _TickerIndex([ABOVE, BELOW, MOVE], prev_close=1350.0)
+
+
+def test_rising_fires_upward_rules_in_order(index):
+    assert index.crossed(1380, 1410) == [MOVE, ABOVE]
+    assert index.crossed(1410, 1380) == []            # 위쪽 기준가를 아래로 지나도 발동하지 않음
+
+
+def test_falling_fires_nearest_level_first(index):
+    assert index.crossed(1350, 1290) == [MOVE, BELOW]
+    assert index.crossed(1290, 1350) == []
+
+
+def test_boundaries(index):
+    assert index.crossed(1399, 1400) == [ABOVE]        # 기준가에 닿으면 발동
+    assert index.crossed(1400, 1401) == []             # 이미 넘어 있던 기준가
+    assert index.crossed(1301, 1300) == [BELOW]
+    assert index.crossed(1300, 1299) == []
+    assert index.crossed(1400, 1400) == []
+
+
+def test_move_rule_needs_prev_close():
+    index = _TickerIndex([MOVE], prev_close=None)
+    assert index.levels == []
+    assert index.crossed(1000, 2000) == []
+
+
+def test_unknown_type_is_rejected():
+    with pytest.raises(ValueError):
+        AlertRule("KRW=X", "sideways", 1)
+    rules = AlertEngine.parse_config([{"ticker": "KRW=X", "type": "sideways", "value": 1},
+                                      {"ticker": "KRW=X", "type": "above", "value": "1400"}])
+    assert [(r.type, r.value) for r in rules] == [("above", 1400.0)]
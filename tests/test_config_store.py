@@ -0,0 +1,119 @@
+"""설정 저장소 테스트 (config_store.ConfigStore)"""
+
+import json
+import os
+
+import pytest
+
+from config_store import DEFAULT_CONFIG, ConfigError, ConfigStore, read_config
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "widget_config.json")
+
+
+def write(path, data):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(data if isinstance(data, str) else json.dumps(data))
+
+
+def open_store(qapp, path):
+    store = ConfigStore(path, delay_ms=10)
+    changes = []
+    store.changed.connect(changes.append)
+    return store, changes
+
+
+def test_missing_file_starts_with_defaults(qapp, path):
+    store, _ = open_store(qapp, path)
+    assert store.get("currency") == DEFAULT_CONFIG["currency"]
+    assert store.load_error is None
+    assert not os.path.exists(path)
+
+
+@pytest.mark.parametrize("text", ['{"pos_x": 1,', '[1, 2, 3]'])
+def test_corrupt_file_is_moved_aside(qapp, path, text):
+    write(path, text)
+    store, _ = open_store(qapp, path)
+
+    assert store.load_error
+    assert store.get("pos_x") == DEFAULT_CONFIG["pos_x"]
+    assert not os.path.exists(path)
+    with open(store.backup_path, encoding="utf-8") as f:
+        assert f.read() == text                    # 원래 내용은 그대로 남음
+
+    # 다음 저장은 새 파일에 (깨진 파일을 덮어쓰지 않음)
+    store.set("pos_x", 5)
+    store.flush(wait=True)
+    assert read_config(path)["pos_x"] == 5
+
+
+def test_read_config_errors(path):
+    assert read_config(path) is None
+    write(path, '"text"')
+    with pytest.raises(ConfigError):
+        read_config(path)
+
+
+def test_updates_are_debounced_into_one_write(qapp, path):
+    store, _ = open_store(qapp, path)
+    for x in range(50):
+        store.update({"pos_x": x, "pos_y": x})
+    assert not os.path.exists(path)               # 타이머가 끝나기 전에는 쓰지 않음
+
+    store.flush(wait=True)
+    assert read_config(path)["pos_x"] == 49
+    assert not [n for n in os.listdir(os.path.dirname(path)) if n.endswith(".tmp")]
+
+
+def test_own_write_is_not_reported_as_change(qapp, path):
+    write(path, DEFAULT_CONFIG)
+    store, changes = open_store(qapp, path)
+
+    store.set("pos_x", 300)
+    store.flush(wait=True)
+    store.reload()                                # 파일 감시가 우리 쓰기를 알려 온 경우
+    assert changes == []
+    assert store.get("pos_x") == 300
+
+
+def test_external_edit_is_reloaded(qapp, path):
+    write(path, DEFAULT_CONFIG)
+    store, changes = open_store(qapp, path)
+
+    write(path, dict(DEFAULT_CONFIG, currency="JPY/KRW", pos_x=7))
+    store.reload()
+    assert changes == [{"currency", "pos_x"}]
+    assert store.get("currency") == "JPY/KRW"
+
+    store.reload()                                # 같은 내용을 다시 읽어도 알리지 않음
+    assert len(changes) == 1
+
+
+def test_pending_widget_change_wins_over_external_edit(qapp, path):
+    write(path, DEFAULT_CONFIG)
+    store, changes = open_store(qapp, path)
+
+    store.set("pos_x", 400)                       # 아직 저장 전
+    write(path, dict(DEFAULT_CONFIG, pos_x=1, pos_y=2))
+    store.reload()
+    assert changes == [{"pos_y"}]
+    assert store.get("pos_x") == 400
+
+
+def test_corrupt_external_edit_keeps_memory(qapp, path):
+    write(path, DEFAULT_CONFIG)
+    store, changes = open_store(qapp, path)
+
+    write(path, '{"currency": ')                  # 편집기가 쓰는 도중
+    store.reload()
+    assert changes == []
+    assert store.get("currency") == DEFAULT_CONFIG["currency"]
+    assert os.path.exists(path)                   # 다시 읽을 때는 옮기지 않음
+
+
+def test_get_returns_copies(qapp, path):
+    store, _ = open_store(qapp, path)
+    store.get("alerts").append({"ticker": "KRW=X"})
+    assert store.get("alerts") == []
@@ -0,0 +1,69 @@
+"""파생 통화 쌍 테스트 (cross_rates)"""
+
+from array import array
+
+import pytest
+
+from cross_rates import LEG_TICKERS, CrossRates, find_path, leg_currencies
+from quote_decode import Quote
+
+
+def test_leg_currencies():
+    assert leg_currencies("KRW=X") == ("USD", "KRW")
+    assert leg_currencies("JPYKRW=X") == ("JPY", "KRW")
+    assert leg_currencies("BTC-USD") == ("BTC", "USD")
+    assert leg_currencies("^KS11") is None
+
+
+def test_find_path():
+    assert find_path("BTC", "KRW", LEG_TICKERS) == [("BTC-USD", False), ("KRW=X", False)]
+    assert find_path("KRW", "USD", LEG_TICKERS) == [("KRW=X", True)]
+    assert find_path("JPY", "USD", LEG_TICKERS) == [("JPYKRW=X", False), ("KRW=X", True)]
+    assert find_path("BTC", "ETH", LEG_TICKERS) == [("BTC-USD", False), ("ETH-USD", True)]
+    assert find_path("EUR", "KRW", LEG_TICKERS) is None
+    assert find_path("KRW", "KRW", LEG_TICKERS) is None
+
+
+def test_resolve_prefers_subscribed_legs_and_sticks():
+    cross = CrossRates()
+    assert cross.resolve("EUR/KRW") is None
+    assert cross.resolve("EUR/KRW", ["EURKRW=X"]) == [("EURKRW=X", False)]
+    assert cross.resolve("EUR/KRW") == [("EURKRW=X", False)]   # 한 번 정하면 유지
+    assert cross.dependents(["EURKRW=X"], ["EUR/KRW", "BTC/KRW"]) == ["EUR/KRW"]
+
+
+def test_combine():
+    cross = CrossRates()
+    cross.resolve("BTC/KRW")
+    quotes = {"BTC-USD": Quote("BTC-USD", 70000.0, 3000.0, 67000.0, 200),
+              "KRW=X": Quote("KRW=X", 1400.0, 20.0, 1380.0, 100, stale=True)}
+
+    quote = cross.combine("BTC/KRW", quotes)
+    assert quote.price == pytest.approx(70000.0 * 1400.0)
+    assert quote.prev_close == pytest.approx(67000.0 * 1380.0)
+    assert quote.change == pytest.approx(quote.price - quote.prev_close)
+    assert (quote.timestamp, quote.stale) == (100, True)   # 가장 오래된 다리 기준
+
+    assert cross.combine("BTC/KRW", {"BTC-USD": quotes["BTC-USD"]}) is None
+    assert cross.combine("ETH/KRW", quotes) is None        # 경로를 정하지 않은 티커
+
+
+def test_combine_inverted_leg():
+    cross = CrossRates()
+    cross.resolve("KRW/USD")
+    quote = cross.combine("KRW/USD", {"KRW=X": Quote("KRW=X", 1400.0, 20.0, 1380.0, 100)})
+    assert quote.price == pytest.approx(1 / 1400.0)
+    assert quote.prev_close == pytest.approx(1 / 1380.0)
+
+
+def test_combine_series_uses_last_leg_close_before_each_bar():
+    cross = CrossRates()
+    cross.resolve("BTC/KRW")
+    series = {"BTC-USD": (array('q', [60, 120, 180, 240]), array('d', [10.0, 11.0, 12.0, 13.0])),
+              "KRW=X": (array('q', [120, 240]), array('d', [2.0, 3.0]))}
+
+    timestamps, closes = cross.combine_series("BTC/KRW", series)
+    # 60초 봉은 KRW=X 봉이 아직 없어 빠지고, 180초 봉은 120초의 2.0을 씀
+    assert list(timestamps) == [120, 180, 240]
+    assert list(closes) == [22.0, 24.0, 39.0]
+    assert [list(a) for a in cross.combine_series("ETH/KRW", series)] == [[], []]
@@ -0,0 +1,100 @@
+"""
+spark 응답 해석 테스트 (quote_decode)
+
+tests/fixtures/spark_v8.json (v8 형식)으로 가벼운 해석과 전체 해석의 결과가 같은지,
+이미 가진 봉 이후만 해석하는 경로(last_timestamps)가 맞는지 확인합니다.
+"""
+
+import asyncio
+import json
+import os
+
+import pytest
+
+from conftest import FIXTURES
+from quote_decode import decode_spark, parse_spark, parse_spark_series
+from quote_providers import FakeQuoteProvider, HedgedFetcher, QuoteError, YahooSparkProvider
+from yahoo_stub import StubMarket
+
+
+@pytest.fixture(scope="module")
+def spark_v8():
+    with open(os.path.join(FIXTURES, "spark_v8.json"), encoding="utf-8") as f:
+        return f.read()
+
+
+def test_lean_matches_full_parse(spark_v8):
+    data = json.loads(spark_v8)
+    quotes, series = decode_spark(spark_v8)
+
+    assert quotes and quotes == parse_spark(data)
+    assert {t: (list(ts), list(cs)) for t, (ts, cs) in series.items()} == \
+        {t: (list(ts), list(cs)) for t, (ts, cs) in parse_spark_series(data).items()}
+
+
+def test_quote_is_last_non_null_close(spark_v8):
+    data = json.loads(spark_v8)
+    quotes, _ = decode_spark(spark_v8)
+
+    for ticker, item in data.items():
+        bars = [(ts, c) for ts, c in zip(item["timestamp"], item["close"]) if c is not None]
+        quote = quotes[ticker]
+        assert (quote.timestamp, quote.price) == bars[-1]
+        assert quote.prev_close == item["chartPreviousClose"]
+        assert quote.change == pytest.approx(quote.price - quote.prev_close)
+
+
+def test_tail_path_decodes_only_new_bars(spark_v8):
+    data = json.loads(spark_v8)
+    full_quotes, _ = decode_spark(spark_v8)
+    last = {t: item["timestamp"][-5] for t, item in data.items()}
+
+    quotes, series = decode_spark(spark_v8, last)
+
+    assert quotes == full_quotes
+    for ticker, item in data.items():
+        timestamps, closes = series[ticker]
+        assert list(timestamps) == item["timestamp"][-5:]
+        assert list(closes) == item["close"][-5:]
+
+
+def test_tail_with_only_null_closes_falls_back_to_full_arrays(spark_v8):
+    data = json.loads(spark_v8)
+    # 진행 중인 마지막 봉(null)만 남는 티커: 현재가는 그 앞의 종가에서 찾아야 함
+    ticker = next(t for t, item in data.items() if item["close"][-1] is None)
+    quotes, _ = decode_spark(spark_v8, {ticker: data[ticker]["timestamp"][-1]})
+
+    assert quotes[ticker] == decode_spark(spark_v8)[0][ticker]
+
+
+def test_v7_shape_still_decodes():
+    market = StubMarket(bars=30, seed=3)
+    text = json.dumps(market.spark_v7(["KRW=X", "BTC-USD"]))
+
+    quotes, series = decode_spark(text)
+    assert set(quotes) == set(series) == {"KRW=X", "BTC-USD"}
+    assert quotes == parse_spark(json.loads(text))
+    assert len(series["KRW=X"][0]) == 30
+
+
+@pytest.mark.parametrize("text", ['{}', '{"spark": {"result": [], "error": null}}', '{"chart": {"result": null}}'])
+def test_empty_decode_raises(text):
+    with pytest.raises(ValueError):
+        decode_spark(text)
+
+
+def test_non_object_raises():
+    with pytest.raises(ValueError):
+        decode_spark('[1, 2]')
+
+
+def test_empty_decode_becomes_data_error():
+    class EmptySpark(FakeQuoteProvider):
+        def decode(self, raw, last_timestamps=None):
+            return YahooSparkProvider.decode(self, '{}', last_timestamps)
+
+    fetcher = HedgedFetcher([EmptySpark(prices={"KRW=X": 1380.0})])
+    with pytest.raises(QuoteError) as info:
+        asyncio.run(fetcher.fetch(None, ["KRW=X"]))
+    assert info.value.kind == "data"
+    assert isinstance(info.value.__cause__, ValueError)
@@ -0,0 +1,190 @@
+"""
+스텁 서버를 상대로 한 배치 조회 테스트 (get_quotes_async / QuoteEngine)
+
+    - 주기마다 구독 티커 전체가 요청 하나로 나가는지
+    - 같은 시세가 여러 구독자에게 나눠지는지
+    - 429(재시도 없음) / 503(재시도 후 실패)이 QuoteError와 백오프로 이어지는지
+"""
+
+import asyncio
+
+import pytest
+
+import quote_providers
+from conftest import wait_until
+from quote_cache import QuoteCache
+from quote_core import get_quotes_async
+from quote_engine import QuoteEngine
+from quote_providers import QuoteError, YahooSparkProvider
+
+
+TICKERS = ["KRW=X", "JPYKRW=X", "BTC-USD", "ETH-USD"]
+
+
+@pytest.fixture
+def fast_retry(monkeypatch):
+    # 503 재시도 대기(0.5초, 1초)를 줄임 (재시도 횟수는 그대로)
+    monkeypatch.setattr(quote_providers, "RETRY_BACKOFF", 0.01)
+
+
+def make_engine(stub, tmp_path):
+    return QuoteEngine(cache=QuoteCache(str(tmp_path / "quote_cache.json")),
+                       providers=[YahooSparkProvider(stub.base_url)])
+
+
+@pytest.fixture
+def engine(stub, tmp_path):
+    engine = make_engine(stub, tmp_path)
+    yield engine
+    engine.stop()
+    engine.wait(5)
+
+
+# ===================================================================================
+# [get_quotes_async]
+# ===================================================================================
+
+def test_get_quotes_async_batches_into_one_request(stub):
+    quotes, errors = asyncio.run(get_quotes_async(TICKERS, base_url=stub.base_url))
+
+    assert set(quotes) == set(TICKERS)
+    assert errors == {}
+    assert stub.request_count == 1
+    assert quotes["KRW=X"].prev_close == 1380.0
+
+
+def test_get_quotes_async_splits_over_twenty_symbols(stub):
+    symbols = [f"T{i:02d}-USD" for i in range(25)]
+    quotes, errors = asyncio.run(get_quotes_async(symbols + symbols[:3], base_url=stub.base_url))
+
+    assert set(quotes) == set(symbols)
+    assert errors == {}
+    assert stub.request_count == 2   # 20 + 5 (중복은 한 번만)
+
+
+def test_get_quotes_async_derived_uses_legs_in_same_request(stub):
+    quotes, errors = asyncio.run(get_quotes_async(["BTC/KRW"], base_url=stub.base_url))
+
+    assert errors == {}
+    assert list(quotes) == ["BTC/KRW"]   # 다리 티커는 돌려주지 않음
+    assert stub.request_count == 1
+    assert quotes["BTC/KRW"].prev_close == pytest.approx(67000.0 * 1380.0)
+
+
+@pytest.mark.stub(rate_limit=0.001)
+def test_get_quotes_async_rate_limited_is_not_retried(stub):
+    asyncio.run(get_quotes_async(TICKERS, base_url=stub.base_url))   # 토큰 하나를 씀
+    quotes, errors = asyncio.run(get_quotes_async(TICKERS, base_url=stub.base_url))
+
+    assert quotes == {}
+    assert set(errors) == set(TICKERS)
+    assert all(e.kind == "http" and e.status == 429 for e in errors.values())
+    assert stub.request_count == 2
+    assert stub.rejected_count == 1
+
+
+@pytest.mark.stub(error_rate=1.0)
+def test_get_quotes_async_server_error_retries_then_fails(stub, fast_retry):
+    quotes, errors = asyncio.run(get_quotes_async(TICKERS, base_url=stub.base_url))
+
+    assert quotes == {}
+    assert {(e.kind, e.status) for e in errors.values()} == {("http", 503)}
+    assert stub.error_count == quote_providers.RETRY_ATTEMPTS
+
+
+def test_get_quotes_async_fails_over_to_second_server(stub, fast_retry):
+    # 첫 서버는 연결 거부 -> 두 번째 서버(스텁)로 넘어감
+    dead = "http://127.0.0.1:9"
+    quotes, errors = asyncio.run(get_quotes_async(TICKERS, base_url=f"{dead},{stub.base_url}"))
+
+    assert set(quotes) == set(TICKERS)
+    assert errors == {}
+
+
+# ===================================================================================
+# [QuoteEngine]
+# ===================================================================================
+
+def test_engine_polls_all_subscriptions_in_one_request(qapp, stub, engine):
+    received, finished = [], []
+    engine.quote_updated.connect(received.append)
+    engine.poll_finished.connect(lambda: finished.append(True))
+
+    for ticker in TICKERS:
+        engine.subscribe(ticker)
+
+    assert wait_until(qapp, lambda: finished)
+    assert {q.ticker for q in received} == set(TICKERS)
+    assert stub.request_count == 1
+
+    # 다음 조회는 캘린더 주기(20초 이상) 뒤이므로 곧바로 요청이 더 나가지 않음
+    wait_until(qapp, lambda: False, timeout=0.3)
+    assert stub.request_count == 1
+    assert all(len(engine.series(t)[0]) == stub.market.bars for t in TICKERS)
+
+
+def test_engine_fans_out_to_every_subscriber(qapp, stub, engine):
+    first, second, finished = [], [], []
+    engine.quote_updated.connect(first.append)
+    engine.quote_updated.connect(second.append)
+    engine.poll_finished.connect(lambda: finished.append(True))
+
+    engine.subscribe("KRW=X")
+    engine.subscribe("KRW=X")   # 같은 티커를 쓰는 두 번째 위젯
+    assert wait_until(qapp, lambda: finished)
+    assert [q.ticker for q in first] == ["KRW=X"]
+    assert first == second
+
+    # 이미 받은 티커를 새로 구독하면 요청 없이 바로 최신 값을 보냄
+    late = []
+    engine.quote_updated.connect(late.append)
+    engine.subscribe("KRW=X")
+    assert wait_until(qapp, lambda: late)
+    assert late[0] == engine.latest("KRW=X")
+    assert stub.request_count == 1
+
+
+def test_engine_derived_ticker_from_legs(qapp, stub, engine):
+    received, finished = [], []
+    engine.quote_updated.connect(received.append)
+    engine.poll_finished.connect(lambda: finished.append(True))
+
+    engine.subscribe("BTC/KRW")
+    assert wait_until(qapp, lambda: "BTC/KRW" in {q.ticker for q in received})
+    assert stub.request_count == 1
+    btc, krw = engine.latest("BTC-USD"), engine.latest("KRW=X")
+    assert engine.latest("BTC/KRW").price == pytest.approx(btc.price * krw.price)
+
+
+@pytest.mark.stub(error_rate=1.0)
+def test_engine_server_error_reports_and_backs_off(qapp, stub, engine, fast_retry):
+    errors, finished = [], []
+    engine.error_occurred.connect(errors.append)
+    engine.poll_finished.connect(lambda: finished.append(True))
+
+    engine.subscribe("KRW=X")
+    assert wait_until(qapp, lambda: finished)
+    assert [(e.kind, e.status) for e in errors] == [("http", 503)]
+    assert engine.scheduler.backing_off("fx")
+    assert engine.latest("KRW=X") is None
+
+    # 백오프 중에는 새로고침해도 바로 다시 요청하지 않음
+    requests = stub.request_count
+    engine.refresh()
+    wait_until(qapp, lambda: False, timeout=0.3)
+    assert stub.request_count == requests
+
+
+@pytest.mark.stub(rate_limit=0.001)
+def test_engine_rate_limited_reports_429(qapp, stub, engine):
+    errors, finished = [], []
+    engine.error_occurred.connect(errors.append)
+    engine.poll_finished.connect(lambda: finished.append(True))
+    stub.limiter.tokens = 0   # 첫 요청부터 제한
+
+    engine.subscribe("BTC-USD")
+    assert wait_until(qapp, lambda: finished)
+    assert isinstance(errors[0], QuoteError)
+    assert (errors[0].kind, errors[0].status) == ("http", 429)
+    assert stub.request_count == 1   # 429는 재시도하지 않음
+    assert engine.scheduler.backing_off("crypto")
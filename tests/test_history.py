@@ -0,0 +1,117 @@
+"""시세 기록 저장소 테스트 (quote_history)"""
+
+import sqlite3
+import time
+
+import pytest
+
+from quote_history import QuoteHistory, RETENTION_DAYS, history_series, retention_from_env, rollup
+
+
+DAY = 86400
+
+
+def rows(path, table):
+    db = sqlite3.connect(path)
+    try:
+        return db.execute(f"SELECT * FROM {table} ORDER BY ticker, ts").fetchall()
+    finally:
+        db.close()
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "quote_history.db")
+
+
+def test_rollup_keeps_open_high_low_close():
+    points = [("A", 130, 3.0), ("A", 65, 1.0), ("A", 90, 5.0), ("A", 119, 2.0), ("B", 61, 9.0)]
+    assert rollup(points, 60) == {
+        ("A", 60): [1.0, 5.0, 1.0, 2.0, 65, 119],     # 도착 순서가 아니라 시각 순서로 시가/종가
+        ("A", 120): [3.0, 3.0, 3.0, 3.0, 130, 130],
+        ("B", 60): [9.0, 9.0, 9.0, 9.0, 61, 61],
+    }
+
+
+def test_writes_ticks_and_bars(db_path):
+    history = QuoteHistory(db_path)
+    base = int(time.time()) // 3600 * 3600
+    history.add("KRW=X", [base + 10, base + 20, base + 70], [1.0, 3.0, 2.0])
+    history.add("KRW=X", [base + 5, base + 30], [4.0, None])     # 늦게 온 더 이른 값, None은 건너뜀
+    history.close(5)
+
+    assert history.written == 4
+    assert len(rows(db_path, "ticks")) == 4
+    assert rows(db_path, "bars_1m") == [("KRW=X", base, 4.0, 4.0, 1.0, 3.0, base + 5, base + 20),
+                                        ("KRW=X", base + 60, 2.0, 2.0, 2.0, 2.0, base + 70, base + 70)]
+    assert rows(db_path, "bars_1h") == [("KRW=X", base, 4.0, 4.0, 1.0, 2.0, base + 5, base + 70)]
+
+
+def test_retention_prunes_old_rows(db_path):
+    now = int(time.time())
+    history = QuoteHistory(db_path, retention={"ticks": 1})
+    history.add("KRW=X", [now - 3 * DAY, now - 40 * DAY, now], [1.0, 2.0, 3.0])
+    history.close(5)
+
+    assert [r[1] for r in rows(db_path, "ticks")] == [now]                     # 1일
+    assert len(rows(db_path, "bars_1m")) == 2                                   # 30일
+    assert len(rows(db_path, "bars_1h")) == 3                                   # 730일
+    assert len(rows(db_path, "bars_1d")) == len({(t - t % DAY) for t in (now - 3 * DAY, now - 40 * DAY, now)})
+
+
+def test_retention_from_env(monkeypatch, db_path):
+    monkeypatch.setenv("QUOTE_HISTORY_RETENTION", "ticks=14, bars_1d=none, bogus=3, bars_1m=abc")
+    assert retention_from_env() == {"ticks": 14.0, "bars_1d": None}
+
+    history = QuoteHistory(db_path, retention={"ticks": 2})
+    assert history.retention == dict(RETENTION_DAYS, ticks=2, bars_1d=None)
+
+
+def test_query_picks_level_by_range(db_path):
+    now = int(time.time())
+    history = QuoteHistory(db_path)
+    minutes = list(range(now - 2 * DAY, now, 60))
+    history.add("KRW=X", minutes, [float(i) for i in range(len(minutes))])
+    history.close(5)
+
+    # 최근 1시간: 원본 60개 그대로
+    timestamps, closes = history.query("KRW=X", now - 3600, now)
+    assert len(timestamps) == 60 and list(closes) == sorted(closes)
+
+    # 2일: 원본/1분봉은 너무 많음 -> 1시간봉, max_points로 솎음
+    timestamps, closes = history.query("KRW=X", now - 2 * DAY, now, max_points=20)
+    assert len(timestamps) == 20
+    assert all(ts % 3600 == 0 for ts in timestamps)
+    assert closes[-1] == len(minutes) - 1                # 마지막 점은 항상 포함
+
+    assert [list(a) for a in history.query("ETH-USD", now - DAY, now)] == [[], []]
+
+
+def test_history_series_for_chart_ranges(db_path):
+    now = int(time.time())
+    history = QuoteHistory(db_path)
+    hours = list(range(now - 7 * DAY, now, 3600))
+    history.add("BTC-USD", hours, [100.0] * len(hours))
+    history.add("KRW=X", hours, [2.0] * len(hours))
+    history.close(5)
+
+    timestamps, closes = history_series(history, "BTC-USD", 7 * DAY, max_points=50)
+    assert len(timestamps) == 50 and set(closes) == {100.0}
+
+    # 파생 티커는 다리 기록으로 계산
+    timestamps, closes = history_series(history, "BTC/KRW", 7 * DAY, max_points=50)
+    assert len(timestamps) > 0 and set(closes) == {200.0}
+
+    assert [list(a) for a in history_series(history, "EUR/GBP", DAY)] == [[], []]
+    assert [list(a) for a in history_series(None, "BTC-USD", DAY)] == [[], []]
+
+
+def test_unwritable_path_disables_history(tmp_path, capsys):
+    history = QuoteHistory(str(tmp_path / "missing" / "quote_history.db"))
+    history.add("KRW=X", [1], [1.0])
+    history.close(5)
+
+    assert history.disabled
+    assert "Quote History Disabled" in capsys.readouterr().out
+    history.add("KRW=X", [2], [2.0])                     # 꺼진 뒤에는 조용히 무시
+    assert history._queue.empty()
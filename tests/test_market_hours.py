@@ -0,0 +1,107 @@
+"""조회 스케줄러 테스트 (market_hours.PollScheduler)"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from market_hours import ASSET_CALENDARS, PollScheduler, asset_class
+
+
+WEDNESDAY = datetime(2024, 1, 3, 10, 0, tzinfo=timezone.utc)   # 외환 개장, 한산한 시간
+SATURDAY = datetime(2024, 1, 6, 12, 0, tzinfo=timezone.utc)    # 외환 휴장
+TICKERS = ["KRW=X", "JPYKRW=X", "BTC-USD"]
+
+
+def later(now, seconds):
+    return now + timedelta(seconds=seconds)
+
+
+def test_asset_class():
+    assert asset_class("KRW=X") == "fx"
+    assert asset_class("BTC-USD") == "crypto"
+    assert asset_class("^KS11") == "fx"
+
+
+def test_calendar_intervals():
+    fx = ASSET_CALENDARS["fx"]
+    assert fx.is_open(WEDNESDAY) and not fx.is_open(SATURDAY)
+    assert fx.poll_interval(WEDNESDAY) == 60
+    assert fx.poll_interval(WEDNESDAY.replace(hour=13)) == 20   # 런던/뉴욕 겹치는 시간
+    assert fx.poll_interval(SATURDAY) == 3600                   # 닫혀 있으면 최대 1시간
+    assert ASSET_CALENDARS["crypto"].is_open(SATURDAY)
+
+
+def test_due_groups_after_success_waits_for_interval():
+    scheduler = PollScheduler()
+    assert scheduler.due_groups(TICKERS, now=WEDNESDAY) == {"fx": ["KRW=X", "JPYKRW=X"], "crypto": ["BTC-USD"]}
+
+    scheduler.record_success("fx", now=WEDNESDAY)
+    scheduler.record_success("crypto", now=WEDNESDAY)
+    assert scheduler.due_groups(TICKERS, now=later(WEDNESDAY, 30)) == {}
+    assert scheduler.seconds_until_due(TICKERS, now=later(WEDNESDAY, 30)) == 30
+    assert set(scheduler.due_groups(TICKERS, now=later(WEDNESDAY, 60))) == {"fx", "crypto"}
+
+
+def test_due_groups_piggybacks_groups_due_soon():
+    scheduler = PollScheduler()
+    scheduler.record_success("fx", now=WEDNESDAY)
+    scheduler.record_success("crypto", now=later(WEDNESDAY, 3))
+
+    # 외환이 조회될 때 3초 뒤 예정인 암호화폐도 같은 요청에 태움
+    assert set(scheduler.due_groups(TICKERS, now=later(WEDNESDAY, 60))) == {"fx", "crypto"}
+
+
+def test_force_pulls_only_the_new_tickers_group():
+    scheduler = PollScheduler()
+    scheduler.record_success("fx", now=WEDNESDAY)
+    scheduler.record_success("crypto", now=WEDNESDAY)
+
+    groups = scheduler.due_groups(TICKERS + ["ETH-USD"], now=later(WEDNESDAY, 10), force=["ETH-USD"])
+    assert groups == {"crypto": ["BTC-USD", "ETH-USD"]}
+
+
+def test_backoff_is_not_bypassed_by_force_or_piggyback():
+    scheduler = PollScheduler()
+    scheduler.random.seed(0)
+    scheduler.record_success("crypto", now=WEDNESDAY)
+    scheduler.record_failure("fx", now=WEDNESDAY)
+    assert scheduler.backing_off("fx")
+
+    due = scheduler._next_due["fx"]
+    assert 2.5 <= (due - WEDNESDAY).total_seconds() <= 5
+    soon = due - timedelta(seconds=1)
+    assert scheduler.due_groups(TICKERS, now=soon, force=["KRW=X"]) == {}
+    assert "fx" in scheduler.due_groups(TICKERS, now=due)
+
+    scheduler.record_success("fx", now=due)
+    assert not scheduler.backing_off("fx")
+
+
+@pytest.mark.parametrize("failures, low, high", [(1, 2.5, 5), (2, 5, 10), (3, 10, 20), (20, 450, 900)])
+def test_backoff_range(failures, low, high):
+    scheduler = PollScheduler()
+    for _ in range(50):
+        assert low <= scheduler.backoff(failures) <= high
+
+
+def test_expedite_skips_closed_markets_and_backoff():
+    scheduler = PollScheduler()
+    for name in ("fx", "crypto"):
+        scheduler.record_success(name, now=SATURDAY)
+    scheduler.expedite(TICKERS, now=later(SATURDAY, 1))
+    # 주말: 암호화폐만 당겨짐
+    assert scheduler.due_groups(TICKERS, now=later(SATURDAY, 1)) == {"crypto": ["BTC-USD"]}
+
+    scheduler = PollScheduler()
+    scheduler.record_failure("fx", now=WEDNESDAY)
+    scheduler.record_success("crypto", now=WEDNESDAY)
+    scheduler.expedite(TICKERS, now=later(WEDNESDAY, 1))
+    assert scheduler.due_groups(TICKERS, now=later(WEDNESDAY, 1)) == {"crypto": ["BTC-USD"]}
+
+
+def test_fixed_interval_ignores_calendar():
+    scheduler = PollScheduler(fixed_interval=0)
+    scheduler.record_success("fx", now=SATURDAY)
+    assert "fx" in scheduler.due_groups(TICKERS, now=SATURDAY)
+    scheduler.expedite(TICKERS, now=SATURDAY)   # 닫힌 장도 당김
+    assert scheduler.seconds_until_due(TICKERS, now=SATURDAY) == 0
@@ -0,0 +1,90 @@
+"""제공자 / 헤지 조회 테스트 (quote_providers.HedgedFetcher, FakeQuoteProvider)"""
+
+import asyncio
+
+import pytest
+
+from quote_providers import FakeQuoteProvider, HedgedFetcher, QuoteError, QuoteProvider
+
+
+PRICES = {"KRW=X": 1380.0, "BTC-USD": 67000.0}
+
+
+def fetch(fetcher, symbols=("KRW=X", "BTC-USD")):
+    return asyncio.run(fetcher.fetch(None, list(symbols)))
+
+
+def test_provider_interface_is_abstract():
+    with pytest.raises(TypeError):
+        QuoteProvider("incomplete")
+
+
+def test_primary_answers_without_hedge():
+    primary, backup = FakeQuoteProvider("a", PRICES), FakeQuoteProvider("b", PRICES)
+    fetcher = HedgedFetcher([primary, backup])
+
+    quotes, series, provider = fetch(fetcher)
+    assert provider is primary
+    assert set(quotes) == set(PRICES) and series == {}
+    assert (primary.calls, backup.calls, fetcher.hedges, fetcher.failovers) == (1, 0, 0, 0)
+
+
+def test_slow_primary_is_hedged():
+    slow = FakeQuoteProvider("slow", PRICES, latency=2.0)
+    fast = FakeQuoteProvider("fast", PRICES, latency=0.0)
+    fetcher = HedgedFetcher([slow, fast])
+    fetcher.HEDGE_DEFAULT = 0.05
+
+    _, _, provider = fetch(fetcher)
+    assert provider is fast
+    assert fetcher.hedges == 1
+    assert fetcher.ordered()[0] is fast        # 마지막으로 이긴 제공자가 주 제공자
+    assert len(fetcher.latency["slow"].samples) == 1   # 취소된 요청도 표본에 들어감
+
+
+def test_hedge_delay_follows_p95():
+    provider = FakeQuoteProvider("a", PRICES)
+    fetcher = HedgedFetcher([provider])
+    assert fetcher.hedge_delay(provider) == HedgedFetcher.HEDGE_DEFAULT
+
+    for i in range(20):
+        fetcher.latency["a"].record(0.1 + i * 0.01)
+    assert fetcher.hedge_delay(provider) == pytest.approx(0.29)
+    fetcher.latency["a"].samples.clear()
+    for _ in range(20):
+        fetcher.latency["a"].record(0.001)
+    assert fetcher.hedge_delay(provider) == HedgedFetcher.HEDGE_MIN
+
+
+def test_error_fails_over_immediately():
+    broken = FakeQuoteProvider("broken", PRICES, error=QuoteError("http", status=503))
+    backup = FakeQuoteProvider("backup", PRICES, latency=0.0)
+    fetcher = HedgedFetcher([broken, backup])
+
+    _, _, provider = fetch(fetcher)
+    assert provider is backup
+    assert (fetcher.failovers, fetcher.hedges) == (1, 0)
+    assert fetcher.latency["broken"].failures == 1
+
+    fetch(fetcher)                              # 다음 조회는 backup부터
+    assert broken.calls == 1
+
+
+def test_all_providers_failing_raises_primary_error():
+    first = FakeQuoteProvider("a", PRICES, error=QuoteError("http", status=429))
+    second = FakeQuoteProvider("b", PRICES, error=QuoteError("timeout"))
+    with pytest.raises(QuoteError) as info:
+        fetch(HedgedFetcher([first, second]))
+    assert (info.value.kind, info.value.status) == ("http", 429)
+
+
+def test_missing_ticker_is_left_out():
+    fetcher = HedgedFetcher([FakeQuoteProvider("a", PRICES, prev_close={"KRW=X": 1370.0})])
+    quotes, _, _ = fetch(fetcher, ["KRW=X", "EURKRW=X"])
+    assert list(quotes) == ["KRW=X"]
+    assert quotes["KRW=X"].change == pytest.approx(10.0)
+
+
+def test_requires_a_provider():
+    with pytest.raises(ValueError):
+        HedgedFetcher([])
@@ -0,0 +1,57 @@
+"""분봉 링 버퍼 테스트 (ring_buffer.BarRingBuffer)"""
+
+from ring_buffer import BarRingBuffer
+
+
+def test_extend_appends_only_new_bars():
+    buffer = BarRingBuffer(capacity=10)
+    assert buffer.extend([60, 120, 180], [1.0, 2.0, 3.0]) == 3
+
+    # 야후는 하루치 전체를 다시 보냄: 마지막 봉 이후만 덧붙음
+    assert buffer.extend([60, 120, 180, 240], [1.0, 2.0, 3.0, 4.0]) == 1
+    timestamps, closes = buffer.snapshot()
+    assert list(timestamps) == [60, 120, 180, 240]
+    assert list(closes) == [1.0, 2.0, 3.0, 4.0]
+
+
+def test_extend_updates_last_bar_in_progress():
+    buffer = BarRingBuffer(capacity=10)
+    buffer.extend([60, 120], [1.0, 2.0])
+
+    assert buffer.extend([60, 120], [1.0, 2.0]) == 0     # 그대로면 바뀐 봉 없음
+    assert buffer.extend([120], [2.5]) == 1               # 진행 중인 봉의 종가만 바뀜
+    assert list(buffer.snapshot()[1]) == [1.0, 2.5]
+    assert len(buffer) == 2
+
+
+def test_extend_skips_missing_closes():
+    buffer = BarRingBuffer(capacity=10)
+    assert buffer.extend([60, 120, 180], [1.0, None, 3.0]) == 2
+    assert list(buffer.snapshot()[0]) == [60, 180]
+    assert buffer.extend([180, 240], [3.0, None]) == 0
+    assert buffer.last_timestamp == 180
+
+
+def test_wraps_and_keeps_newest():
+    buffer = BarRingBuffer(capacity=3)
+    buffer.extend([60, 120, 180, 240, 300], [1.0, 2.0, 3.0, 4.0, 5.0])
+
+    timestamps, closes = buffer.snapshot()
+    assert list(timestamps) == [180, 240, 300]
+    assert list(closes) == [3.0, 4.0, 5.0]
+    assert buffer.extend([300, 360], [5.5, 6.0]) == 2
+    assert list(buffer.snapshot()[1]) == [4.0, 5.5, 6.0]
+
+
+def test_float_timestamps_are_coerced():
+    buffer = BarRingBuffer(capacity=4)
+    buffer.append(60.0, 1.0)
+    assert buffer.extend([60.0, 120.0], [1.0, 2.0]) == 1
+    assert list(buffer.snapshot()[0]) == [60, 120]
+    assert buffer.last_timestamp == 120
+
+
+def test_empty_buffer():
+    buffer = BarRingBuffer()
+    assert buffer.last_timestamp is None
+    assert [list(a) for a in buffer.snapshot()] == [[], []]
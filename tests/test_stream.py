@@ -0,0 +1,88 @@
+"""스트리밍 시세 테스트 (quote_stream.SSEParser, QuoteStream의 순번 누락 감지)"""
+
+import json
+
+from quote_stream import QuoteStream, SSEParser, stream_quotes
+
+
+def feed_all(parser, text):
+    events = []
+    for line in text.splitlines(keepends=True):
+        event = parser.feed(line)
+        if event:
+            events.append(event)
+    return events
+
+
+def event(symbol, price, prev_close=100.0, time=1700000000):
+    return json.dumps({"quotes": [{"symbol": symbol, "price": price, "previousClose": prev_close, "time": time}]})
+
+
+def test_parser_groups_lines_into_events():
+    text = (": ping\n"
+            "id: 1\n"
+            "data: {\"a\": 1}\n"
+            "\n"
+            "data: first\r\n"
+            "data: second\r\n"
+            "\r\n"
+            "\n"
+            "id:7\n"
+            "event: quote\n"
+            "data:x\n"
+            "\n")
+    events = feed_all(SSEParser(), text)
+    # id가 없는 이벤트는 직전 id를 그대로 씀, 빈 줄만 연달아 오면 이벤트 없음
+    assert events == [("1", '{"a": 1}'), ("1", "first\nsecond"), ("7", "x")]
+
+
+def test_parser_comment_only_stream_has_no_events():
+    assert feed_all(SSEParser(), ": ping\n\n: ping\n\n") == []
+
+
+def test_stream_quotes():
+    quotes = stream_quotes(json.dumps({"quotes": [
+        {"symbol": "KRW=X", "price": 1381.0, "previousClose": 1378.0, "time": 1700000000},
+        {"symbol": "BTC-USD", "price": None, "previousClose": 1.0},
+        {"price": 1.0, "previousClose": 1.0},
+    ]}))
+    assert [(q.ticker, q.price, q.change, q.timestamp) for q in quotes] == [("KRW=X", 1381.0, 3.0, 1700000000)]
+
+
+def make_stream():
+    gaps = []
+    stream = QuoteStream("http://127.0.0.1:9/stream", lambda: ["KRW=X"], lambda quotes: None,
+                         on_gap=lambda: gaps.append(True))
+    return stream, gaps
+
+
+def test_gap_detection():
+    stream, gaps = make_stream()
+    stream._handle("1", event("KRW=X", 1.0))
+    stream._handle("2", event("KRW=X", 2.0))
+    assert gaps == []
+
+    stream._handle("4", event("KRW=X", 4.0))    # 3을 놓침
+    assert (len(gaps), stream.gaps, stream.last_seq) == (1, 1, 4)
+
+    stream._handle("1", event("KRW=X", 5.0))    # 서버가 순번을 처음부터 다시 셈
+    assert stream.gaps == 2
+    stream._handle(None, event("KRW=X", 6.0))   # 순번 없는 이벤트는 비교하지 않음
+    stream._handle("2", event("KRW=X", 7.0))
+    assert stream.gaps == 2
+
+
+def test_pending_keeps_latest_per_ticker_and_skips_bad_events():
+    stream, _ = make_stream()
+    stream._handle("1", event("KRW=X", 1.0))
+    stream._handle("2", "not json")
+    stream._handle("3", event("KRW=X", 3.0))
+    stream._handle("4", event("BTC-USD", 4.0))
+
+    assert (stream.events, stream.received, stream.gaps) == (3, 3, 0)
+    assert {t: q.price for t, q in stream._pending.items()} == {"KRW=X": 3.0, "BTC-USD": 4.0}
+
+
+def test_reconnect_backoff_is_bounded():
+    stream, _ = make_stream()
+    assert all(0 < stream.backoff(n) <= 60 for n in range(1, 30))
@@ -0,0 +1,112 @@
+"""
+===================================================================================
+UI Render (변경분만 화면에 반영)
+===================================================================================
+목적: 시세가 갱신될 때 실제로 바뀐 라벨만 다시 그리게 합니다.
+
+setText()와 setStyleSheet()는 값이 같아도 그대로 실행됩니다.
+특히 setStyleSheet()는 호출할 때마다 스타일시트를 다시 해석하고 위젯을 다시 polish하므로
+방향(상승/하락)이 그대로인데도 매 조회마다 부르면 셀 개수만큼 CPU를 씁니다.
+
+    - set_text()  : 표시 중인 글자와 같으면 건너뜀
+    - set_state() : 색상 등은 창 전체에 한 번만 적용한 스타일시트의
+                    [trend="up"] 같은 동적 속성 선택자로 고르고,
+                    속성 값이 바뀔 때만 다시 polish
+    - RepaintCounter : 조회 한 번에 라벨이 몇 번 다시 그려졌는지 셈
+                       (환경 변수 RENDER_STATS=1 이면 콘솔에 출력)
+===================================================================================
+"""
+
+import os
+from collections import deque
+
+from PyQt5.QtCore import QObject, QEvent
+
+
+def set_text(label, text):
+    """
+    글자가 바뀌었을 때만 setText()를 호출합니다.
+
+    Returns:
+        bool: 바뀌었으면 True
+    """
+    if label.text() == text:
+        return False
+    label.setText(text)
+    return True
+
+
+def set_state(widget, name, value):
+    """
+    동적 속성 값을 바꾸고, 바뀌었을 때만 스타일을 다시 적용합니다.
+
+    스타일시트 예: QLabel#change[trend="up"] { color: #FF5555; }
+
+    Args:
+        widget (QWidget): 대상 위젯
+        name (str): 속성 이름 (예: "trend")
+        value (str): 속성 값 (예: "up", "down", "flat", "error")
+
+    Returns:
+        bool: 바뀌었으면 True
+    """
+    if widget.property(name) == value:
+        return False
+    widget.setProperty(name, value)
+
+    # 속성 선택자는 polish 때 평가되므로 다시 polish해야 색이 바뀜
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+    widget.update()
+    return True
+
+
+def trend_of(change):
+    """변동폭 부호를 스타일시트의 trend 값으로 바꿉니다."""
+    if change > 0:
+        return "up"
+    if change < 0:
+        return "down"
+    return "flat"
+
+
+class RepaintCounter(QObject):
+    """
+    이벤트 필터로 감시 위젯들의 Paint 이벤트 횟수를 셉니다.
+
+    tick()을 조회가 끝날 때마다 호출하면 직전 tick() 이후의 다시 그리기 횟수가
+    history에 쌓입니다. (다시 그리기는 시세 반영 뒤 이벤트 루프에서 일어나므로,
+    각 기록은 '이전 조회가 일으킨' 다시 그리기 횟수입니다.)
+
+    Args:
+        name (str): 출력에 쓸 이름
+        widgets (iterable): 감시할 위젯 목록
+        history (int): 보관할 tick 기록 개수
+    """
+
+    def __init__(self, name, widgets=(), history=100, parent=None):
+        super().__init__(parent)
+        self.name = name
+        self.total = 0
+        self.pending = 0
+        self.history = deque(maxlen=history)
+        self.verbose = os.environ.get("RENDER_STATS") == "1"
+        for widget in widgets:
+            self.watch(widget)
+
+    def watch(self, widget):
+        widget.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint:
+            self.total += 1
+            self.pending += 1
+        return False
+
+    def tick(self):
+        count, self.pending = self.pending, 0
+        self.history.append(count)
+        if self.verbose:
+            print(f"[render] {self.name}: {count} repaints (total {self.total})")
+        return count